@@ -5,16 +5,28 @@
 
 
 import functools
-import itertools
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+import aoc.ksum
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
+
+product = lambda items: functools.reduce(lambda a, b: a * b, items, 1)
+
+
+def find (entries, r, total=2020):
+    """Returns the first `r` `entries` that sum to `total` (in the order
+    they appear in `entries`) or `None`.
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    values = aoc.ksum.first(entries, r, total)
+    return values and tuple( sorted(values, key=entries.index) )
+
+
+def parse (filename):
+    """Parses and returns the expense report entries in `filename`."""
+    return aoc.integers(filename)
 
 
 # Part 1
@@ -22,18 +34,24 @@ def lines (filename, func=None):
 # Q: What is the product of the two entries that sum to 2020?
 # A: Sum of (527, 1493) is 2020 and product is 786811.
 
+def part1 (entries):
+    """Returns the product of the two `entries` that sum to 2020."""
+    return product( find(entries, 2) )
+
+
 # Part 2
 #
 # Q: What is the product of the three entries that sum to 2020?
 # A: Sum of (1111, 289, 620) is 2020 and product is 199068980.
 
+def part2 (entries):
+    """Returns the product of the three `entries` that sum to 2020."""
+    return product( find(entries, 3) )
+
 
-filename = 'aoc-2020-d01.txt'
-entries  = list( lines(filename, int) )
-product  = lambda items: functools.reduce(lambda a, b: a * b, items, 1)
+if __name__ == '__main__':
+    filename = 'aoc-2020-d01.txt'
+    entries  = parse(filename)
 
-for r in 2, 3:
-    for values in itertools.combinations(entries, r):
-        if sum(values) == 2020:
-            print(f'Sum of {values} is 2020 and product is {product(values)}.')
-            break
+    for r, part in (2, part1), (3, part2):
+        print(f'Sum of {find(entries, r)} is 2020 and product is {part(entries)}.')
@@ -4,46 +4,135 @@
 # Author: Ben Bornstein
 
 
-import re
+import array
+import collections
+import itertools
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+Passwords = collections.namedtuple('Passwords', 'lo hi chars offsets data')
+
+
+def failures_array (passwords, rule):
+    """Returns a mask of the `passwords` (see `parse()`) that are invalid
+    according to their policy `rule` (1 or 2), as a `bytearray` with one
+    element per password (1 if invalid).  Each password is checked in
+    place in the joined password data, i.e. without slicing it out.
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    lo, hi, chars, offsets, data = passwords
+    rows = zip(lo, hi, chars, offsets, itertools.islice(offsets, 1, None))
+
+    if rule == 1:
+        mask = bytearray( not (m <= data.count(c, s, e) <= n) for m, n, c, s, e in rows )
+    else:
+        mask = bytearray( ((s + m <= e and data[s + m - 1] == c) ==
+                           (s + n <= e and data[s + n - 1] == c)) for m, n, c, s, e in rows )
 
+    return mask
 
-def parse (line):
-    """Parses a password line of the form:
+
+def failures_numpy (passwords, rule):
+    """Returns a mask of the `passwords` (see `parse()`) that are invalid
+    according to their policy `rule` (1 or 2), as a `numpy` boolean array
+    with one element per password (true if invalid).  All passwords are
+    checked at once.
+    """
+    lo      = numpy.frombuffer(passwords.lo     , dtype=numpy.int64)
+    hi      = numpy.frombuffer(passwords.hi     , dtype=numpy.int64)
+    chars   = numpy.frombuffer(passwords.chars  , dtype=numpy.uint8)
+    offsets = numpy.frombuffer(passwords.offsets, dtype=numpy.int64)
+    data    = numpy.frombuffer(passwords.data   , dtype=numpy.uint8)
+    starts  = offsets[:-1]
+    lengths = numpy.diff(offsets)
+
+    if rule == 1:
+        rows   = numpy.repeat(numpy.arange( len(lo) ), lengths)
+        counts = numpy.bincount(rows[data == chars[rows]], minlength=len(lo))
+        return (counts < lo) | (counts > hi)
+    else:
+        first  = (lo <= lengths) & (data[starts + numpy.minimum(lo, lengths) - 1] == chars)
+        second = (hi <= lengths) & (data[starts + numpy.minimum(hi, lengths) - 1] == chars)
+        return first == second
+
+
+def parse (filename):
+    """Parses password lines of the form:
 
            1-3 a: abcde
 
-    and returns its constituent parts, e.g.: (1, 3, 'a', 'abcde').
+    in `filename` in a single pass and returns them as `Passwords`
+    columns: arrays of policy numbers (`lo` and `hi`), the policy letter
+    of each password (`chars`), and all passwords joined into `data`,
+    where password `i` is `data[ offsets[i] : offsets[i + 1] ]`.
+    """
+    with aoc.mapped(filename) as data:
+        words = data[:].split()
+
+    if len(words) % 3 != 0:
+        raise ValueError(f'{filename}: Expected lines of the form "1-3 a: abcde".')
+
+    bounds  = b' '.join( words[0::3] ).replace(b'-', b' ').split()
+    bounds  = array.array('q', map(int, bounds))
+    offsets = itertools.accumulate(map(len, words[2::3]), initial=0)
+
+    return Passwords(lo      = bounds[0::2],
+                     hi      = bounds[1::2],
+                     chars   = b''.join( words[1::3] )[0::2],
+                     offsets = array.array('q', offsets),
+                     data    = b''.join( words[2::3] ))
+
+
+def validate (passwords, rule, mask=False):
+    """Returns `(count, failing)`, the number of `passwords` valid according
+    to their policy `rule` (1 or 2) and, if `mask` is true, the mask of
+    invalid (failing) passwords or `None`.  Passwords are checked with
+    NumPy, if installed (see `failures_numpy()`), or otherwise with
+    `failures_array()`.
     """
-    m = re.match(r'(\d+)-(\d+) ([a-z]): ([a-z]+)', line)
-    return int( m[1] ), int( m[2] ), m[3], m[4]
+    if numpy is not None:
+        failing = failures_numpy(passwords, rule)
+        invalid = int( numpy.count_nonzero(failing) )
+    else:
+        failing = failures_array(passwords, rule)
+        invalid = failing.count(1)
+
+    return len(passwords.lo) - invalid, (failing if mask else None)
 
 
 # Part 1
 # Q: How many passwords are valid according to their policies?
 # A: Policy 1 valid passwords: 439.
 
+def part1 (passwords):
+    """Returns the number of `passwords` valid according to their policies,
+    i.e. letter `c` appears between `lo` and `hi` times.
+    """
+    return validate(passwords, 1)[0]
+
+
 # Part 2
 # Q: How many passwords are valid according to their policies?
 # A: Policy 2 valid passwords: 584.
 
-filename = 'aoc-2020-d02.txt'
-policy1  = 0
-policy2  = 0
+def part2 (passwords):
+    """Returns the number of `passwords` valid according to their policies,
+    i.e. letter `c` appears at exactly one of positions `lo` or `hi`.
+    """
+    return validate(passwords, 2)[0]
+
 
-for m, n, c, p in lines(filename, parse):
-    if p.count(c) in range(m, n + 1):
-        policy1 += 1
-    if (p[m - 1] == c or p[n - 1] == c) and p[m - 1] != p[n - 1]:
-        policy2 += 1
+if __name__ == '__main__':
+    filename  = 'aoc-2020-d02.txt'
+    passwords = parse(filename)
 
-print(f'Policy 1 valid passwords: {policy1}.')
-print(f'Policy 2 valid passwords: {policy2}.')
+    print(f'Policy 1 valid passwords: {part1(passwords)}.')
+    print(f'Policy 2 valid passwords: {part2(passwords)}.')
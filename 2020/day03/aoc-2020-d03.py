@@ -6,46 +6,122 @@
 
 import collections
 import functools
+import itertools
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
-Point   = collections.namedtuple( 'Point', [ 'x' , 'y'] )
-Slope   = collections.namedtuple( 'Slope', ['dx', 'dy'] )
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+Bits    = str.maketrans('.#', '01')
+Chunk   = 1 << 16
+Hill    = collections.namedtuple( 'Hill' , ['width', 'rows'] )
+Slope   = collections.namedtuple( 'Slope', ['dx'   , 'dy'  ] )
 product = lambda items: functools.reduce(lambda a, b: a * b, items, 1)
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
+def bitmask (line):
+    """Returns the hill row `line` (e.g. `..#.#`) as an integer bitmask,
+    where bit `x` is set if there is a tree at column `x`.
+    """
+    return int( line.rstrip().translate(Bits)[::-1], 2 )
+
+
+def hits (rows, width, slopes, top=0):
+    """Returns a list of the number of trees encountered on each of the
+    given `slopes` (starting at the top-left corner of the hill) within
+    `rows` (bitmasks, see `bitmask()`) of a hill `width` columns wide,
+    where `rows[0]` is row `top` of the hill.  Slopes are followed with
+    NumPy, if installed (see `hits_numpy()`), or otherwise one
+    shift-and-mask per step.
+    """
+    if numpy is not None:
+        return hits_numpy(rows, width, slopes, top)
+
+    counts = [ ]
+    end    = top + len(rows)
+
+    for dx, dy in slopes:
+        first = -(-top // dy) * dy
+        count = sum( rows[y - top] >> (y // dy * dx % width) & 1
+                     for y in range(first, end, dy) )
+        counts.append(count)
+
+    return counts
+
+
+def hits_numpy (rows, width, slopes, top=0):
+    """Returns a list of the number of trees encountered on each of the
+    given `slopes` within `rows` (see `hits()`).  The rows are unpacked
+    into a boolean matrix (`hill[y, x]` is true for a tree), so that each
+    slope is a single (fancy-indexed) gather of the positions it visits.
+    """
+    size   = (width + 7) // 8
+    packed = b''.join( row.to_bytes(size, 'little') for row in rows )
+    bits   = numpy.frombuffer(packed, dtype=numpy.uint8).reshape(len(rows), size)
+    hill   = numpy.unpackbits(bits, axis=1, bitorder='little')[:, :width].astype(bool)
+    counts = [ ]
+
+    for dx, dy in slopes:
+        ys = numpy.arange(-(-top // dy) * dy, top + len(rows), dy)
+        counts.append( int( hill[ys - top, (ys // dy * dx) % width].sum() ) )
+
+    return counts
+
+
+def parse (filename):
+    """Parses and returns the `Hill` in `filename`, indexed by row as
+    bitmasks (see `bitmask()`).
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    width, rows = scan(filename)
+    return Hill(width, list(rows))
 
 
-def move (pos, slope):
-    """Returns a new position by moving from `pos` by `slope` amount."""
-    return Point(pos.x + slope.dx, pos.y + slope.dy)
+def scan (filename):
+    """Returns `(width, rows)`, the width (number of columns) of the hill
+    in `filename` (its first row) and a Python iterator over its rows as
+    bitmasks (see `bitmask()`), read one line at a time.
+    """
+    lines = aoc.lines(filename)
+    first = next(lines, None)
 
+    if first is None:
+        return 0, iter(())
 
-def tree (hill, pos):
-    """Indicates whether or not hill has a tree at (x, y) `pos`ition."""
-    cols = len(hill[0])
-    return hill[pos.y][pos.x % cols] == '#'
+    return len( first.rstrip() ), map(bitmask, itertools.chain([ first ], lines))
 
 
-def trees (hill, slope, start=None):
-    """Returns the number of trees encountered down `hill` according to the
-    given `slope` trajectory.  If not specified, `start` defaults to
-    `Point(0, 0)`.
+def stream (filename, slopes, size=Chunk):
+    """Returns a list of the number of trees encountered on each of the
+    given `slopes` down the (possibly very tall) hill in `filename`.  The
+    hill is read (and indexed) `size` rows at a time, so that only those
+    rows are in memory at once.
     """
-    pos   = Point(0, 0) if start is None else start
-    count = 0
+    width, rows = scan(filename)
+    counts      = [ 0 ] * len(slopes)
+
+    for top in itertools.count(0, size):
+        chunk = list( itertools.islice(rows, size) )
+
+        if len(chunk) == 0:
+            break
+
+        counts = [ a + b for a, b in zip(counts, hits(chunk, width, slopes, top)) ]
+
+    return counts
 
-    while pos.y < len(hill):
-        count += 1 if tree(hill, pos) else 0
-        pos    = move(pos, slope)
 
-    return count
+def trees (hill, slopes):
+    """Returns a list of the number of trees encountered down `hill` on
+    each of the given `slopes` trajectories.
+    """
+    return hits(hill.rows, hill.width, slopes)
 
 
 # Part 1
@@ -54,11 +130,11 @@ def trees (hill, slope, start=None):
 # of right 3 and down 1, how many trees would you encounter?
 # A: Part 1: Trees encountered: 220.
 
-filename = 'aoc-2020-d03.txt'
-hill     = list( lines(filename, lambda s: s.strip()) )
-
-ntrees = trees(hill, Slope(3, 1))
-print(f'Part 1: Trees encountered: {ntrees}.')
+def part1 (hill):
+    """Returns the number of trees encountered down `hill` on a slope of
+    right 3, down 1.
+    """
+    return trees(hill, [ Slope(3, 1) ])[0]
 
 
 # Part 2
@@ -67,6 +143,17 @@ print(f'Part 1: Trees encountered: {ntrees}.')
 # encountered on each of the listed slopes?
 # A: Part 2: Product of trees encountered: 2138320800.
 
-slopes = Slope(1, 1), Slope(3, 1), Slope(5, 1), Slope(7, 1), Slope(1, 2)
-ntrees = [ trees(hill, s) for s in slopes ]
-print(f'Part 2: Product of trees encountered: {product(ntrees)}.')
+def part2 (hill):
+    """Returns the product of the trees encountered down `hill` on each of
+    the listed slopes.
+    """
+    slopes = Slope(1, 1), Slope(3, 1), Slope(5, 1), Slope(7, 1), Slope(1, 2)
+    return product( trees(hill, slopes) )
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d03.txt'
+    hill     = parse(filename)
+
+    print(f'Part 1: Trees encountered: {part1(hill)}.')
+    print(f'Part 2: Product of trees encountered: {part2(hill)}.')
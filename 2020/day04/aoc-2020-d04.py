@@ -4,83 +4,122 @@
 # Author: Ben Bornstein
 
 
+import collections
+import concurrent.futures
+import functools
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+import aoc.readers
+import aoc.workers
+
+
+Color   = re.compile(r'#[0-9a-f]{6}')
+Colors  = { 'amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth' }
+Height  = re.compile(r'(\d+)(cm|in)')
+Heights = { 'cm': range(150, 193 + 1), 'in': range(59, 76 + 1) }
+Number  = re.compile(r'\d{9}')
+Shard   = 1 << 22
+Year    = re.compile(r'\d{4}')
+
+Rules   = {
+    'byr': lambda v: Year.fullmatch(v) is not None and 1920 <= int(v) <= 2002,
+    'ecl': lambda v: v in Colors,
+    'eyr': lambda v: Year.fullmatch(v) is not None and 2020 <= int(v) <= 2030,
+    'hcl': lambda v: Color.fullmatch(v) is not None,
+    'hgt': lambda v: (m := Height.fullmatch(v)) is not None and int(m[1]) in Heights[m[2]],
+    'iyr': lambda v: Year.fullmatch(v) is not None and 2010 <= int(v) <= 2020,
+    'pid': lambda v: Number.fullmatch(v) is not None,
+}
+
+Tally = collections.namedtuple('Tally', 'passports present valid missing invalid')
+
+
+def count (filename, start=0, stop=None):
+    """Returns the `Tally` of the passports in `filename` (or only those
+    between byte offsets `start` and `stop`, which must be on record
+    boundaries; see `shards()`).  Passport records are separated by blank
+    lines and streamed from a memory-map of `filename`, e.g.:
+
+        ecl:gry pid:860033327 eyr:2020 hcl:#fffffd
+        byr:1937 iyr:2017 cid:147 hgt:183cm
+
+    Each required field (see `Rules`) is checked by its rule, and counted
+    in the `missing` or `invalid` histogram (`collections.Counter`) if
+    it fails.  Passports are `present` if no required fields are missing
+    and `valid` if, in addition, none are invalid.
+    """
+    missing   = collections.Counter()
+    invalid   = collections.Counter()
+    passports = 0
+    present   = 0
+    valid     = 0
+
+    with aoc.mapped(filename) as data:
+        for begin, end in aoc.readers.blocks(data, start, stop):
+            record = data[begin:end].decode()
+            fields = dict( field.split(':', 1) for field in record.split() )
+            absent = [ name for name in Rules if name not in fields ]
+            failed = [ name for name, rule in Rules.items()
+                       if name in fields and not rule( fields[name] ) ]
+
+            for name in absent:
+                missing[name] += 1
+            for name in failed:
+                invalid[name] += 1
+
+            passports += 1
+            present   += len(absent) == 0
+            valid     += len(absent) == 0 and len(failed) == 0
+
+    return Tally(passports, present, valid, missing, invalid)
+
+
+def merge (a, b):
+    """Returns the sum of `Tally`s `a` and `b`."""
+    return Tally( *(x + y for x, y in zip(a, b)) )
+
+
+def parse (filename, jobs=None):
+    """Parses and returns the `Tally` of the passports in `filename` (see
+    `count()`).  Files larger than `Shard` bytes are split into (at most)
+    `jobs` shards (default: one per CPU) and counted in parallel by a
+    process pool (see `aoc.workers`).
+    """
+    jobs = jobs or os.cpu_count()
+    size = os.path.getsize(filename)
+
+    if jobs == 1 or size <= Shard:
+        return count(filename)
+
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        futures = [ executor.submit(aoc.workers.task(count), filename, start, stop)
+                    for start, stop in shards(filename, min(jobs, -(-size // Shard))) ]
+        return functools.reduce(merge, (future.result() for future in futures))
+
+
+def shards (filename, n):
+    """Returns a list of (at most) `n` `(start, stop)` byte ranges, of about
+    equal size, that cover `filename` and that each begin and end on a
+    passport record boundary, i.e. just after a blank line.
+    """
+    with aoc.mapped(filename) as data:
+        size   = len(data)
+        bounds = [ 0 ]
+
+        for k in range(1, n):
+            pos = data.find(b'\n\n', max(bounds[-1], k * size // n))
+
+            if pos == -1:
+                break
 
-
-class Passport (object):
-    __slots__ = 'byr', 'ecl', 'eyr', 'hcl', 'hgt', 'iyr', 'pid', 'cid'
-    Required  = 'byr', 'ecl', 'eyr', 'hcl', 'hgt', 'iyr', 'pid'
-
-    def __init__ (self):
-        """Creates a new empty Passport."""
-        self.clear()
-
-
-    def clear (self):
-        """Clears all Passport fields."""
-        for attr in Passport.__slots__:
-            setattr(self, attr, None)
-
-
-    def present (self):
-        """Indicates whether all required fields are present."""
-        return all(getattr(self, attr) != None for attr in Passport.Required)
-
-
-    def update (self, line):
-        """Updates Passport fields based on line, e.g.:
-
-               ecl:gry pid:860033327 eyr:2020 hcl:#fffffd
-        """
-        for field in line.split():
-            name, value = field.split(':')
-            setattr(self, name, value)
-
-
-    def valid (self):
-        """Indicates whether all required fields are valid."""
-        if not self.present():
-            return False
-
-        if re.match('\d{4}$', self.byr) is None:
-            return False
-
-        if int(self.byr) not in range(1920, 2002 + 1):
-            return False
-
-        if re.match('\d{4}$', self.iyr) is None:
-            return False
-
-        if int(self.iyr) not in range(2010, 2020 + 1):
-            return False
-
-        if re.match('\d{4}$', self.eyr) is None:
-            return False
-
-        if int(self.eyr) not in range(2020, 2030 + 1):
-            return False
-
-        match = re.match('(\d+)(cm|in)$', self.hgt)
-
-        if match is None:
-            return False
-
-        if match[2] == 'cm' and int(match[1]) not in range(150, 193 + 1):
-            return False
-
-        if match[2] == 'in' and int(match[1]) not in range(59, 76 + 1):
-            return False
-
-        if re.match('#[0-9a-f]{6}$', self.hcl) is None:
-            return False
-
-        if self.ecl not in ('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth'):
-            return False
-
-        if re.match('\d{9}$', self.pid) is None:
-            return False
-
-        return True
+            bounds.append(pos + 2)
+
+    bounds.append(size)
+    return [ (start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop ]
 
 
 # Part 1
@@ -88,28 +127,24 @@ class Passport (object):
 # Q: In your batch file, how many passports are valid?
 # A: Part 1: Valid passports: 237.
 
+def part1 (tally):
+    """Returns the number of passports with all required fields present."""
+    return tally.present
+
+
 # Part 2
 #
 # Q: In your batch file, how many passports are valid?
 # A: Part 2: Valid passports: 172.
 
-filename = 'aoc-2020-d04.txt'
-passport = Passport()
-present  = 0
-valid    = 0
-
-with open(filename) as stream:
-    for line in stream.readlines():
-        line = line.strip()
-        if len(line) == 0:
-            present += int( passport.present() )
-            valid   += int( passport.valid()   )
-            passport.clear()
-        else:
-            passport.update(line)
-
-present += int( passport.present() )
-valid   += int( passport.valid()   )
-
-print(f'Part 1: Valid passports: {present}.')
-print(f'Part 2: Valid passports: {valid}.')
+def part2 (tally):
+    """Returns the number of passports with all required fields valid."""
+    return tally.valid
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d04.txt'
+    tally    = parse(filename)
+
+    print(f'Part 1: Valid passports: {part1(tally)}.')
+    print(f'Part 2: Valid passports: {part2(tally)}.')
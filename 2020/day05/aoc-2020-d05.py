@@ -4,20 +4,83 @@
 # Author: Ben Bornstein
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
+import array
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+Binary = bytes.maketrans(b'FBLR', b'0101')
+
+
+def decode (data):
+    """Returns the seat IDs of the boarding passes (one per line) in `data`
+    (bytes) as an `array.array` of unsigned 16-bit integers.
+
+    A boarding pass is its seat ID in binary, e.g. `FBFBBFFRLR` is row
+    `0101100` (44) and column `101` (5), i.e. seat ID `0101100101` (357),
+    so all of `data` is translated to binary digits at once.  The digits
+    are then converted with NumPy, if installed (see `decode_numpy()`),
+    or otherwise each line with `int()`.
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    digits = data.translate(Binary)
+    seats  = decode_numpy(digits) if numpy is not None else None
+
+    if seats is None:
+        seats = array.array('H', map(int, digits.split(), itertools.repeat(2)))
+
+    return seats
+
+
+def decode_numpy (digits):
+    """Returns the seat IDs of the boarding passes in `digits` (see
+    `decode()`) as an `array.array` of unsigned 16-bit integers, or `None`
+    if its lines are not all ten digits long.  The digits are viewed as
+    rows of eleven bytes (with newlines) and each row's ten digits are
+    multiplied by powers of two and summed (a dot product) in one step.
+    """
+    if not digits.endswith(b'\n'):
+        digits += b'\n'
+
+    if len(digits) % 11 != 0:
+        return None
 
+    rows = numpy.frombuffer(digits, dtype=numpy.uint8).reshape(-1, 11)
 
-def seat (bpass):
-    """Returns the seat ID for the given boarding pass (`bpass`)."""
-    row = sum(2**(6-n) for n, s in enumerate(bpass[0:7]) if s == 'B')
-    col = sum(2**(2-n) for n, s in enumerate(bpass[7:] ) if s == 'R')
-    return (row * 8) + col
+    if not numpy.all(rows[:, 10] == ord('\n')):
+        return None
+
+    powers = 1 << numpy.arange(9, -1, -1, dtype=numpy.uint16)
+    seats  = array.array('H')
+    seats.frombytes( ((rows[:, :10] - ord('0')) @ powers).astype(numpy.uint16).tobytes() )
+    return seats
+
+
+def missing (seats):
+    """Returns the ID of the first seat missing from `seats` (IDs, which may
+    repeat) whose neighbors (IDs +1 and -1) are both present, or `None`.
+    """
+    occupied = bytearray( max(seats, default=0) + 2 )
+
+    for seat in set(seats):
+        occupied[seat] = 1
+
+    pos = occupied.find(b'\1\0\1')
+    return pos + 1 if pos >= 0 else None
+
+
+def parse (filename):
+    """Parses and returns the seat IDs in `filename` (see `decode()`)."""
+    with aoc.mapped(filename) as data:
+        return decode(data[:])
 
 
 # Part 1
@@ -25,10 +88,9 @@ def seat (bpass):
 # Q: What is the highest seat ID on a boarding pass?
 # A: Part 1: Highest Seat ID: 885.
 
-filename = 'aoc-2020-d05.txt'
-seats    = sorted( lines(filename, seat) )
-
-print(f'Part 1: Highest Seat ID: {seats[-1]}.')
+def part1 (seats):
+    """Returns the highest of the `seats` IDs."""
+    return max(seats)
 
 
 # Part 2
@@ -39,7 +101,14 @@ print(f'Part 1: Highest Seat ID: {seats[-1]}.')
 # Q: What is the ID of your seat?
 # A: Part 2: My Seat ID: 623.
 
-for n in range(1, len(seats)):
-    if seats[n - 1] == (seats[n] - 2):
-        print(f'Part 2: My Seat ID: {seats[n] - 1}.')
-        break
+def part2 (seats):
+    """Returns the ID of the one seat missing from `seats`."""
+    return missing(seats)
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d05.txt'
+    seats    = parse(filename)
+
+    print(f'Part 1: Highest Seat ID: {part1(seats)}.')
+    print(f'Part 2: My Seat ID: {part2(seats)}.')
@@ -4,6 +4,13 @@
 # Author: Paul A. Levine (329F) <Paul.A.Levine@jpl.nasa.gov>
 
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+
 # Part 1
 #
 # Q: For each group, count the number of questions to which anyone
@@ -20,10 +27,7 @@ filename  = 'aoc-2020-d06.txt'
 anyone    = 0
 everyone  = 0
 
-with open(filename) as stream:
-    text = stream.read()
-
-for group in text.split('\n\n'):
+for group in aoc.records(filename):
     people    = [ set(person) for person in group.split() ]
     anyone   += len( set.union(*people) )
     everyone += len( set.intersection(*people) )
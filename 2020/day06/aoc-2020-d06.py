@@ -4,6 +4,97 @@
 # Author: Ben Bornstein
 
 import collections
+import functools
+import operator
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+
+All  = (1 << 26) - 1
+Bits = { chr(ord('a') + n): 1 << n for n in range(26) }
+
+
+def bitmask (answers):
+    """Returns the questions answered "yes" by one person (e.g. `abc`) as a
+    26-bit integer, with bit `n` set for the `n`-th letter.
+    """
+    return functools.reduce(operator.or_, map(Bits.__getitem__, answers), 0)
+
+
+def bitsets (filename):
+    """Returns `(anyone, everyone)`, the answers to both parts, streaming
+    over the groups in `filename` (see `parse()`).
+    """
+    anyone   = 0
+    everyone = 0
+
+    for union, intersection in fold(filename):
+        anyone   += union.bit_count()
+        everyone += intersection.bit_count()
+
+    return anyone, everyone
+
+
+def counters (filename):
+    """Returns `(anyone, everyone)`, the answers to both parts, counting
+    each group's answers with a `collections.Counter`.
+    """
+    anyone   = 0
+    everyone = 0
+
+    for record in aoc.records(filename):
+        people     = record.split()
+        questions  = collections.Counter( q for person in people for q in set(person) )
+        anyone    += len(questions)
+        everyone  += len([ v for v in questions.values() if v == len(people) ])
+
+    return anyone, everyone
+
+
+def fold (filename):
+    """Python iterator over the groups in `filename`, yielding the union
+    and intersection (`|` and `&`) of the questions answered "yes" by each
+    person in the group as 26-bit integers (see `bitmask()`).
+    """
+    for record in aoc.records(filename):
+        union        = 0
+        intersection = All
+
+        for person in map(bitmask, record.split()):
+            union        |= person
+            intersection &= person
+
+        yield union, intersection
+
+
+def parse (filename):
+    """Parses and returns the groups in `filename`, each a pair of the
+    questions answered "yes" by anyone and everyone in the group (see
+    `fold()`).
+    """
+    return list( fold(filename) )
+
+
+def sets (filename):
+    """Returns `(anyone, everyone)`, the answers to both parts, with the
+    union and intersection of each person's `set` of answers (as in
+    `aoc-2020-d06-levine.py`).
+    """
+    anyone   = 0
+    everyone = 0
+
+    for group in aoc.records(filename):
+        people    = [ set(person) for person in group.split() ]
+        anyone   += len( set.union(*people) )
+        everyone += len( set.intersection(*people) )
+
+    return anyone, everyone
+
+
+Engines = { 'bitset': bitsets, 'counter': counters, 'set': sets }
 
 
 # Part 1
@@ -12,32 +103,29 @@ import collections
 # answered "yes".  What is the sum of those counts?
 # A: Part 1: Sum of counts: 6351.
 
+def part1 (groups):
+    """Returns the sum of questions to which anyone in each group answered
+    "yes".
+    """
+    return sum( union.bit_count() for union, _ in groups )
+
+
 # Part 2
 #
 # Q: For each group, count the number of questions to which everyone
 # answered "yes".  What is the sum of those counts?
 # A: Part 2: Sum of counts: 3143.
 
-filename  = 'aoc-2020-d06.txt'
-people    = 0
-questions = collections.Counter()
-anyone    = 0
-everyone  = 0
-
-with open(filename) as stream:
-    for line in stream.readlines():
-        line = line.strip()
-        if len(line) == 0:
-            anyone   += len(questions)
-            everyone += len([ v for v in questions.values() if v == people ])
-            people    = 0
-            questions.clear()
-        else:
-            people += 1
-            questions.update(line)
-
-anyone   += len(questions)
-everyone += len([ v for v in questions.values() if v == people ])
-
-print(f'Part 1: Sum of counts: {anyone}.')
-print(f'Part 2: Sum of counts: {everyone}.')
+def part2 (groups):
+    """Returns the sum of questions to which everyone in each group
+    answered "yes".
+    """
+    return sum( intersection.bit_count() for _, intersection in groups )
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d06.txt'
+    groups   = parse(filename)
+
+    print(f'Part 1: Sum of counts: {part1(groups)}.')
+    print(f'Part 2: Sum of counts: {part2(groups)}.')
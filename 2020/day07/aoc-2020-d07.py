@@ -4,73 +4,132 @@
 # Author: Ben Bornstein
 
 
+import collections
+import os
 import re
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
-class Bag (object):
-    """Bags have a `color` and quantity (`qty`).
 
-    A Bag's allowed quantity (`qty`) is really a property of containing
-    (parent) `bag`, but it's most convenient to store on a Bag itself.
-    Bag (objects) are lightweight (pun intended) and only a Bag's
-    `color` is used for the purposes of identity (equality and hashing),
-    i.e.:
+Content = re.compile(r'(\d+) (\w+ \w+) bags?')
 
-        Bag('1 shiny gold bag') == Bag('2 shiny gold bags'), and so on.
+
+class BagGraph (object):
+    """A graph of bag rules, i.e. which bags (colors) contain which others
+    and how many.  Colors are interned as integer ids (see `intern()`),
+    which index the forward (`inside`) and reverse (`outside`) adjacency
+    lists, so that any number of queries (see `ancestors()`,
+    `contents()` and `totals()`) may be answered without rebuilding the
+    graph.
     """
-    __slots__ = 'color', 'qty'
-    Pattern   = re.compile('(\d+)?\s?(\w+ \w+)\s?(bag|bags)?\.?')
+    __slots__ = 'colors', 'ids', 'inside', 'outside'
+
+    def __init__ (self, rules=()):
+        """Creates a new BagGraph from `(color, contents)` `rules` (see
+        `add()`).
+        """
+        self.colors  = [ ]
+        self.ids     = { }
+        self.inside  = [ ]
+        self.outside = [ ]
+
+        for color, contents in rules:
+            self.add(color, contents)
 
-    def __init__ (self, desc):
-        """Creates a new Bag based on a string description with many variations
-        on a theme (see Bag.Pattern regular expression), e.g.:
 
-             - shiny gold
-             - vibrant plum bag
-             - 2 dark orange bags
+    def add (self, color, contents):
+        """Adds the rule that `color` bags contain `contents`, a list of
+        `(qty, color)` tuples.
         """
-        match      = Bag.Pattern.search(desc)
-        self.color = match[2]
-        self.qty   = int( match[1] ) if match[1] else 0
+        node = self.intern(color)
 
-    def __eq__ (self, other):
-        return self.color == other.color
+        for qty, other in contents:
+            child = self.intern(other)
+            self.inside[node].append( (child, qty) )
+            self.outside[child].append(node)
 
-    def __hash__ (self):
-        return hash(self.color)
 
-    def __str__ (self):
-        return self.color
+    def ancestors (self, color):
+        """Returns the set of colors that can (eventually) contain a `color`
+        bag, found by a single breadth-first search of the reverse edges.
+        """
+        start = self.ids.get(color)
+        found = [ ]
 
+        if start is not None:
+            seen  = bytearray( len(self.colors) )
+            queue = collections.deque([ start ])
 
-def bags (graph, bag):
-    """Return the number of bags that `bag` can contain."""
-    if len( graph[bag] ) == 0:
-        return 0
-    else:
-        return sum(b.qty + (b.qty * bags(graph, b)) for b in graph[bag])
+            while queue:
+                for parent in self.outside[ queue.popleft() ]:
+                    if not seen[parent]:
+                        seen[parent] = 1
+                        found.append(parent)
+                        queue.append(parent)
 
+        return { self.colors[n] for n in found }
 
-def contains (graph, bag, bags):
-    """Indicates whether `bag` is (eventually) in `bags` (or its bags)."""
-    return bag in bags or any(contains(graph, bag, graph[b]) for b in bags)
 
+    def contents (self, color):
+        """Returns the number of bags required inside a `color` bag."""
+        return self.totals([ color ]).get(color, 0)
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
-    """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
 
+    def intern (self, color):
+        """Returns the integer id of `color`, adding it if necessary."""
+        node = self.ids.get(color)
+
+        if node is None:
+            node             = len(self.colors)
+            self.ids[color]  = node
+            self.colors.append(color)
+            self.inside.append([ ])
+            self.outside.append([ ])
+
+        return node
+
+
+    def totals (self, colors=None):
+        """Returns a dictionary of the number of bags required inside each
+        of `colors` (default: all colors).
+
+        Totals are found by a single (iterative) post-order depth-first
+        traversal, memoized so that the contents of each bag are counted
+        once, however many bags (and queried `colors`) contain it.  Raises
+        `ValueError` if the rules are cyclic, i.e. a bag must contain
+        itself.
+        """
+        colors = self.colors if colors is None else [ c for c in colors if c in self.ids ]
+        total  = [ None ] * len(self.colors)
+        state  = bytearray( len(self.colors) )
+
+        for root in map(self.ids.__getitem__, colors):
+            stack = [ (root, False) ]
+
+            while stack:
+                node, done = stack.pop()
 
-def parse (line):
-    """Parses line and returns a tuple of `(bag, contents)` where `bag` is a
-    `Bag` and `contents` is a list of `Bag`s that `bag` contains.
+                if done:
+                    total[node] = sum(qty * (1 + total[child]) for child, qty in self.inside[node])
+                    state[node] = 2
+                elif state[node] == 1:
+                    raise ValueError(f'Bag rules are cyclic ({self.colors[node]}).')
+                elif state[node] == 0:
+                    state[node] = 1
+                    stack.append( (node, True) )
+                    stack.extend( (child, False) for child, _ in self.inside[node]
+                                  if state[child] != 2 )
+
+        return { color: total[ self.ids[color] ] for color in colors }
+
+
+def parse (filename):
+    """Parses and returns the `BagGraph` of bag rules in `filename` (see
+    `rule()`).
     """
-    node, rest = line.strip().split(' contain ', 2)
-    return Bag(node), [ Bag(s) for s in rest.split(', ') ]
+    return BagGraph( aoc.lines(filename, rule) )
 
 
 # Part 1
@@ -78,14 +137,11 @@ def parse (line):
 # Q: How many bag colors can contain at least one shiny gold bag?
 # A: Part 1: Bag colors containing a shiny gold bag: 259.
 
-bag          = Bag('shiny gold')
-empty        = Bag('no other')
-filename     = 'aoc-2020-d07.txt'
-graph        = { bag: contents for bag, contents in lines(filename, parse) }
-graph[empty] = [ ]
-
-colors = set(b for b in graph if contains(graph, bag, graph[b]))
-print(f'Part 1: Bag colors containing a {bag} bag: {len(colors)}.')
+def part1 (graph, bag='shiny gold'):
+    """Returns the number of bag colors that can (eventually) contain a
+    shiny gold `bag`.
+    """
+    return len( graph.ancestors(bag) )
 
 
 # Part 2
@@ -93,4 +149,29 @@ print(f'Part 1: Bag colors containing a {bag} bag: {len(colors)}.')
 # Q: How many bags are required inside your single shiny gold bag?
 # A: Part 2: Bags required inside shiny gold bag: 45018.
 
-print(f'Part 2: Bags required inside {bag} bag: {bags(graph, bag)}.')
+def part2 (graph, bag='shiny gold'):
+    """Returns the number of bags required inside a shiny gold `bag`."""
+    return graph.contents(bag)
+
+
+def rule (line):
+    """Parses a bag rule `line` of the form:
+
+        light red bags contain 1 bright white bag, 2 muted yellow bags.
+
+    and returns a tuple of `(color, contents)`, where `contents` is a list
+    of `(qty, color)` tuples, e.g.: `('light red', [ (1, 'bright white'),
+    (2, 'muted yellow') ])`.  Bags that contain no other bags have no
+    `contents`.
+    """
+    color, rest = line.split(' bags contain ', 1)
+    return color, [ (int(qty), other) for qty, other in Content.findall(rest) ]
+
+
+if __name__ == '__main__':
+    bag      = 'shiny gold'
+    filename = 'aoc-2020-d07.txt'
+    graph    = parse(filename)
+
+    print(f'Part 1: Bag colors containing a {bag} bag: {part1(graph, bag)}.')
+    print(f'Part 2: Bags required inside {bag} bag: {part2(graph, bag)}.')
@@ -4,7 +4,13 @@
 # Author: Ben Bornstein
 
 
+import array
 import collections
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 ACC, JMP, NOP = 1, 2, 3
@@ -12,9 +18,112 @@ Opcodes       = { 'acc': ACC, 'jmp': JMP, 'nop': NOP }
 Instruction   = collections.namedtuple('Instruction', 'op arg')
 
 
-def flip (ins):
-    """Flips a `JMP` `ins`truction to a `NOP`, or vice-versa."""
-    return ins._replace(op=JMP if ins.op == NOP else NOP)
+class HandheldVM (object):
+    """A handheld game console VM that runs a program (of `Instruction`s),
+    pre-decoded into parallel `array('i')` opcode (`ops`) and argument
+    (`args`) buffers, until it terminates or loops (see `run()`).
+
+    For profiling, a VM may count the number of times each opcode is
+    executed (`counts`, indexed by opcode) and call `loop(pc, acc)` when
+    execution enters a loop, i.e. just before an instruction (at `pc`)
+    would execute a second time, or jumps before the start of the
+    program (`pc < 0`), which is treated as a loop.  A VM without either
+    runs a separate, uninstrumented loop, so they cost nothing unless
+    used.
+    """
+    __slots__ = 'args', 'counts', 'loop', 'ops'
+
+    def __init__ (self, program, counts=False, loop=None):
+        """Creates a new HandheldVM for `program`, a list of `Instruction`s.
+        If `counts` is true, opcode execution counts are kept in `counts`
+        and if given, `loop(pc, acc)` is called on entering a loop.
+        """
+        self.ops    = array.array('i', (ins.op  for ins in program))
+        self.args   = array.array('i', (ins.arg for ins in program))
+        self.counts = array.array('q', [ 0 ]) * (NOP + 1) if counts else None
+        self.loop   = loop
+
+
+    def fast (self):
+        """Runs the program without instrumentation (see `run()`)."""
+        ops  = self.ops
+        args = self.args
+        size = len(ops)
+        seen = bytearray(size)
+        acc  = 0
+        pc   = 0
+
+        while pc < size:
+            if pc < 0 or seen[pc]:
+                return False, acc
+
+            seen[pc] = 1
+            op       = ops[pc]
+
+            if op == JMP:
+                pc += args[pc]
+            else:
+                if op == ACC:
+                    acc += args[pc]
+                pc += 1
+
+        return True, acc
+
+
+    def instrumented (self):
+        """Runs the program, counting the opcodes executed (if `counts`)
+        and calling `loop()` (if given) when it loops (see `run()`).
+        """
+        ops    = self.ops
+        args   = self.args
+        counts = self.counts or array.array('q', [ 0 ]) * (NOP + 1)
+        size   = len(ops)
+        seen   = bytearray(size)
+        acc    = 0
+        pc     = 0
+
+        for n in range( len(counts) ):
+            counts[n] = 0
+
+        while pc < size:
+            if pc < 0 or seen[pc]:
+                if self.loop:
+                    self.loop(pc, acc)
+                return False, acc
+
+            seen[pc]    = 1
+            op          = ops[pc]
+            counts[op] += 1
+
+            if op == JMP:
+                pc += args[pc]
+            else:
+                if op == ACC:
+                    acc += args[pc]
+                pc += 1
+
+        return True, acc
+
+
+    def run (self, flip=None):
+        """Runs the program, with the `JMP` or `NOP` instruction at index
+        `flip` flipped (if given), and returns `(halted, acc)`: whether it
+        halted (`True`) or looped (`False`), and its accumulator at that
+        point.  As in `repair()`, a jump before the start of the program
+        is treated as a loop.
+        """
+        if flip is not None:
+            op             = self.ops[flip]
+            self.ops[flip] = JMP if op == NOP else NOP
+
+        try:
+            if self.counts is None and self.loop is None:
+                return self.fast()
+            else:
+                return self.instrumented()
+        finally:
+            if flip is not None:
+                self.ops[flip] = op
 
 
 def halts (program):
@@ -24,46 +133,75 @@ def halts (program):
 
         (halted=True | False, accumulator)
     """
-    acc    = 0
-    exe    = set()
-    pc     = 0
-    halted = True
-
-    while pc < len(program):
-        if pc in exe:
-            halted = False
-            break
+    return HandheldVM(program).run()
 
-        exe.add(pc)
-        ins = program[pc]
 
-        if ins.op == JMP:
-            pc += ins.arg
-        else:
-            if ins.op == ACC:
-                acc += ins.arg
-            pc += 1
+def instruction (line):
+    """Parses a program line, returning `(opcode, argument)`."""
+    op, arg = line.split()
+    return Instruction(Opcodes.get(op), int(arg))
 
-    return halted, acc
 
+def repair (program):
+    """Returns the index of the one `JMP` or `NOP` instruction in (looping)
+    `program` to flip (`JMP` to `NOP`, or vice-versa) so that it
+    terminates, or `None`, in O(n).
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
+    First, every instruction from which `program` terminates is found by
+    a breadth-first search backwards from its end, along reverse edges
+    (kept as linked lists in two arrays).  Then, the execution path is
+    walked once: flipping an instruction on it fixes `program` if the
+    flipped instruction lands on one that terminates (or past the end).
+    As with trying each flip in turn, the first (lowest) such index is
+    returned.  Jumps before the start of `program` are assumed to loop.
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    size   = len(program)
+    heads  = array.array('q', [ -1 ]) * size
+    links  = array.array('q', [ -1 ]) * size
+    ends   = bytearray(size)
+    queue  = collections.deque()
 
+    for n, ins in enumerate(program):
+        target = n + ins.arg if ins.op == JMP else n + 1
 
-def parse (line):
-    """Parses a program line, returning `(opcode, argument)`."""
-    op, arg = line.split()
-    return Instruction(Opcodes.get(op), int(arg))
+        if target >= size:
+            ends[n] = 1
+            queue.append(n)
+        elif target >= 0:
+            links[n]      = heads[target]
+            heads[target] = n
+
+    while queue:
+        n = heads[ queue.popleft() ]
+
+        while n != -1:
+            if not ends[n]:
+                ends[n] = 1
+                queue.append(n)
+            n = links[n]
+
+    found = None
+    seen  = bytearray(size)
+    pc    = 0
 
+    while 0 <= pc < size and not seen[pc]:
+        seen[pc] = 1
+        ins      = program[pc]
+        flipped  = pc + 1 if ins.op == JMP else pc + ins.arg
 
-filename = 'aoc-2020-d08.txt'
-program  = list( lines(filename, parse) )
+        if ins.op != ACC and (flipped >= size or (flipped >= 0 and ends[flipped])):
+            found = pc if found is None else min(found, pc)
+
+        pc += ins.arg if ins.op == JMP else 1
+
+    return found
+
+
+def parse (filename):
+    """Parses and returns the program (list of `Instruction`s) in
+    `filename`.
+    """
+    return list( aoc.lines(filename, instruction) )
 
 
 # Part 1
@@ -73,10 +211,12 @@ program  = list( lines(filename, parse) )
 # Q: Before any instruction is executed a second time, what is the accumulator?
 # A: Part 1: Loop detected: acc=1859.
 
-halted, acc = halts(program)
-
-if not halted:
-    print(f'Part 1: Loop detected: acc={acc}.')
+def part1 (program):
+    """Returns the accumulator just before `program` loops, or `None` if it
+    halts.
+    """
+    halted, acc = halts(program)
+    return None if halted else acc
 
 
 # Part 2
@@ -87,14 +227,22 @@ if not halted:
 # Q: What is the value of the accumulator after the program terminates?
 # A: Part 2: Program terminated: acc=1235.
 
-for n in range( len(program) ):
-    if program[n].op == ACC:
-        continue
+def part2 (program):
+    """Returns the accumulator after `program` terminates with exactly one
+    `JMP` or `NOP` flipped (see `repair()`), or `None` if none terminate.
+    """
+    n = repair(program)
 
-    program[n]  = flip( program[n] )
-    halted, acc = halts(program)
-    program[n]  = flip( program[n] )
+    if n is not None:
+        return HandheldVM(program).run(flip=n)[1]
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d08.txt'
+    program  = parse(filename)
+
+    if (acc := part1(program)) is not None:
+        print(f'Part 1: Loop detected: acc={acc}.')
 
-    if halted:
+    if (acc := part2(program)) is not None:
         print(f'Part 2: Program terminated: acc={acc}.')
-        break
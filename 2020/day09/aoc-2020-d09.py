@@ -4,26 +4,76 @@
 # Author: Ben Bornstein
 
 
+import collections
 import itertools
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
-def find_sum_range (numbers, n):
-    """Returns (i, j) such that sum(numbers[i:j]) == n."""
-    cumsum = list( itertools.accumulate(numbers) )
 
-    for j in range(1, len(cumsum)):
-        for i in range(0, j):
-            if cumsum[j] - cumsum[i] == n:
-                return i, j
+def contiguous (numbers, n):
+    """Returns the first contiguous range (list) of at least two of the
+    non-negative `numbers` that sums to `n`, or `None`.
 
+    The range is a sliding window, grown at its end and shrunk from its
+    start while its sum exceeds `n`, so each number is added and removed
+    at most once, i.e. O(len(numbers)).  Only the window is held in
+    memory, so `numbers` may be any iterable, e.g. `stream()`.
+    """
+    window = collections.deque()
+    total  = 0
+
+    for number in numbers:
+        window.append(number)
+        total += number
+
+        while total > n:
+            total -= window.popleft()
+
+        if total == n and len(window) > 1:
+            return list(window)
+
+
+def invalid (numbers, preamble=25):
+    """Python iterator over the numbers (after the `preamble`) in
+    `numbers` that are not the sum of two different numbers among the
+    `preamble` numbers before each.
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
+    The `preamble` numbers are kept in both a queue (oldest first) and a
+    multiset (`Counter`), so each number is checked and the window slid
+    in O(preamble).  Only the window is held in memory, so `numbers` may
+    be any iterable, e.g. `stream()`.
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    numbers = iter(numbers)
+    queue   = collections.deque( itertools.islice(numbers, preamble) )
+    counts  = collections.Counter(queue)
+
+    for n in numbers:
+        if not any(n - q != q and counts[n - q] for q in queue):
+            yield n
+
+        old = queue.popleft()
+        counts[old] -= 1
+
+        if counts[old] == 0:
+            del counts[old]
+
+        queue.append(n)
+        counts[n] += 1
+
+
+def parse (filename):
+    """Parses and returns the XMAS numbers in `filename`."""
+    return aoc.integers(filename)
+
+
+def stream (filename):
+    """Python iterator over the XMAS numbers in `filename`, read one line
+    at a time, for number logs too large to `parse()`.
+    """
+    return aoc.lines(filename, int)
 
 
 # Part 1
@@ -35,20 +85,11 @@ def lines (filename, func=None):
 # Q: What is the first number that does not have this property?
 # A: Part 1: First number not sum of previous 25: 31161678.
 
-
-filename = 'aoc-2020-d09.txt'
-numbers  = list( lines(filename, int) )
-preamble = 25
-queue    = numbers[:preamble]
-
-for n in numbers[preamble:]:
-    delta = [n - q for q in queue]
-    if not any([ (d in queue and (n - d) != d) for d in delta ]):
-        print(f'Part 1: First number not sum of previous {preamble}: {n}.')
-        break
-
-    queue.pop(0)
-    queue.append(n)
+def part1 (numbers, preamble=25):
+    """Returns the first number (after the `preamble`) in `numbers` that
+    is not the sum of two of the `preamble` numbers before it.
+    """
+    return next(invalid(numbers, preamble), None)
 
 
 # Part 2
@@ -59,6 +100,22 @@ for n in numbers[preamble:]:
 # Q: What is the encryption weakness in your XMAS-encrypted list of numbers?
 # A: Part 2: Encryption weakness: 5453868.
 
-i, j   = find_sum_range(numbers, n)
-subset = numbers[i:j]
-print(f'Part 2: Encryption weakness: {min(subset) + max(subset)}.')
+def part2 (numbers, preamble=25):
+    """Returns the encryption weakness in `numbers`, the sum of the
+    smallest and largest numbers in the contiguous range that sums to
+    the invalid number (see `part1()`), or `None` if there is no such
+    number or range.  Since `numbers` is read twice, it may not be a
+    (single use) iterator.
+    """
+    target = part1(numbers, preamble)
+    subset = contiguous(numbers, target) if target is not None else None
+    return min(subset) + max(subset) if subset is not None else None
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d09.txt'
+    numbers  = parse(filename)
+    preamble = 25
+
+    print(f'Part 1: First number not sum of previous {preamble}: {part1(numbers, preamble)}.')
+    print(f'Part 2: Encryption weakness: {part2(numbers, preamble)}.')
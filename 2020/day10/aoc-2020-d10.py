@@ -5,20 +5,65 @@
 
 
 import collections
-import functools
-import itertools
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
-product = lambda items: functools.reduce(lambda a, b: a * b, items, 1)
 
+def arrangements (adapters, gap=3, modulus=None):
+    """Returns the number of distinct arrangements of the ascending
+    `adapters` (joltages) that connect the first to the last, where each
+    adapter may connect to any other at most `gap` jolts lower.  If
+    `modulus` is given, the number is returned modulo `modulus`, which
+    keeps (very) long chains from summing ever larger integers.
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
+    The number of ways to reach each adapter is the sum of the ways to
+    reach the adapters (at most `gap` jolts lower) that connect to it.
+    Only those adapters and their running sum are kept, in a window
+    that slides forward, so that memory is O(gap) and `adapters` may be
+    any (sorted) iterable.
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    adapters = iter(adapters)
+    previous = next(adapters, None)
+
+    if previous is None:
+        return 0
+
+    ways   = 1
+    total  = ways
+    window = collections.deque([ (previous, ways) ])
+
+    for jolts in adapters:
+        if jolts <= previous:
+            raise ValueError(f'Adapters must be distinct and ascending ({previous}, {jolts}).')
+
+        while window and window[0][0] < jolts - gap:
+            total -= window.popleft()[1]
+
+        ways      = total if modulus is None else total % modulus
+        total    += ways
+        previous  = jolts
+        window.append( (jolts, ways) )
+
+    return ways
+
+
+def deltas (adapters):
+    """Returns the list of differences between successive `adapters`."""
+    return [ adapters[n] - adapters[n - 1] for n in range(1, len(adapters)) ]
+
+
+def parse (filename):
+    """Parses and returns the sorted list of adapters (joltages) in
+    `filename`, including the charging outlet (0) and your device (the
+    highest adapter plus 3).
+    """
+    adapters = sorted( aoc.integers(filename) )
+    adapters.insert(0, 0)
+    adapters.append( adapters[-1] + 3 )
+    return adapters
 
 
 # Part 1
@@ -28,15 +73,10 @@ def lines (filename, func=None):
 #
 # A: Part 1: Number of 1-jolt * 3-jolt differences: 1885.
 
-filename = 'aoc-2020-d10.txt'
-adapters = sorted( lines(filename, int) )
-adapters.insert(0, 0)
-adapters.append( adapters[-1] + 3 )
-
-deltas = [ adapters[n] - adapters[n - 1] for n in range(1, len(adapters)) ]
-counts = collections.Counter(deltas)
-result = counts[1] * counts[3]
-print(f'Part 1: Number of 1-jolt * 3-jolt differences: {result}.')
+def part1 (adapters):
+    """Returns the number of 1-jolt times 3-jolt differences in `adapters`."""
+    counts = collections.Counter( deltas(adapters) )
+    return counts[1] * counts[3]
 
 
 # Part 2
@@ -46,13 +86,23 @@ print(f'Part 1: Number of 1-jolt * 3-jolt differences: {result}.')
 #
 # A: Part 2: Combinations: 2024782584832.
 
-factor  = { 1: 1, 2: 2, 3: 4, 4: 7 }
-runs    = [ len( list(g) ) for k, g in itertools.groupby(deltas) if k == 1 ]
-combos  = product([ factor[r] for r in runs ])
+def part2 (adapters):
+    """Returns the number of distinct arrangements of `adapters`."""
+    return arrangements(adapters)
 
-print(f'Part 2: Total combinations: {combos}.')
 
+if __name__ == '__main__':
+    filename = 'aoc-2020-d10.txt'
+    adapters = parse(filename)
 
+    print(f'Part 1: Number of 1-jolt * 3-jolt differences: {part1(adapters)}.')
+    print(f'Part 2: Total combinations: {part2(adapters)}.')
+
+
+# Part 2 was first solved with the hand-derived factors below, which
+# `arrangements()` has since replaced, as they hold only for runs of up
+# to four ones and deltas of one or three.
+#
 # Runs of ones (1) in the "jolts" deltas yield different multiplication
 # factors when computing the total number of combinations (product of
 # factors).  I counted factors by hand for for 1, 2, and 3 based on the
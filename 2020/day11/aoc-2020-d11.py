@@ -3,119 +3,113 @@
 # Advent of Code 2020, Day 11 (https://adventofcode.com/2020/day/11)
 # Author: Ben Bornstein
 
-import copy
+import array
 import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 EMPTY      = 0
 OCCUPIED   = 1
 FLOOR      = 2
-CharToInt  = { 'L': EMPTY, '#': OCCUPIED, '.': FLOOR }
+CharToInt  = bytes.maketrans(b'L#.', bytes([EMPTY, OCCUPIED, FLOOR]))
 Directions = ( (-1, -1), (0, -1), (1, -1),
                (-1,  0),          (1,  0),
                (-1,  1), (0,  1), (1,  1) )
 
 
-def adjacent (area, r, c, radius=None):
-    """Returns the adjacent seats within `radius` of the seat at row (`r`)
-    and column (`c`) in all directions (up, down, left, right, and
-    diagonals).  If `radius` is one (1), adjacent seats are the
-    surrounding 3x3 neighborhood.  If `radius` is `None` (default),
-    adjacent seats are the sight-lines in each direction (until the
-    first seat in that direction is encountered) around the seat at row
-    (`r`) and column (`c`).
+def adj3x3 (area):
+    """Returns the neighbors of each seat in the 3x3 neighborhood
+    surrounding it.  See `adjacent()`.
     """
-    nrows = len( area    )
-    ncols = len( area[0] )
-
-    for dr, dc in Directions:
-        nr   = r
-        nc   = c
-        r0   = 0
-        spot = FLOOR
-
-        while spot == FLOOR and (radius is None or r0 < radius):
-            r0 += 1
-            nr += dr
-            nc += dc
-
-            if nr not in range(nrows) or nc not in range(ncols):
-                break
-            else:
-                spot = area[nr][nc]
+    return adjacent(area, radius=1)
+
+
+def adjacent (area, radius=None):
+    """Returns the seats (`EMPTY` or `OCCUPIED` spots) in the seating
+    `area` and the adjacent seats (neighbors) of each, within `radius`
+    in all directions (up, down, left, right, and diagonals).  If
+    `radius` is one (1), neighbors are the surrounding 3x3 neighborhood.
+    If `radius` is `None` (default), neighbors are the first seats seen
+    along the sight-lines in each direction.
+
+    Seats are numbered in row-major order and returned as a tuple of
+    three flat integer arrays, `(spots, starts, links)`, where seat `s`
+    is the spot `spots[s]` (`r * ncols + c`) and its neighbors are seats
+    `links[starts[s]:starts[s + 1]]`.  Since seats see one another, `s`
+    is a neighbor of each of its neighbors.
+    """
+    nrows  = len( area    )
+    ncols  = len( area[0] )
+    ids    = array.array('l', [ -1 ]) * (nrows * ncols)
+    spots  = array.array('l')
+    starts = array.array('l', [ 0 ])
+    links  = array.array('l')
 
-        if spot != FLOOR:
-            yield spot
+    for r, c in itertools.product(range(nrows), range(ncols)):
+        if area[r][c] != FLOOR:
+            ids[r * ncols + c] = len(spots)
+            spots.append(r * ncols + c)
 
+    for spot in spots:
+        r, c = divmod(spot, ncols)
 
-def apply (area, next, neighborhood, threshold):
-    """Applies puzzle rules to the seating `area`, storing updates in the
-    `next` seating area.  The parameter `neighborhood` is a function
-    that takes a seating `area` and specific seat location (row, column)
-    as input (`neighborhood(area, row, col)`) and returns nearby seats
-    in that neighborhood.  The parameter `threshold` is the minimum
-    number of `OCCUPIED` neighborhood seats required to make a seat
-    `EMPTY`.
-    """
-    for seat, r, c in seats(area):
-        neighbors = neighborhood(area, r, c)
-        if seat == EMPTY:
-            if all(n == EMPTY for n in neighbors):
-                next[r][c] = OCCUPIED
-        else:
-            if len([ n for n in neighbors if n == OCCUPIED ]) >= threshold:
-                next[r][c] = EMPTY
-
-
-def count (area, state=OCCUPIED):
-    """Returns the count of spots in the seating `area` in the given state,
-    defaulting to `OCCUPIED`.
-    """
-    return sum(int(pos == state) for row in area for pos in row)
+        for dr, dc in Directions:
+            nr = r + dr
+            nc = c + dc
+            r0 = 1
 
+            while 0 <= nr < nrows and 0 <= nc < ncols:
+                if area[nr][nc] != FLOOR:
+                    links.append( ids[nr * ncols + nc] )
+                    break
+                if radius is not None and r0 >= radius:
+                    break
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
-    """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+                r0 += 1
+                nr += dr
+                nc += dc
 
+        starts.append( len(links) )
 
-def merge (dst, src):
-    """Merges the source (`src`) seating area into the destination (`dst`)
-    seating area and returns the number of changed seats.  A return
-    value of zero indicates `dst` and `src` are identical.
-    """
-    changed = 0
+    return spots, starts, links
 
-    for seat, r, c in seats(dst):
-        if dst[r][c] != src[r][c]:
-            changed   += 1
-            dst[r][c]  = src[r][c]
 
-    return changed
+def masks (filename):
+    """Returns `(part1, part2)`, the answers to both parts, simulating the
+    3x3 neighborhood rules with NumPy (see `stencil()`).
+    """
+    area = parse(filename)
+    return stencil(area, 4)[1], simulate(area, adjacent, 5)[1]
 
 
-def parse (line):
-    """Parse line into an array of numbers (`EMPTY`, `OCCUPIED`, or `FLOOR`)
-    for each spot in the seatring area.
+def neighbors (filename):
+    """Returns `(part1, part2)`, the answers to both parts, simulating both
+    rules from neighbor lists (see `simulate()`).
     """
-    return [ CharToInt[c] for c in line.strip() ]
+    area = parse(filename)
+    return simulate(area, adj3x3, 4)[1], simulate(area, adjacent, 5)[1]
 
 
-def seats (area):
-    """An iterator (generator) over seats (either `OCCUPIED` or `EMPTY`) in
-    the seating `area`.  Yields a tuple indicating the seat state and
-    its row and column location, i.e. `(seat, r, c)`.
+def parse (filename):
+    """Parses the seating area in `filename` into rows of spots (`EMPTY`,
+    `OCCUPIED`, or `FLOOR`).
     """
-    nrows = len( area    )
-    ncols = len( area[0] )
+    return aoc.grid(filename, CharToInt)
 
-    for r, c in itertools.product(range(nrows), range(ncols)):
-        if area[r][c] != FLOOR:
-            yield area[r][c], r, c
+
+Engines = { 'python': neighbors }
+
+if numpy is not None:
+    Engines['numpy'] = masks
 
 
 # Part 1
@@ -126,6 +120,13 @@ def seats (area):
 # Q: How many seats end up occupied?
 # A: Part 1: Iterations: 94, Occupied 2275.
 
+def part1 (area):
+    """Returns the number of seats occupied once the seating `area`
+    settles, using the 3x3 neighborhood (`adj3x3()`) rules (see
+    `settle()`).
+    """
+    return settle(area, 1)[1]
+
 
 # Part 2
 #
@@ -134,23 +135,120 @@ def seats (area):
 # up occupied?
 # A: Part 2: Iterations: 86, Occupied 2121.
 
-filename = 'aoc-2020-d11.txt'
-area     = list( lines(filename, parse) )
-adj3x3   = lambda area, r, c: adjacent(area, r, c, radius=1)
-part     = 0
+def part2 (area):
+    """Returns the number of seats occupied once the seating `area`
+    settles, using the sight-line (`adjacent()`) rules (see `settle()`).
+    """
+    return settle(area, 2)[1]
+
 
+def settle (area, part):
+    """Simulates the seating `area` until it settles, using the 3x3
+    neighborhood rules for `part` 1, with NumPy, if installed (see
+    `stencil()`), or otherwise with `simulate()`, and the sight-line
+    rules for `part` 2.  Returns `(iterations, occupied)`, as
+    `simulate()`.
+    """
+    if part == 1:
+        return stencil(area, 4) if numpy is not None else simulate(area, adj3x3, 4)
+    else:
+        return simulate(area, adjacent, 5)
+
+
+def simulate (area, neighborhood, threshold):
+    """Simulates the seating `area` by applying the puzzle rules repeatedly
+    until no seats change state and returns `(iterations, occupied)`, the
+    number of generations simulated (including the last, unchanged one)
+    and the number of seats occupied.  The parameter `neighborhood` is a
+    function that takes a seating `area` and returns the neighbors of
+    each seat (see `adjacent()`).  The parameter `threshold` is the
+    minimum number of `OCCUPIED` neighbors required to make a seat
+    `EMPTY`.  The seating `area` is not modified.
+
+    Each seat's state and count of `OCCUPIED` neighbors are kept in two
+    `bytearray`s.  A seat can only change if one of its neighbors
+    changed in the previous generation, so only those seats (the
+    `frontier`) are re-evaluated.  All changes are found before any are
+    made, and each change updates the counts of its neighbors.
+    """
+    spots, starts, links = neighborhood(area)
+
+    ncols    = len( area[0] )
+    seats    = bytearray( area[s // ncols][s % ncols] for s in spots )
+    counts   = bytearray( len(seats) )
+    frontier = range( len(seats) )
+    iters    = 0
 
-for neighborhood, threshold in (adj3x3, 4), (adjacent, 5):
-    curr  = copy.deepcopy(area)
-    next  = copy.deepcopy(area)
-    iters = 0
-    part += 1
+    for s in frontier:
+        if seats[s] == OCCUPIED:
+            for n in links[ starts[s] : starts[s + 1] ]:
+                counts[n] += 1
+
+    while True:
+        iters   += 1
+        changed  = [ s for s in frontier if (counts[s] == 0 if seats[s] == EMPTY
+                                             else counts[s] >= threshold) ]
+        frontier = set()
+
+        for s in changed:
+            neighbors = links[ starts[s] : starts[s + 1] ]
+
+            if seats[s] == EMPTY:
+                seats[s] = OCCUPIED
+                for n in neighbors:
+                    counts[n] += 1
+            else:
+                seats[s] = EMPTY
+                for n in neighbors:
+                    counts[n] -= 1
+
+            frontier.update(neighbors)
+
+        if not changed:
+            break
+
+    return iters, seats.count(OCCUPIED)
+
+
+def stencil (area, threshold):
+    """Simulates the seating `area` with the 3x3 neighborhood rules (see
+    `simulate()`) using NumPy and returns `(iterations, occupied)`.
+
+    Each generation, the `OCCUPIED` neighbors of every spot are counted
+    at once, by summing the eight slices of a zero-padded copy of the
+    occupied seats shifted one spot in each direction.  The rules are
+    then applied with boolean masks, until the occupied seats no longer
+    change.
+    """
+    nrows    = len( area    )
+    ncols    = len( area[0] )
+    spots    = numpy.frombuffer(b''.join(area), dtype=numpy.uint8).reshape(nrows, ncols)
+    seats    = spots != FLOOR
+    occupied = spots == OCCUPIED
+    padded   = numpy.zeros((nrows + 2, ncols + 2), dtype=numpy.uint8)
+    iters    = 0
 
     while True:
         iters += 1
-        apply(curr, next, neighborhood, threshold)
+        padded[1:-1, 1:-1] = occupied
+
+        counts    = padded[ :-2, :-2] + padded[ :-2, 1:-1] + padded[ :-2, 2:] + \
+                    padded[1:-1, :-2] +                      padded[1:-1, 2:] + \
+                    padded[2:  , :-2] + padded[2:  , 1:-1] + padded[2:  , 2:]
+        following = seats & numpy.where(occupied, counts < threshold, counts == 0)
 
-        if merge(curr, next) == 0:
+        if numpy.array_equal(following, occupied):
             break
 
-    print(f'Part {part}: Iterations: {iters}, Occupied {count(curr)}.')
+        occupied = following
+
+    return iters, int( numpy.count_nonzero(occupied) )
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d11.txt'
+    area     = parse(filename)
+
+    for part in 1, 2:
+        iters, occupied = settle(area, part)
+        print(f'Part {part}: Iterations: {iters}, Occupied {occupied}.')
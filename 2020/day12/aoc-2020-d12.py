@@ -5,36 +5,228 @@
 
 
 import collections
-import math
+import concurrent.futures
+import functools
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+import aoc.workers
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
+
+# A `Transform` is an exact integer affine transform of the ship's state,
+# its position `s` and a direction `w` (either its heading or waypoint):
+#
+#     s' = s + m w + p
+#     w' =     r w + q
+#
+# where `m` and `r` are 2x2 matrices, as `(a, b, c, d)` row-major
+# tuples, and `p` and `q` are `(x, y)` vectors.  Each instruction is one
+# transform (see `transform()`) and transforms compose (see
+# `compose()`) into a single transform for any number of instructions.
+
+Transform  = collections.namedtuple('Transform', 'm p r q')
+
+Chunk      = 1 << 16
+Directions = { 'N': (0, 1), 'S': (0, -1), 'E': (1, 0), 'W': (-1, 0) }
+Heading    = (1, 0)
+Identity   = Transform(m=(0, 0, 0, 0), p=(0, 0), r=(1, 0, 0, 1), q=(0, 0))
+Turns      = { 0: (1, 0, 0, 1), 90: (0, -1, 1, 0), 180: (-1, 0, 0, -1), 270: (0, 1, -1, 0) }
+Waypoint   = (10, 1)
+
+
+class Route (object):
+    """A route of navigation steps, kept as a segment tree of composed
+    `Transform`s, so that the ship's position after any number of steps
+    (see `position()`) may be found, and any step changed (see
+    `update()`), in O(log n) compositions.
+    """
+    __slots__ = 'start', 'tree', 'waypoint'
+
+    def __init__ (self, steps, waypoint=False):
+        """Creates a new Route of navigation `steps` that move the ship, or
+        its waypoint if `waypoint` is true (see `transform()`).
+        """
+        leaves        = [ transform(step, waypoint) for step in steps ]
+        self.start    = Waypoint if waypoint else Heading
+        self.tree     = [ Identity ] * len(leaves) + leaves
+        self.waypoint = waypoint
+
+        for n in range(len(leaves) - 1, 0, -1):
+            self.tree[n] = compose(self.tree[2 * n], self.tree[2 * n + 1])
+
+
+    def __len__ (self):
+        """Returns the number of steps in this Route."""
+        return len(self.tree) // 2
+
+
+    def position (self, k=None):
+        """Returns the ship's `(x, y)` position after the first `k` steps
+        (default: all) of this Route.
+        """
+        return apply(self.prefix(k), (0, 0), self.start)[0]
+
+
+    def prefix (self, k=None):
+        """Returns the `Transform` of the first `k` steps (default: all) of
+        this Route.  Since transforms do not commute, those to the left
+        and right of the nodes that cover the steps are composed
+        separately.
+        """
+        n     = len(self)
+        lo    = n
+        hi    = n + (n if k is None else k)
+        left  = Identity
+        right = Identity
+
+        while lo < hi:
+            if lo & 1:
+                left  = compose(left, self.tree[lo])
+                lo   += 1
+            if hi & 1:
+                hi   -= 1
+                right = compose(self.tree[hi], right)
+
+            lo >>= 1
+            hi >>= 1
+
+        return compose(left, right)
+
+
+    def update (self, k, step):
+        """Changes step `k` of this Route to `step`."""
+        n            = len(self) + k
+        self.tree[n] = transform(step, self.waypoint)
+
+        while n > 1:
+            n >>= 1
+            self.tree[n] = compose(self.tree[2 * n], self.tree[2 * n + 1])
+
+
+def apply (t, s, w):
+    """Applies `Transform` `t` to the ship's position `s` and direction
+    `w` and returns the new `(s, w)`.
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    (ma, mb, mc, md), (px, py), (ra, rb, rc, rd), (qx, qy) = t
+    sx, sy = s
+    wx, wy = w
+    return ( (sx + ma * wx + mb * wy + px, sy + mc * wx + md * wy + py),
+             (     ra * wx + rb * wy + qx,      rc * wx + rd * wy + qy) )
+
 
+def compose (t, u):
+    """Returns the `Transform` that applies `t` and then `u`."""
+    (ma, mb, mc, md), (px, py), (ra, rb, rc, rd), (qx, qy) = t
+    (na, nb, nc, nd), (ux, uy), (sa, sb, sc, sd), (vx, vy) = u
 
-def parse (line):
+    return Transform(m=(ma + na * ra + nb * rc, mb + na * rb + nb * rd,
+                        mc + nc * ra + nd * rc, md + nc * rb + nd * rd),
+                     p=(px + na * qx + nb * qy + ux, py + nc * qx + nd * qy + uy),
+                     r=(sa * ra + sb * rc, sa * rb + sb * rd,
+                        sc * ra + sd * rc, sc * rb + sd * rd),
+                     q=(sa * qx + sb * qy + vx, sc * qx + sd * qy + vy))
+
+
+def distance (steps, waypoint=False, jobs=None):
+    """Returns the Manhattan distance from the origin to the ship after
+    following the navigation `steps` (see `navigate()`).
+    """
+    sx, sy = apply(navigate(steps, waypoint, jobs), (0, 0), Waypoint if waypoint else Heading)[0]
+    return abs(sx) + abs(sy)
+
+
+def navigate (steps, waypoint=False, jobs=None):
+    """Returns the `Transform` of all navigation `steps` (see `route()`).
+    Since composition is associative, more than `Chunk` steps are split
+    into chunks and each is composed in parallel by a process pool of
+    `jobs` workers (default: one per CPU, see `aoc.workers`), and then
+    those in order.
+    """
+    jobs = jobs or os.cpu_count()
+
+    if jobs == 1 or len(steps) <= Chunk:
+        return route(steps, waypoint)
+
+    size   = max(Chunk, -(-len(steps) // jobs))
+    chunks = [ steps[n:n + size] for n in range(0, len(steps), size) ]
+
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        routes = executor.map(aoc.workers.task(route), chunks, [ waypoint ] * len(chunks))
+        return functools.reduce(compose, routes, Identity)
+
+
+def parse (filename):
+    """Parses and returns the navigation instructions in `filename` as a
+    list of `(action, value)` pairs (see `step()`).
+    """
+    return list( aoc.lines(filename, step) )
+
+
+def route (steps, waypoint=False):
+    """Returns the `Transform` of the navigation `steps`, composed in
+    order, i.e. `functools.reduce(compose, transforms, Identity)`.
+
+    Each step's transform is sparse, e.g. `F` only scales `m`, so rather
+    than `compose()` each in full, only the parts of the running
+    transform that each step changes are updated.
+    """
+    (ma, mb, mc, md), (px, py), (ra, rb, rc, rd), (qx, qy) = Identity
+
+    for action, value in steps:
+        if action == 'F':
+            ma += value * ra
+            mb += value * rb
+            mc += value * rc
+            md += value * rd
+            px += value * qx
+            py += value * qy
+        elif action in Directions:
+            dx, dy = Directions[action]
+
+            if waypoint:
+                qx += dx * value
+                qy += dy * value
+            else:
+                px += dx * value
+                py += dy * value
+        else:
+            sa, sb, sc, sd = transform( (action, value) ).r
+            ra, rb, rc, rd = sa * ra + sb * rc, sa * rb + sb * rd, \
+                             sc * ra + sd * rc, sc * rb + sd * rd
+            qx, qy         = sa * qx + sb * qy, sc * qx + sd * qy
+
+    return Transform(m=(ma, mb, mc, md), p=(px, py), r=(ra, rb, rc, rd), q=(qx, qy))
+
+
+def step (line):
     """Parses line into an `(action, value)` pair."""
     return line[0], int(line[1:])
 
 
-def rotate (x, y, deg, clockwise=False):
-    """Rotates (`x`, `y`) cartesian coordinates `deg`rees counterclockwise
-    (default) or clockwise.  Assumes `(x, y)` are integer coordinates and
-    maintains (returns) integer coordinates (i.e. rounds).
+@functools.lru_cache(maxsize=None)
+def transform (step, waypoint=False):
+    """Returns the `Transform` of the navigation `step`, an `(action,
+    value)` pair.  Actions `N`, `S`, `E` and `W` move the ship, or its
+    waypoint if `waypoint` is true, `F` moves the ship toward its heading
+    (or waypoint) and `L` and `R` turn it (by multiples of 90 degrees)
+    with an integer rotation matrix.
     """
-    t  = math.radians(360 - deg if clockwise else deg)
-    rx = round( x * math.cos(t) - y * math.sin(t) )
-    ry = round( x * math.sin(t) + y * math.cos(t) )
-    return rx, ry
+    action, value = step
 
+    if action in Directions:
+        dx, dy = Directions[action]
+        move   = (dx * value, dy * value)
+        return Identity._replace(q=move) if waypoint else Identity._replace(p=move)
 
-filename = 'aoc-2020-d12.txt'
-steps    = list( lines(filename, parse) )
+    if action == 'F':
+        return Identity._replace(m=(value, 0, 0, value))
+
+    if action in 'LR' and value % 90 == 0:
+        return Identity._replace(r=Turns[(value if action == 'L' else -value) % 360])
+
+    raise ValueError(f'Invalid navigation instruction: {action}{value}.')
 
 
 # Part 1
@@ -45,23 +237,11 @@ steps    = list( lines(filename, parse) )
 # starting position?
 # A: Part 1: Manhattan(origin, ship): 319.
 
-sx, sy   = 0, 0
-heading  = collections.deque(['E', 'S', 'W', 'N'])
-actions  = {
-    'N': lambda act, val: (sx, sy + val, None),
-    'S': lambda act, val: (sx, sy - val, None),
-    'E': lambda act, val: (sx + val, sy, None),
-    'W': lambda act, val: (sx - val, sy, None),
-    'F': lambda act, val: (sx, sy, heading[0]),
-    'L': lambda act, val: (sx, sy, heading.rotate( val // 90)),
-    'R': lambda act, val: (sx, sy, heading.rotate(-val // 90))
-}
-
-for act, val in steps:
-    while act is not None:
-        sx, sy, act = actions[act](act, val)
-
-print(f'Part 1: Manhattan(origin, ship): {abs(sx) + abs(sy)}.')
+def part1 (steps):
+    """Returns the Manhattan distance from the origin to the ship after
+    following the navigation `steps`, moving the ship itself.
+    """
+    return distance(steps)
 
 
 # Part 2
@@ -72,19 +252,16 @@ print(f'Part 1: Manhattan(origin, ship): {abs(sx) + abs(sy)}.')
 # starting position?
 # A: Part 2: Manhattan(origin, ship): 50157.
 
-sx, sy  =  0, 0
-wx, wy  = 10, 1
-actions = {
-    'N': lambda act, val: (sx, sy, wx, wy + val),
-    'S': lambda act, val: (sx, sy, wx, wy - val),
-    'E': lambda act, val: (sx, sy, wx + val, wy),
-    'W': lambda act, val: (sx, sy, wx - val, wy),
-    'F': lambda act, val: (sx + (val * wx), sy + (val * wy), wx, wy),
-    'L': lambda act, val: (sx, sy, *rotate(wx, wy, val)),
-    'R': lambda act, val: (sx, sy, *rotate(wx, wy, val, clockwise=True))
-}
-
-for act,  val in steps:
-    sx, sy, wx, wy = actions[act](act, val)
-
-print(f'Part 2: Manhattan(origin, ship): {abs(sx) + abs(sy)}.')
+def part2 (steps):
+    """Returns the Manhattan distance from the origin to the ship after
+    following the navigation `steps`, moving the ship's waypoint.
+    """
+    return distance(steps, waypoint=True)
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d12.txt'
+    steps    = parse(filename)
+
+    print(f'Part 1: Manhattan(origin, ship): {part1(steps)}.')
+    print(f'Part 2: Manhattan(origin, ship): {part2(steps)}.')
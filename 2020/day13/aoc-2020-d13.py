@@ -4,10 +4,19 @@
 # Author: Ben Bornstein
 
 
+import itertools
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+
 def crt (nrs):
     """Solves a system of modular congruences by finding `x` (return value),
     given a list of modulus factors (n_i's) and remainders (r_i's), such
-    that `x` is the smallest positive integer that satisfies the
+    that `x` is the smallest non-negative integer that satisfies the
     following:
 
         x mod n_1 = r_1
@@ -16,32 +25,53 @@ def crt (nrs):
 
     Where `nrs = [(n_1, r_1), ... (n_k, r_k)]`.
 
-    The solution uses the Chinese Remainder Theorem [1] and implements a
-    Sieve Search [2].  This method is *exponential* time complexity, but
-    is *much* more efficient than a systematic (linear) search.  It
-    takes only a few hundredths of a second on the puzzle input and is
-    incredibly straightforward to implement (and understand).
+    The solution uses the Chinese Remainder Theorem [1], generalized to
+    moduli that need not be pairwise coprime [2].  Congruences are merged
+    one at a time: `x = r (mod n)` and `x = r_i (mod n_i)` hold together
+    iff `x = r + n * t (mod lcm(n, n_i))`, where `t` is found with a
+    modular inverse (i.e. the extended Euclidean algorithm, via `pow()`).
+    That is O(k log M) for k congruences with product M.  Raises
+    `ValueError` if the congruences are inconsistent, i.e. if some `r_i`
+    and `r` do not differ by a multiple of `gcd(n, n_i)` (which can only
+    happen if the moduli are not coprime).
 
     [1]: https://en.wikipedia.org/wiki/Chinese_remainder_theorem
-    [2]: https://en.wikipedia.org/wiki/Chinese_remainder_theorem#Search_by_sieving
+    [2]: https://en.wikipedia.org/wiki/Chinese_remainder_theorem#Generalization_to_non-coprime_moduli
     """
-    ns, rs = zip( *list( reversed( sorted(nrs, key=lambda t: t[0]) ) ) )
-    r      = ns[0]
-    result = rs[0]
+    n = 1
+    r = 0
+
+    for ni, ri in nrs:
+        g = math.gcd(n, ni)
+        m = ni // g
+
+        if (ri - r) % g != 0:
+            raise ValueError(f'Inconsistent congruences: x mod {n} = {r} and x mod {ni} = {ri}.')
+
+        t  = (ri - r) // g * pow(n // g, -1, m) % m
+        r += n * t
+        n *= m
 
-    for i in range(1, len(nrs)):
-        while result % ns[i] != rs[i]:
-            result += r
-        r *= ns[i]
+    return r % n
 
-    return result
 
+def earliest (depart, schedule):
+    """Returns the `(bus, wait)` of the earliest bus in `schedule` to
+    `depart` (after) the given time.
+    """
+    buses = [ int(s) for s in schedule if s != 'x' ]
+    waits = [ (b, -depart % b) for b in buses ]
+    return min(waits, key=lambda t: t[1])
 
-filename = 'aoc-2020-d13.txt'
 
-with open(filename) as stream:
-    depart   = int( stream.readline() )
-    schedule = stream.readline().split(',')
+def parse (filename):
+    """Parses and returns the `(depart, schedule)` in `filename`, where
+    `depart` is your earliest departure time and `schedule` is a list of
+    bus IDs (strings) or `'x'`s.  Any lines after the first two are
+    ignored.
+    """
+    depart, schedule = itertools.islice(aoc.lines(filename), 2)
+    return int(depart), schedule.strip().split(',')
 
 
 # Part 1
@@ -51,11 +81,10 @@ with open(filename) as stream:
 #
 # A: Part 1: Bus (59) * wait (5) = 295.
 
-buses     = [ int(s) for s in schedule if s != 'x' ]
-waits     = [ (b, -depart % b) for b in buses ]
-bus, wait = min(waits, key=lambda t: t[1])
-
-print(f'Part 1: Bus ({bus}) * wait ({wait}) = {bus * wait}.')
+def part1 (notes):
+    """Returns the ID of the earliest bus times the minutes to wait for it."""
+    bus, wait = earliest(*notes)
+    return bus * wait
 
 
 # Part 2
@@ -65,7 +94,20 @@ print(f'Part 1: Bus ({bus}) * wait ({wait}) = {bus * wait}.')
 #
 # A: Part 2: Earliest timestamp: 213890632230818.
 
-buses = [ (pos, int(s)) for pos, s in enumerate(schedule) if s != 'x' ]
-nrs   = [ (bus, -pos % bus) for pos, bus in buses ]
+def part2 (notes):
+    """Returns the earliest timestamp at which each bus in the schedule
+    departs at an offset matching its position.
+    """
+    depart, schedule = notes
+    buses = [ (pos, int(s)) for pos, s in enumerate(schedule) if s != 'x' ]
+    nrs   = [ (bus, -pos % bus) for pos, bus in buses ]
+    return crt(nrs)
+
+
+if __name__ == '__main__':
+    filename  = 'aoc-2020-d13.txt'
+    notes     = parse(filename)
+    bus, wait = earliest(*notes)
 
-print(f'Part 2: Earliest timestamp: {crt(nrs)}.' )
+    print(f'Part 1: Bus ({bus}) * wait ({wait}) = {part1(notes)}.')
+    print(f'Part 2: Earliest timestamp: {part2(notes)}.' )
@@ -5,7 +5,12 @@
 
 
 import itertools
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def bitwise_or (value, mask):
@@ -42,18 +47,22 @@ def load (filename):
     """
     pattern = re.compile('mem\[(\d+)\] = (\d+)')
 
-    with open(filename) as stream:
-        for line in stream.readlines():
-            line = line.strip()
+    for line in aoc.lines(filename, str.strip):
+        if line.startswith('mask ='):
+            mask = line[7:]
+        else:
+            match = pattern.search(line)
+            addr  = int( match[1] )
+            value = int( match[2] )
+
+            yield mask, addr, value
 
-            if line.startswith('mask ='):
-                mask = line[7:]
-            else:
-                match = pattern.search(line)
-                addr  = int( match[1] )
-                value = int( match[2] )
 
-                yield mask, addr, value
+def parse (filename):
+    """Parses and returns the list of `(mask, addr, value)` memory writes
+    in `filename` (see `load()`).
+    """
+    return list( load(filename) )
 
 
 # Part 1
@@ -65,16 +74,16 @@ def load (filename):
 #
 # A: Part 1: Sum(memory): 14839536808842.
 
-filename = 'aoc-2020-d14.txt'
-memory   = { }
-program  = list( load(filename) )
+def part1 (program):
+    """Returns the sum of memory after executing `program`, masking values."""
+    memory = { }
 
-for mask, addr, value in program:
-    clear        = int( mask.replace('X', '1'), 2 )
-    keep         = int( mask.replace('X', '0'), 2 )
-    memory[addr] = (value | keep) & clear
+    for mask, addr, value in program:
+        clear        = int( mask.replace('X', '1'), 2 )
+        keep         = int( mask.replace('X', '0'), 2 )
+        memory[addr] = (value | keep) & clear
 
-print(f'Part 1: Sum(memory): {sum(memory.values())}.')
+    return sum( memory.values() )
 
 
 # Part 2
@@ -85,10 +94,22 @@ print(f'Part 1: Sum(memory): {sum(memory.values())}.')
 # Q: What is the sum of all values left in memory after it completes?
 # A: Part 2: Sum(memory): 4215284199669.
 
-memory.clear()
+def part2 (program):
+    """Returns the sum of memory after executing `program`, masking (and
+    floating) addresses.
+    """
+    memory = { }
+
+    for mask, addr, value in program:
+        for a in floating( bitwise_or(f'{addr:036b}', mask) ):
+            memory[a] = value
+
+    return sum( memory.values() )
+
 
-for mask, addr, value in program:
-    for a in floating( bitwise_or(f'{addr:036b}', mask) ):
-        memory[a] = value
+if __name__ == '__main__':
+    filename = 'aoc-2020-d14.txt'
+    program  = parse(filename)
 
-print(f'Part 2: Sum(memory): {sum(memory.values())}.')
+    print(f'Part 1: Sum(memory): {part1(program)}.')
+    print(f'Part 2: Sum(memory): {part2(program)}.')
@@ -5,6 +5,36 @@
 
 
 import collections
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+
+def parse (filename):
+    """Parses and returns the starting numbers in `filename`."""
+    return tuple( aoc.integers(filename) )
+
+
+# Part 1
+#
+# Q: Given your starting numbers, what will be the 2020th number spoken?
+# A: Part 1: The 2020th number spoken is 276.
+
+def part1 (start):
+    """Returns the 2020th number spoken, given the `start`ing numbers."""
+    return play(*start, turns=2020)
+
+
+# Part 2
+#
+# Q: Given your starting numbers, what will be the 30000000th number spoken?
+# A: Part 2: The 30000000th number spoken is 31916.
+
+def part2 (start):
+    """Returns the 30000000th number spoken, given the `start`ing numbers."""
+    return play(*start, turns=30000000)
 
 
 def play (*start, turns):
@@ -26,32 +56,33 @@ def play (*start, turns):
     return last
 
 
-test  = False
-turns = 2020
+if __name__ == '__main__':
+    test  = False
+    turns = 2020
+
+    if test:
+        assert play(0, 3, 6, turns=turns) ==  436
+        assert play(1, 3, 2, turns=turns) ==    1
+        assert play(2, 1, 3, turns=turns) ==   10
+        assert play(1, 2, 3, turns=turns) ==   27
+        assert play(2, 3, 1, turns=turns) ==   78
+        assert play(3, 2, 1, turns=turns) ==  438
+        assert play(3, 1, 2, turns=turns) == 1836
 
-if test:
-    assert play(0, 3, 6, turns=turns) ==  436
-    assert play(1, 3, 2, turns=turns) ==    1
-    assert play(2, 1, 3, turns=turns) ==   10
-    assert play(1, 2, 3, turns=turns) ==   27
-    assert play(2, 3, 1, turns=turns) ==   78
-    assert play(3, 2, 1, turns=turns) ==  438
-    assert play(3, 1, 2, turns=turns) == 1836
+    filename = 'aoc-2020-d15.txt'
+    start    = parse(filename)
 
-start  = 0, 13, 16, 17, 1, 10, 6
-spoken = play(*start, turns=turns)
-print(f'Part 1: The {turns}th number spoken is {spoken}.')
+    print(f'Part 1: The {turns}th number spoken is {part1(start)}.')
 
-turns = 30000000
+    turns = 30000000
 
-if test:
-    assert play(0, 3, 6, turns=turns) ==  175594
-    assert play(1, 3, 2, turns=turns) ==    2578
-    assert play(2, 1, 3, turns=turns) == 3544142
-    assert play(1, 2, 3, turns=turns) ==  261214
-    assert play(2, 3, 1, turns=turns) == 6895259
-    assert play(3, 2, 1, turns=turns) ==      18
-    assert play(3, 1, 2, turns=turns) ==     362
+    if test:
+        assert play(0, 3, 6, turns=turns) ==  175594
+        assert play(1, 3, 2, turns=turns) ==    2578
+        assert play(2, 1, 3, turns=turns) == 3544142
+        assert play(1, 2, 3, turns=turns) ==  261214
+        assert play(2, 3, 1, turns=turns) == 6895259
+        assert play(3, 2, 1, turns=turns) ==      18
+        assert play(3, 1, 2, turns=turns) ==     362
 
-spoken = play(*start, turns=turns)
-print(f'Part 2: The {turns}th number spoken is {spoken}.')
+    print(f'Part 2: The {turns}th number spoken is {part2(start)}.')
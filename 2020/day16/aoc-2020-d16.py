@@ -5,7 +5,12 @@
 
 
 import functools
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def find (possible):
@@ -28,28 +33,92 @@ def load (filename):
     rules   = { }
     tickets = [ ]
 
-    with open(filename) as stream:
-        for line in stream.readlines():
-            line = line.strip()
-
-            if len(line) == 0:
-                continue
-            elif line == 'your ticket:' or line == 'nearby tickets:':
-                state = 'TICKET'
-                continue
-            elif state == 'RULES':
-                match = pattern.match(line)
-                if match:
-                    name        = match[1]
-                    range1      = range( int(match[2]), 1 + int(match[3]) )
-                    range2      = range( int(match[4]), 1 + int(match[5]) )
-                    rules[name] = [ range1, range2 ]
-            elif state == 'TICKET':
-                tickets.append([ int(s) for s in line.split(',') ])
+    for line in aoc.lines(filename, str.strip):
+        if len(line) == 0:
+            continue
+        elif line == 'your ticket:' or line == 'nearby tickets:':
+            state = 'TICKET'
+            continue
+        elif state == 'RULES':
+            match = pattern.match(line)
+            if match:
+                name        = match[1]
+                range1      = range( int(match[2]), 1 + int(match[3]) )
+                range2      = range( int(match[4]), 1 + int(match[5]) )
+                rules[name] = [ range1, range2 ]
+        elif state == 'TICKET':
+            tickets.append([ int(s) for s in line.split(',') ])
 
     return rules, tickets
 
 
+def parse (filename):
+    """Parses and returns the `(rules, tickets)` in `filename` (see
+    `load()`).
+    """
+    return load(filename)
+
+
+# Part 1
+#
+# Consider the validity of the nearby tickets you scanned.
+#
+# Q: What is your ticket scanning error rate?
+# A: Part 1: Ticket scanning error rate: 19060.
+
+def part1 (notes):
+    """Returns the ticket scanning error rate, the sum of all ticket values
+    that are not valid for any rule.
+    """
+    rules, tickets = notes
+    errors         = [ v for v in flatten(tickets) if not valid(v, rules) ]
+    return sum(errors)
+
+
+# Part 2
+#
+# Once you work out which field is which, look for the six fields on
+# your ticket that start with the word departure.
+#
+# Q: What do you get if you multiply those six values together?
+# A: Part 2: Ticket "depature" product: 953713095011.
+
+def part2 (notes, prefix='departure'):
+    """Returns the product of the fields on your ticket whose names start
+    with `prefix`.
+    """
+    rules, tickets = notes
+    fields         = list( transpose([ t for t in tickets if valid(t, rules) ]) )
+    mapping        = { }
+    possible       = { }
+
+    # Construct a list of possible (valid) mappings from rule names to
+    # field indexes.
+
+    for name, rule in rules.items():
+        possible[name] = [ n for n, vs in enumerate(fields) if valid(vs, *rule) ]
+
+    # Iteratively reduce `possible` mappings by finding the first possible
+    # mapping that contains only a single field index.  Make that
+    # assignment permanent by:
+    #
+    #   1.  Adding `index` to `mapping`, and
+    #   2.  Removing `index` from all entries in `possible`
+    #
+    # Repeat until all `possible` mappings have been made permanent.
+
+    while len(possible) > 0:
+        name, index   = find(possible)
+        mapping[name] = index
+        remove(possible, index)
+        del possible[name]
+
+    ticket = tickets[0]
+    values = [ ticket[ mapping[key] ] for key in mapping if key.startswith(prefix) ]
+
+    return product(values)
+
+
 def product (items):
     """Returns the product of the values in `items`."""
     return functools.reduce(lambda a, b: a * b, items, 1)
@@ -108,57 +177,9 @@ def valid (*args):
     return result
 
 
-# Part 1
-#
-# Consider the validity of the nearby tickets you scanned.
-#
-# Q: What is your ticket scanning error rate?
-# A: Part 1: Ticket scanning error rate: 19060.
-
-filename       = 'aoc-2020-d16.txt'
-rules, tickets = load(filename)
-errors         = [ v for v in flatten(tickets) if not valid(v, rules) ]
-
-print(f'Part 1: Ticket scanning error rate: {sum(errors)}.')
-
-
-# Part 2
-#
-# Once you work out which field is which, look for the six fields on
-# your ticket that start with the word departure.
-#
-# Q: What do you get if you multiply those six values together?
-# A: Part 2: Ticket "depature" product: 953713095011.
-
-fields   = list( transpose([ t for t in tickets if valid(t, rules) ]) )
-mapping  = { }
-possible = { }
-
-
-# Construct a list of possible (valid) mappings from rule names to field
-# indexes.
-
-for name, rule in rules.items():
-    possible[name] = [ n for n, vs in enumerate(fields) if valid(vs, *rule) ]
-
-
-# Iteratively reduce `possible` mappings by finding the first possible
-# mapping that contains only a single field index.  Make that assignment
-# permanent by:
-#
-#   1.  Adding `index` to `mapping`, and
-#   2.  Removing `index` from all entries in `possible`
-#
-# Repeat until all `possible` mappings have been made permanent.
-
-while len(possible) > 0:
-    name, index   = find(possible)
-    mapping[name] = index
-    remove(possible, index)
-    del possible[name]
-
-ticket = tickets[0]
-prefix = 'departure'
-values = [ ticket[ mapping[key] ] for key in mapping if key.startswith(prefix) ]
+if __name__ == '__main__':
+    filename = 'aoc-2020-d16.txt'
+    notes    = parse(filename)
 
-print(f'Part 2: Ticket "depature" product: {product(values)}.')
+    print(f'Part 1: Ticket scanning error rate: {part1(notes)}.')
+    print(f'Part 2: Ticket "depature" product: {part2(notes)}.')
@@ -5,6 +5,11 @@
 
 
 import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def cycle (active):
@@ -48,13 +53,12 @@ def load (filename):
     mapping of all active coordinates, i.e. `active[coord] = True`.
     """
     active = { }
+    cube   = ord('#')
 
-    with open(filename) as stream:
-        for y, line in enumerate( stream.readlines() ):
-            line = line.strip()
-            for x, c in enumerate(line):
-                if c == '#':
-                    active[(x, y)] = True
+    for y, row in enumerate( aoc.grid(filename) ):
+        for x, c in enumerate(row):
+            if c == cube:
+                active[(x, y)] = True
 
     return active
 
@@ -69,17 +73,11 @@ def neighbors (coord):
         yield tuple( map(sum, zip(coord, deltas)) )
 
 
-def transpose (coords):
-    """Returns the transpose of `coords` in any number of dimensions, so:
-
-        ( (x1, y1, ...), ... (xN, yN, ...) )
-
-    becomes:
-
-        ( (x1, x2, ..., xN), (y1, y2, yN...), ... )
-
+def parse (filename):
+    """Parses and returns the mapping of active coordinates in `filename`
+    (see `load()`).
     """
-    return zip(*coords)
+    return load(filename)
 
 
 # Parts 1
@@ -89,6 +87,11 @@ def transpose (coords):
 # Q: How many cubes are left in the active state after the sixth cycle?
 # A: Part 1: Active cubes: 289.
 
+def part1 (start):
+    """Returns the number of active cubes after six cycles in 3D."""
+    return simulate(start, 3)
+
+
 # Part 2
 #
 # Starting with your given initial configuration, simulate six cycles in
@@ -97,13 +100,39 @@ def transpose (coords):
 # Q: How many cubes are left in the active state after the sixth cycle?
 # A: Part 2: Active cubes: 2084.
 
-filename = 'aoc-2020-d17.txt'
-start    = load(filename)
+def part2 (start):
+    """Returns the number of active cubes after six cycles in 4D."""
+    return simulate(start, 4)
+
 
-for dimension in (3, 4):
+def simulate (start, dimension, cycles=6):
+    """Returns the number of active cubes after `start` (two dimensional)
+    is embedded in `dimension`s and run for `cycles`.
+    """
     active = embed(start, dimension)
 
-    for c in range(6):
+    for c in range(cycles):
         active = cycle(active)
 
-    print(f'Part {dimension - 2}: Active cubes: { len( active.values() ) }.')
+    return len( active.values() )
+
+
+def transpose (coords):
+    """Returns the transpose of `coords` in any number of dimensions, so:
+
+        ( (x1, y1, ...), ... (xN, yN, ...) )
+
+    becomes:
+
+        ( (x1, x2, ..., xN), (y1, y2, yN...), ... )
+
+    """
+    return zip(*coords)
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d17.txt'
+    start    = parse(filename)
+
+    for dimension, part in (3, part1), (4, part2):
+        print(f'Part {dimension - 2}: Active cubes: {part(start)}.')
@@ -4,6 +4,13 @@
 # Author: Ben Bornstein
 
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+
 class AST (object):
     """An Abstract Syntax Tree (AST) is comprised of one or more AST nodes.
     Each node may have an optional `op`erator and, `left` and `right`
@@ -185,19 +192,13 @@ class Parser2 (AbstractParser):
         return node
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in filename.  If func is given, it is
-    applied to each line before yielding (returning) it.
-    """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+eval1 = lambda formula: Parser1(formula).ast.evaluate()
+eval2 = lambda formula: Parser2(formula).ast.evaluate()
 
 
-eval1       = lambda formula: Parser1(formula).ast.evaluate()
-eval2       = lambda formula: Parser2(formula).ast.evaluate()
-filename    = 'aoc-2020-d18.txt'
-expressions = list( lines(filename, lambda s: s.strip()) )
+def parse (filename):
+    """Parses and returns the list of homework expressions in `filename`."""
+    return list( aoc.lines(filename, str.strip) )
 
 
 # Part 1
@@ -208,13 +209,9 @@ expressions = list( lines(filename, lambda s: s.strip()) )
 # Q: What is the sum of the resulting values?
 # A: Part 1: Sum of homework expressions: 36382392389406
 
-assert eval1('2 * 3 + (4 * 5)') == 26
-assert eval1('5 + (8 * 3 + 9 + 3 * 4 * 3)') == 437
-assert eval1('5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))') == 12240
-assert eval1('((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2') == 13632
-
-values = [ eval1(expr) for expr in expressions ]
-print(f'Part 1: Sum of homework expressions: {sum(values)}')
+def part1 (expressions):
+    """Returns the sum of `expressions` evaluated left-to-right."""
+    return sum( eval1(expr) for expr in expressions )
 
 
 # Part 2
@@ -223,11 +220,25 @@ print(f'Part 1: Sum of homework expressions: {sum(values)}')
 # problems using these new rules?
 # A: Part 2: Sum of homework expressions: 381107029777968
 
-assert eval2('1 + (2 * 3) + (4 * (5 + 6))') == 51
-assert eval2('2 * 3 + (4 * 5)') == 46
-assert eval2('5 + (8 * 3 + 9 + 3 * 4 * 3)') == 1445
-assert eval2('5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))') == 669060
-assert eval2('((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2') == 23340
+def part2 (expressions):
+    """Returns the sum of `expressions` evaluated with addition first."""
+    return sum( eval2(expr) for expr in expressions )
+
+
+if __name__ == '__main__':
+    assert eval1('2 * 3 + (4 * 5)') == 26
+    assert eval1('5 + (8 * 3 + 9 + 3 * 4 * 3)') == 437
+    assert eval1('5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))') == 12240
+    assert eval1('((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2') == 13632
+
+    assert eval2('1 + (2 * 3) + (4 * (5 + 6))') == 51
+    assert eval2('2 * 3 + (4 * 5)') == 46
+    assert eval2('5 + (8 * 3 + 9 + 3 * 4 * 3)') == 1445
+    assert eval2('5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))') == 669060
+    assert eval2('((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2') == 23340
+
+    filename    = 'aoc-2020-d18.txt'
+    expressions = parse(filename)
 
-values = [ eval2(expr) for expr in expressions ]
-print(f'Part 2: Sum of homework expressions: {sum(values)}')
+    print(f'Part 1: Sum of homework expressions: {part1(expressions)}')
+    print(f'Part 2: Sum of homework expressions: {part2(expressions)}')
@@ -4,14 +4,20 @@
 # Author: Ben Bornstein
 
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+
 def load (filename):
     """Loads and returns a dictionary of rules and a list of messages and
     returns `(rules, messages)`.
     """
-    with open(filename) as stream:
-        top, bottom = stream.read().split('\n\n')
-        rules       = dict( parse(line) for line in top.split('\n') )
-        messages    = bottom.strip().split('\n')
+    top, bottom = aoc.records(filename)
+    rules       = dict( rule(line) for line in top.split('\n') )
+    messages    = bottom.strip().split('\n')
 
     return rules, messages
 
@@ -127,22 +133,11 @@ def match_42_31 (msg, rules):
     return matched
 
 
-def parse (line):
-    """Parses a rule line and returns `(rule, subrules)`."""
-    rule, rhs = (s.strip() for s in line.split(':'))
-
-    if rhs.count('"') == 2:
-        subrules = rhs.replace('"', '')
-    elif rhs.count('|') == 0:
-        subrules = rhs.split()
-    else:
-        subrules = [ s.split() for s in rhs.split('|') ]
-
-    return rule, subrules
-
-
-filename        = 'aoc-2020-d19.txt'
-rules, messages = load(filename)
+def parse (filename):
+    """Parses and returns the `(rules, messages)` in `filename` (see
+    `load()`).
+    """
+    return load(filename)
 
 
 # Part 1
@@ -150,8 +145,10 @@ rules, messages = load(filename)
 # Q: How many messages completely match rule 0?
 # A: Part 1: Messages matching Rule 0: 165.
 
-matches = sum( int(match(msg, rules)) for msg in messages)
-print(f'Part 1: Messages matching Rule 0: {matches}.')
+def part1 (notes):
+    """Returns the number of messages that completely match rule 0."""
+    rules, messages = notes
+    return sum( int(match(msg, rules)) for msg in messages)
 
 
 # Part 2
@@ -159,5 +156,31 @@ print(f'Part 1: Messages matching Rule 0: {matches}.')
 # Q: After updating rules 8 and 11, how many messages match rule 0?
 # A: Part 2: Messages matching Rule 0: (42)^M (31)^N: 274.
 
-matches = sum( int(match_42_31(msg, rules)) for msg in messages)
-print(f'Part 2: Messages matching Rule 0: (42)^M (31)^N: {matches}.')
+def part2 (notes):
+    """Returns the number of messages that match rule 0, after updating
+    rules 8 and 11 (see `match_42_31()`).
+    """
+    rules, messages = notes
+    return sum( int(match_42_31(msg, rules)) for msg in messages)
+
+
+def rule (line):
+    """Parses a rule line and returns `(rule, subrules)`."""
+    rule, rhs = (s.strip() for s in line.split(':'))
+
+    if rhs.count('"') == 2:
+        subrules = rhs.replace('"', '')
+    elif rhs.count('|') == 0:
+        subrules = rhs.split()
+    else:
+        subrules = [ s.split() for s in rhs.split('|') ]
+
+    return rule, subrules
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2020-d19.txt'
+    notes    = parse(filename)
+
+    print(f'Part 1: Messages matching Rule 0: {part1(notes)}.')
+    print(f'Part 2: Messages matching Rule 0: (42)^M (31)^N: {part2(notes)}.')
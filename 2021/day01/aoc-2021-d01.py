@@ -4,27 +4,16 @@
 # Author: Ben Bornstein
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
-    """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
-
-
-def windows (seq, size):
-    """Yields windows over `seq`uence of `size` items, e.g.:
-
-           windows('ABCD', 2) -> ('A', 'B'), ('B', 'C'), ('C', 'D')
-    """
-    for n in range(size - 1, len(seq)):
-        yield tuple( seq[n - s] for s in range(size - 1, -1, -1) )
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
-filename = 'aoc-2021-d01.txt'
-depths   = list( lines(filename, int) )
+def parse (filename):
+    """Parses and returns the sonar sweep depths in `filename`."""
+    return aoc.integers(filename)
 
 
 # Part 1
@@ -32,8 +21,9 @@ depths   = list( lines(filename, int) )
 # Q: How many measurements are larger than the previous measurement?
 # A: 1715 measurements are larger than the previous measurement.
 
-count = sum( w[1] > w[0] for w in windows(depths, size=2) )
-print(f'Part 1: {count} measurements are larger than the previous measurement.')
+def part1 (depths):
+    """Returns the number of `depths` larger than the previous depth."""
+    return sum( w[1] > w[0] for w in windows(depths, size=2) )
 
 
 # Part 2
@@ -41,6 +31,29 @@ print(f'Part 1: {count} measurements are larger than the previous measurement.')
 # Q: How many sums are larger than the previous sum?
 # A:
 
-sums  = [ sum(w) for w in windows(depths, size=3) ]
-count = sum( w[1] > w[0] for w in windows(sums, size=2) )
-print(f'Part 2: {count} sums are larger than the previous sum.')
+def part2 (depths):
+    """Returns the number of three-depth (sliding window) sums larger than
+    the previous sum.
+    """
+    sums = [ sum(w) for w in windows(depths, size=3) ]
+    return sum( w[1] > w[0] for w in windows(sums, size=2) )
+
+
+def windows (seq, size):
+    """Yields windows over `seq`uence of `size` items, e.g.:
+
+           windows('ABCD', 2) -> ('A', 'B'), ('B', 'C'), ('C', 'D')
+    """
+    for n in range(size - 1, len(seq)):
+        yield tuple( seq[n - s] for s in range(size - 1, -1, -1) )
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2021-d01.txt'
+    depths   = parse(filename)
+
+    count    = part1(depths)
+    print(f'Part 1: {count} measurements are larger than the previous measurement.')
+
+    count    = part2(depths)
+    print(f'Part 2: {count} sums are larger than the previous sum.')
@@ -4,24 +4,47 @@
 # Author: Ben Bornstein
 
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+
 def command (line):
     """Converts `line` into a `(direction, magnitude)` submarine command."""
     direction, magnitude = line.split()
     return direction, int(magnitude)
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
+def navigate (commands, aim=False):
+    """Follows the submarine `commands` and returns its final `(pos,
+    depth)`.  If `aim` is true, up and down change the submarine's aim
+    rather than its depth.
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    depth = 0
+    pos   = 0
+    angle = 0
+
+    for direction, magnitude in commands:
+        if direction == 'forward':
+            pos   += magnitude
+            depth += angle * magnitude
+        else:
+            if direction == 'up':
+                magnitude *= -1
+
+            if aim:
+                angle += magnitude
+            else:
+                depth += magnitude
 
+    return pos, depth
 
 
-filename = 'aoc-2021-d02.txt'
-commands = list( lines(filename, command) )
+def parse (filename):
+    """Parses and returns the list of submarine `command()`s in `filename`."""
+    return list( aoc.lines(filename, command) )
 
 
 # Part 1
@@ -29,19 +52,10 @@ commands = list( lines(filename, command) )
 # Q: Multiply your final horizontal position by your final depth?
 # A: Part 1: 1925 pos * 879 depth = 1692075
 
-depth = 0
-pos   = 0
-
-for direction, magnitude in commands:
-    if direction == 'forward':
-        pos += magnitude
-    else:
-        if direction == 'up':
-            magnitude *= -1
-
-        depth += magnitude
-
-print(f'Part 1: {pos} pos * {depth:6} depth = {pos * depth:10}')
+def part1 (commands):
+    """Returns the final horizontal position times the final depth."""
+    pos, depth = navigate(commands)
+    return pos * depth
 
 
 # Part 2
@@ -49,18 +63,18 @@ print(f'Part 1: {pos} pos * {depth:6} depth = {pos * depth:10}')
 # Q: Multiply your final horizontal position by your final depth?
 # A: Part 2: 1925 pos * 908844 depth = 1749524700
 
-aim   = 0
-depth = 0
-pos   = 0
+def part2 (commands):
+    """Returns the final horizontal position times the final depth, with
+    up and down changing the submarine's aim.
+    """
+    pos, depth = navigate(commands, aim=True)
+    return pos * depth
 
-for direction, magnitude in commands:
-    if direction == 'forward':
-        pos   += magnitude
-        depth += aim * magnitude
-    else:
-        if direction == 'up':
-            magnitude *= -1
 
-        aim += magnitude
+if __name__ == '__main__':
+    filename = 'aoc-2021-d02.txt'
+    commands = parse(filename)
 
-print(f'Part 2: {pos} pos * {depth:6} depth = {pos * depth:10}')
+    for part, aim in (1, False), (2, True):
+        pos, depth = navigate(commands, aim)
+        print(f'Part {part}: {pos} pos * {depth:6} depth = {pos * depth:10}')
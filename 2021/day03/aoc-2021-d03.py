@@ -5,6 +5,11 @@
 
 
 import functools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def colsum (matrix, column=None):
@@ -22,13 +27,41 @@ def dotadd (vec1, vec2):
     return [ e1 + e2 for e1, e2 in zip(vec1, vec2) ]
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
+def gamma (numbers):
+    """Returns the `(gamma, epsilon)` rates of the diagnostic `numbers`."""
+    nbits   = len(numbers[0])
+    gamma   = vec2int( colsum(numbers) )
+    epsilon = ~gamma & (2**nbits - 1)
+    return gamma, epsilon
+
+
+def parse (filename):
+    """Parses and returns the diagnostic report in `filename` as a matrix
+    of bit vectors (see `str2vec()`).
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    return list( aoc.lines(filename, str2vec) )
+
+
+# Part 1
+#
+# Q: What is the power consumption of the submarine?
+# A: 1869 gamma * 2226 epsilon = 4160394
+
+def part1 (numbers):
+    """Returns the power consumption (gamma times epsilon rate)."""
+    g, e = gamma(numbers)
+    return g * e
+
+
+# Part 2
+#
+# Q: Multiply your final horizontal position by your final depth?
+# A: 1719 O2 * 2400 CO2 = 4125600
+
+def part2 (numbers):
+    """Returns the life support rating (O2 times CO2 rating)."""
+    O2, CO2 = ratings(numbers)
+    return O2 * CO2
 
 
 def rating (numbers, criteria):
@@ -74,6 +107,13 @@ def rating (numbers, criteria):
     return value
 
 
+def ratings (numbers):
+    """Returns the `(O2, CO2)` generator and scrubber ratings in `numbers`."""
+    O2  = rating(numbers, lambda most_common:  1 if most_common >= 0 else -1)
+    CO2 = rating(numbers, lambda most_common: -1 if most_common >= 0 else  1)
+    return O2, CO2
+
+
 def str2vec (s):
     """Converts the binary string of '0' and '1' characters to a vector.
 
@@ -99,29 +139,12 @@ def vec2int (vec):
 
 
 
-filename = 'aoc-2021-d03.txt'
-numbers  = list( lines(filename, str2vec) )
-
-
-# Part 1
-#
-# Q: What is the power consumption of the submarine?
-# A: 1869 gamma * 2226 epsilon = 4160394
-
-nbits   = len(numbers[0])
-gamma   = vec2int( colsum(numbers) )
-epsilon = ~gamma & (2**nbits - 1)
-
-print(f'Part 1: {gamma} gamma * {epsilon} epsilon = {gamma * epsilon}')
-
-
-# Part 2
-#
-# Q: Multiply your final horizontal position by your final depth?
-# A: 1719 O2 * 2400 CO2 = 4125600
-
+if __name__ == '__main__':
+    filename = 'aoc-2021-d03.txt'
+    numbers  = parse(filename)
 
-O2  = rating(numbers, lambda most_common:  1 if most_common >= 0 else -1)
-CO2 = rating(numbers, lambda most_common: -1 if most_common >= 0 else  1)
+    g, e    = gamma(numbers)
+    O2, CO2 = ratings(numbers)
 
-print(f'Part 2: {O2} O2    * {CO2} CO2     = {O2 * CO2}')
+    print(f'Part 1: {g} gamma * {e} epsilon = {part1(numbers)}')
+    print(f'Part 2: {O2} O2    * {CO2} CO2     = {part2(numbers)}')
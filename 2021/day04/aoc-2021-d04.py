@@ -4,7 +4,13 @@
 # Author: Ben Bornstein
 
 
+import copy
 import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def card (lines):
@@ -15,10 +21,9 @@ def card (lines):
 
 def load (filename):
     """Loads a bingo game from `filename` and returns `(numbers, boards)`."""
-    with open(filename) as stream:
-        numbers = [ int(s) for s in stream.readline().split(',') ]
-        discard = stream.readline()
-        boards  = [ card(lines) for lines in stream.read().split('\n\n') ]
+    draws, *cards = aoc.records(filename)
+    numbers       = [ int(s) for s in draws.split(',') ]
+    boards        = [ card(lines) for lines in cards ]
 
     return numbers, boards
 
@@ -33,28 +38,11 @@ def mark (board, draw):
             board[row][col] = 'x'
 
 
-def score (board, draw):
-    """Scores the bingo `board`, including the last `draw`."""
-    return sum(s for s in itertools.chain(*board) if s != 'x') * draw
-
-
-def winner (board):
-    """Indicates whether or not this bingo `board` is a winner."""
-    done = lambda squares: all(s == 'x' for s in squares)
-    return any(done(row) or done(col) for row, col in zip(board, zip(*board)))
-
-
-filename        = 'aoc-2021-d04.txt'
-numbers, boards = load(filename)
-scores          = [ ]
-
-for draw, board in itertools.product(numbers, boards):
-    if not winner(board):
-        mark(board, draw)
-        if winner(board):
-            scores.append( score(board, draw) )
-            if len(scores) == len(boards):
-                break
+def parse (filename):
+    """Parses and returns the `(numbers, boards)` in `filename` (see
+    `load()`).
+    """
+    return load(filename)
 
 
 # Part 1
@@ -62,7 +50,9 @@ for draw, board in itertools.product(numbers, boards):
 # Q: What will your final score be if you choose that board?
 # A: Score = 12796
 
-print(f'Part 1: Score = {scores[0]}')
+def part1 (game):
+    """Returns the final score of the first board to win."""
+    return play(*game)[0]
 
 
 # Part 2
@@ -70,4 +60,43 @@ print(f'Part 1: Score = {scores[0]}')
 # Q: Once it wins, what would its final score be?
 # A: Score = 18063
 
-print(f'Part 2: Score = {scores[-1]}')
+def part2 (game):
+    """Returns the final score of the last board to win."""
+    return play(*game)[-1]
+
+
+def play (numbers, boards):
+    """Plays bingo with (a copy of) `boards` drawing `numbers` and returns
+    the list of winning board scores, in the order they won.
+    """
+    boards = copy.deepcopy(boards)
+    scores = [ ]
+
+    for draw, board in itertools.product(numbers, boards):
+        if not winner(board):
+            mark(board, draw)
+            if winner(board):
+                scores.append( score(board, draw) )
+                if len(scores) == len(boards):
+                    break
+
+    return scores
+
+
+def score (board, draw):
+    """Scores the bingo `board`, including the last `draw`."""
+    return sum(s for s in itertools.chain(*board) if s != 'x') * draw
+
+
+def winner (board):
+    """Indicates whether or not this bingo `board` is a winner."""
+    done = lambda squares: all(s == 'x' for s in squares)
+    return any(done(row) or done(col) for row, col in zip(board, zip(*board)))
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2021-d04.txt'
+    game     = parse(filename)
+
+    print(f'Part 1: Score = {part1(game)}')
+    print(f'Part 2: Score = {part2(game)}')
@@ -5,6 +5,11 @@
 
 
 import collections
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 Point = collections.namedtuple('Point', ['x', 'y'])
@@ -21,9 +26,46 @@ def lines (filename):
     point = lambda s: Point._make( int(t)   for t in s.split(',')  )
     line  = lambda s: Line._make ( point(t) for t in s.split('->') )
 
-    with open(filename) as stream:
-        for s in stream.readlines():
-            yield line(s)
+    return aoc.lines(filename, line)
+
+
+def overlap (lines):
+    """Returns the number of points where at least two `lines` overlap."""
+    vents = collections.defaultdict(int)
+
+    for line in lines:
+        record(line, vents)
+
+    return sum(1 for count in vents.values() if count >= 2)
+
+
+def parse (filename):
+    """Parses and returns the list of vent `Line`s in `filename`."""
+    return list( lines(filename) )
+
+
+# Part 1
+#
+# Q: At how many points do at least two lines overlap?
+# A: Overlap = 6113
+
+def part1 (vents):
+    """Returns the number of points where at least two horizontal or
+    vertical `vents` lines overlap.
+    """
+    return overlap( line for line in vents if not diagonal(line) )
+
+
+# Part 2
+#
+# Q: At how many points do at least two lines overlap (with diagonals)?
+# A: Overlap = 20373
+
+def part2 (vents):
+    """Returns the number of points where at least two `vents` lines
+    (including diagonals) overlap.
+    """
+    return overlap(vents)
 
 
 def points (line):
@@ -57,30 +99,9 @@ def sign (x):
     return 0 if x == 0 else (1 if x > 0 else -1)
 
 
-filename  = 'aoc-2021-d05.txt'
-vents     = collections.defaultdict(int)
-diagonals = collections.defaultdict(int)
-
-
-# Part 1
-#
-# Q: At how many points do at least two lines overlap?
-# A: Overlap = 6113
-
-for line in lines(filename):
-    record(line, diagonals if diagonal(line) else vents)
-
-overlap = sum(1 for count in vents.values() if count >= 2)
-
-print(f'Part 1: Overlap = {overlap:5}')
-
-
-# Part 2
-#
-# Q: At how many points do at least two lines overlap (with diagonals)?
-# A: Overlap = 20373
-
-vents   = { p: vents[p] + diagonals[p] for p in list(vents) + list(diagonals) }
-overlap = sum(1 for count in vents.values() if count >= 2)
+if __name__ == '__main__':
+    filename = 'aoc-2021-d05.txt'
+    vents    = parse(filename)
 
-print(f'Part 2: Overlap = {overlap:5}')
+    print(f'Part 1: Overlap = {part1(vents):5}')
+    print(f'Part 2: Overlap = {part2(vents):5}')
@@ -5,12 +5,16 @@
 
 
 import collections
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def load (filename):
     """Loads the initial latern fish state from `filename`."""
-    with open(filename) as stream:
-        return [ int(s) for s in stream.read().split(',') ]
+    return aoc.integers(filename)
 
 
 def fishogram (fish):
@@ -22,6 +26,31 @@ def fishogram (fish):
     return collections.Counter(fish)
 
 
+def parse (filename):
+    """Parses and returns the initial lanternfish state in `filename`."""
+    return load(filename)
+
+
+# Part 1
+#
+# Q: How many lanternfish would there be after 80 days?
+# A: Fish = 386640
+
+def part1 (fish):
+    """Returns the number of lanternfish after 80 days."""
+    return spawn(fish, 80)
+
+
+# Part 2
+#
+# Q: How many lanternfish would there be after 256 days?
+# A: Fish = 1733403626279
+
+def part2 (fish):
+    """Returns the number of lanternfish after 256 days."""
+    return spawn(fish, 256)
+
+
 def spawn (fish, days):
     """Spawns `fish` for `days` and returns the total number of fish."""
     today = fishogram(fish)
@@ -39,21 +68,9 @@ def spawn (fish, days):
     return sum( today.values() )
 
 
-filename = 'aoc-2021-d06.txt'
-fish     = load(filename)
-
-
-# Part 1
-#
-# Q: How many lanternfish would there be after 80 days?
-# A: Fish = 386640
-
-print(f'Part 1: Fish = {spawn(fish,  80):13}')
-
-
-# Part 2
-#
-# Q: How many lanternfish would there be after 256 days?
-# A: Fish = 1733403626279
+if __name__ == '__main__':
+    filename = 'aoc-2021-d06.txt'
+    fish     = parse(filename)
 
-print(f'Part 2: Fish = {spawn(fish, 256):13}')
+    print(f'Part 1: Fish = {part1(fish):13}')
+    print(f'Part 2: Fish = {part2(fish):13}')
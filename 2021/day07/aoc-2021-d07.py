@@ -5,6 +5,15 @@
 
 
 import collections
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+
+linear     = lambda steps: steps
+triangular = lambda steps: int(steps * (steps + 1) / 2)
 
 
 def align (crabs, cost):
@@ -26,12 +35,12 @@ def align (crabs, cost):
 
 def load (filename):
     """Loads crab position from `filename`."""
-    with open(filename) as stream:
-        return [ int(s) for s in stream.read().split(',') ]
+    return aoc.integers(filename)
 
 
-filename = 'aoc-2021-d07.txt'
-crabs    = load(filename)
+def parse (filename):
+    """Parses and returns the crab positions in `filename`."""
+    return load(filename)
 
 
 # Part 1
@@ -39,8 +48,9 @@ crabs    = load(filename)
 # Q: How much fuel must they spend to align to that position?
 # A: Moving to position 328 costs 328187 fuel.
 
-pos, fuel = align(crabs, lambda steps: steps)
-print(f'Part 1: Moving to position {pos} costs {fuel:8} fuel.')
+def part1 (crabs):
+    """Returns the least fuel to align `crabs`, at one fuel per step."""
+    return align(crabs, linear)[1]
 
 
 # Part 2
@@ -48,5 +58,17 @@ print(f'Part 1: Moving to position {pos} costs {fuel:8} fuel.')
 # Q: How much fuel must they spend to align to that position?
 # A: Moving to position 464 costs 91257582 fuel.
 
-pos, fuel = align(crabs, lambda steps: int(steps * (steps + 1) / 2) )
-print(f'Part 2: Moving to position {pos} costs {fuel:8} fuel.')
+def part2 (crabs):
+    """Returns the least fuel to align `crabs`, each step costing one more
+    fuel than the last.
+    """
+    return align(crabs, triangular)[1]
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2021-d07.txt'
+    crabs    = parse(filename)
+
+    for part, cost in (1, linear), (2, triangular):
+        pos, fuel = align(crabs, cost)
+        print(f'Part {part}: Moving to position {pos} costs {fuel:8} fuel.')
@@ -5,6 +5,11 @@
 
 
 import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def decode (outputs, ring):
@@ -51,22 +56,16 @@ def deduce (patterns):
     return { normalize(pattern): digit for digit, pattern in ring.items() }
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
-    """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
-
-
 def normalize (pattern):
     """Normalizes the LED segment `pattern` by sorting it alphabetically."""
     return ''.join( sorted(pattern) )
 
 
-filename = 'aoc-2021-d08.txt'
-entries  = list( lines(filename, lambda line: line.replace('|', '').split()) )
+def parse (filename):
+    """Parses and returns the list of entries in `filename`, each ten
+    unique signal patterns followed by four output values.
+    """
+    return list( aoc.lines(filename, lambda line: line.replace('|', '').split()) )
 
 
 # Part 1
@@ -74,9 +73,12 @@ entries  = list( lines(filename, lambda line: line.replace('|', '').split()) )
 # Q: In the output values, how many times do digits 1, 4, 7, or 8 appear?
 # A: Count = 26
 
-outputs = itertools.chain(*[ entry[10:] for entry in entries ])
-count   = sum(1 for output in outputs if len(output) in (2, 3, 4, 7))
-print(f'Part 1: Count = {count:7}')
+def part1 (entries):
+    """Returns the number of times digits 1, 4, 7, or 8 appear in the
+    output values of `entries`.
+    """
+    outputs = itertools.chain(*[ entry[10:] for entry in entries ])
+    return sum(1 for output in outputs if len(output) in (2, 3, 4, 7))
 
 
 # Part 2
@@ -84,5 +86,14 @@ print(f'Part 1: Count = {count:7}')
 # Q: What do you get if you add up all of the output values?
 # A: Total = 1009098
 
-total = sum( decode(entry[10:], deduce(entry[:10])) for entry in entries )
-print(f'Part 2: Total = {total}')
+def part2 (entries):
+    """Returns the sum of all decoded output values in `entries`."""
+    return sum( decode(entry[10:], deduce(entry[:10])) for entry in entries )
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2021-d08.txt'
+    entries  = parse(filename)
+
+    print(f'Part 1: Count = {part1(entries):7}')
+    print(f'Part 2: Total = {part2(entries)}')
@@ -5,6 +5,11 @@
 
 
 import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def flood (row, col, heights, basin=None):
@@ -26,9 +31,23 @@ def flood (row, col, heights, basin=None):
 
 def load (filename):
     """Loads height map from `filename`."""
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield [ int(c) for c in line.strip() ]
+    return aoc.grid(filename, aoc.Digits)
+
+
+def lows (heights):
+    """Returns the list of `(row, col)` low point locations in `heights`."""
+    nrows     = len(heights)
+    ncols     = len(heights[0])
+    locations = [ ]
+
+    for row, col in itertools.product( range(nrows), range(ncols) ):
+        current  = heights[row][col]
+        adjacent = neighbors(row, col, nrows, ncols)
+
+        if all(current < heights[r][c] for r, c in adjacent):
+            locations.append( (row, col) )
+
+    return locations
 
 
 def neighbors (row, col, nrows, ncols):
@@ -43,11 +62,9 @@ def neighbors (row, col, nrows, ncols):
     return [ (row + r, col + c) for r, c in deltas if valid(row + r, col + c) ]
 
 
-filename  = 'aoc-2021-d09.txt'
-heights   = list( load(filename) )
-nrows     = len(heights)
-ncols     = len(heights[0])
-locations = [ ]
+def parse (filename):
+    """Parses and returns the height map in `filename`."""
+    return list( load(filename) )
 
 
 # Part 1
@@ -55,15 +72,9 @@ locations = [ ]
 # Q: What is the sum of the risk levels of all low points on your heightmap?
 # A: Risk = 486
 
-for row, col in itertools.product( range(nrows), range(ncols) ):
-    current  = heights[row][col]
-    adjacent = neighbors(row, col, nrows, ncols)
-
-    if all(current < heights[r][c] for r, c in adjacent):
-        locations.append( (row, col) )
-
-risk = sum(heights[row][col] + 1 for row, col in locations)
-print(f'Part 1: Risk    = {risk:7}')
+def part1 (heights):
+    """Returns the sum of the risk levels of all low points in `heights`."""
+    return sum(heights[row][col] + 1 for row, col in lows(heights))
 
 
 # Part 2
@@ -71,6 +82,15 @@ print(f'Part 1: Risk    = {risk:7}')
 # Q: Multiply together the sizes of the three largest basins?
 # A: Largest = 1059300
 
-sizes   = sorted([ len(flood(row, col, heights)) for row, col in locations ])
-largest = sizes[-1] * sizes[-2] * sizes[-3]
-print(f'Part 2: Largest = {largest}')
+def part2 (heights):
+    """Returns the product of the sizes of the three largest basins."""
+    sizes = sorted([ len(flood(row, col, heights)) for row, col in lows(heights) ])
+    return sizes[-1] * sizes[-2] * sizes[-3]
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2021-d09.txt'
+    heights  = parse(filename)
+
+    print(f'Part 1: Risk    = {part1(heights):7}')
+    print(f'Part 2: Largest = {part2(heights)}')
@@ -4,29 +4,23 @@
 # Author: Ben Bornstein
 
 
-import collections
 import functools
+import os
+import sys
 
-
-def lines (filename, func=None):
-    """Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
-    """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
-filename   = 'aoc-2021-d10.txt'
-closes     = { '(': ')', '[': ']', '{': '}' , '<': '>'   }
-closers    = closes.values()
-counts     = collections.defaultdict(int)
-incomplete = [ ]
+closes  = { '(': ')', '[': ']', '{': '}' , '<': '>'   }
+closers = closes.values()
 
 
-for line in lines(filename):
-    error = False
-    line  = line.strip()
+def check (line):
+    """Checks the navigation subsystem `line` and returns `(error, stack)`,
+    where `error` is the first illegal (corrupted) closing character, or
+    `None` if `line` is incomplete, and `stack` is its unclosed chunks.
+    """
     stack = [ ]
 
     for c in line:
@@ -42,12 +36,14 @@ for line in lines(filename):
             stack.pop()
             stack.pop()
         else:
-            counts[actual] += 1
-            error = True
-            break
+            return actual, stack
+
+    return None, stack
 
-    if not error:
-        incomplete.append(stack)
+
+def parse (filename):
+    """Parses and returns the navigation subsystem lines in `filename`."""
+    return list( aoc.lines(filename, str.strip) )
 
 
 # Part 1
@@ -55,9 +51,11 @@ for line in lines(filename):
 # Q: What is the total syntax error score for those errors?
 # A: Score = 319329
 
-points = { ')': 3, ']': 57, '}': 1197, '>': 25137 }
-score  = sum( count * points[c] for c, count in counts.items() )
-print(f'Part 1: Score = {score:10}')
+def part1 (lines):
+    """Returns the total syntax error score of corrupted `lines`."""
+    points = { ')': 3, ']': 57, '}': 1197, '>': 25137 }
+    errors = ( check(line)[0] for line in lines )
+    return sum( points[c] for c in errors if c is not None )
 
 
 # Part 2
@@ -65,13 +63,24 @@ print(f'Part 1: Score = {score:10}')
 # Q: What is the middle score?
 # A: 3515583998
 
-points = { ')': 1, ']': 2, '}': 3, '>': 4 }
-scores = [ ]
+def part2 (lines):
+    """Returns the middle completion score of incomplete `lines`."""
+    points = { ')': 1, ']': 2, '}': 3, '>': 4 }
+    scores = [ ]
+
+    for error, stack in map(check, lines):
+        if error is None:
+            complete = [ closes[c] for c in reversed(stack) ]
+            score    = functools.reduce(lambda a, c: (a * 5) + points[c], complete, 0)
+            scores.append(score)
+
+    scores.sort()
+    return scores[len(scores) // 2]
+
 
-for stack in incomplete:
-    complete = [ closes[c] for c in reversed(stack) ]
-    score    = functools.reduce(lambda a, c: (a * 5) + points[c], complete, 0)
-    scores.append(score)
+if __name__ == '__main__':
+    filename = 'aoc-2021-d10.txt'
+    lines    = parse(filename)
 
-scores.sort()
-print(f'Part 2: Score = {scores[len(scores) // 2]}')
+    print(f'Part 1: Score = {part1(lines):10}')
+    print(f'Part 2: Score = {part2(lines)}')
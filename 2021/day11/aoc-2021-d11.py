@@ -7,6 +7,11 @@
 import functools
 import itertools
 import operator
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def energize (grid, row=None, col=None):
@@ -34,9 +39,7 @@ def iterate (grid):
 
 def load (filename):
     """Loads and returns grid of octopus engery levels from `filename`."""
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield [ int(c) for c in line.strip() ]
+    return aoc.grid(filename, aoc.Digits)
 
 
 def neighbors (row, col, nrows, ncols):
@@ -57,6 +60,35 @@ def neighbors (row, col, nrows, ncols):
             yield (r, c)
 
 
+def parse (filename):
+    """Parses and returns the grid of octopus energy levels in `filename`."""
+    return list( load(filename) )
+
+
+# Part 1
+#
+# Q: How many total flashes are there after 100 steps?
+# A: Total Flashes = 1732
+
+def part1 (grid):
+    """Returns the total number of flashes after 100 steps."""
+    return sum( itertools.islice(steps(grid), 100) )
+
+
+# Part 2
+#
+# Q: What is the first step during which all octopuses flash?
+# A: All Flash Step = 290
+
+def part2 (grid):
+    """Returns the first step during which all octopuses flash."""
+    num_octopuses = functools.reduce(operator.mul, size(grid), 1)
+
+    for step, num_flashed in enumerate(steps(grid), start=1):
+        if num_flashed == num_octopuses:
+            return step
+
+
 def propagate (grid):
     """Propagates flashes across `grid` returning the total number of
     flashes seen.
@@ -92,37 +124,20 @@ def settle (grid):
             grid[r][c] = 0
 
 
-filename      = 'aoc-2021-d11.txt'
-grid          = list( load(filename) )
-num_octopuses = functools.reduce(operator.mul, size(grid), 1)
-part          = 0
-step          = 0
-total         = 0
-
-
-while True:
-    step += 1
-
-    _, num_flashed, _ = energize(grid), propagate(grid), settle(grid)
-    total += num_flashed
-
-    # Part 1
-    #
-    # Q: How many total flashes are there after 100 steps?
-    # A: Total Flashes = 1732
+def steps (grid):
+    """Steps (a copy of) octopus `grid` forever, yielding the number of
+    octopuses that flashed at each step.
+    """
+    grid = [ row.copy() for row in grid ]
 
-    if step == 100:
-        print(f'Part 1: Total Flashes  = {total}')
-        part += 1
+    while True:
+        _, num_flashed, _ = energize(grid), propagate(grid), settle(grid)
+        yield num_flashed
 
-    # Part 2
-    #
-    # Q: What is the first step during which all octopuses flash?
-    # A: All Flash Step = 290
 
-    if num_flashed == num_octopuses:
-        print(f'Part 2: All Flash Step = {step:4}')
-        part += 1
+if __name__ == '__main__':
+    filename = 'aoc-2021-d11.txt'
+    grid     = parse(filename)
 
-    if part == 2:
-        break
+    print(f'Part 1: Total Flashes  = {part1(grid)}')
+    print(f'Part 2: All Flash Step = {part2(grid):4}')
@@ -5,6 +5,11 @@
 
 
 import collections
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def allowed_once (cave, visited):
@@ -41,19 +46,43 @@ def load (filename):
     """
     caves = collections.defaultdict(list)
 
-    with open(filename) as stream:
-        for line in stream.readlines():
-            src, dst = line.strip().split('-')
+    for line in aoc.lines(filename):
+        src, dst = line.strip().split('-')
 
-            if not start(dst):
-                caves[src].append(dst)
+        if not start(dst):
+            caves[src].append(dst)
 
-            if not start(src) and not end(dst):
-                caves[dst].append(src)
+        if not start(src) and not end(dst):
+            caves[dst].append(src)
 
     return caves
 
 
+def parse (filename):
+    """Parses and returns the cave graph in `filename` (see `load()`)."""
+    return load(filename)
+
+
+# Part 1
+#
+# Q: How many paths ... that visit small caves at most once?
+# A: Paths = 5212
+
+def part1 (caves):
+    """Returns the number of paths that visit small caves at most once."""
+    return paths(caves, allowed_once)
+
+
+# Part 2
+#
+# Q: How many paths ... that visit once small cave at most twice?
+# A:
+
+def part2 (caves):
+    """Returns the number of paths that visit one small cave at most twice."""
+    return paths(caves, allowed_twice)
+
+
 def paths (caves, allowed):
     """Returns a count of all paths through `caves` graph according to
     `allowed` visit function.
@@ -95,21 +124,9 @@ def twice (visited):
     return any(visited.count(cave) == 2 for cave in visited if small(cave))
 
 
-filename = 'aoc-2021-d12.txt'
-caves    = load(filename)
-
-
-# Part 1
-#
-# Q: How many paths ... that visit small caves at most once?
-# A: Paths = 5212
-
-print(f'Part 1: Paths = {paths(caves, allowed_once):6}')
-
-
-# Part 2
-#
-# Q: How many paths ... that visit once small cave at most twice?
-# A:
+if __name__ == '__main__':
+    filename = 'aoc-2021-d12.txt'
+    caves    = parse(filename)
 
-print(f'Part 2: Paths = {paths(caves, allowed_twice)}')
+    print(f'Part 1: Paths = {part1(caves):6}')
+    print(f'Part 2: Paths = {part2(caves)}')
@@ -5,6 +5,11 @@
 
 
 import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def fold (paper, along, line, nrows, ncols):
@@ -46,36 +51,78 @@ def load (filename):
     paper = set()
     folds = None
 
-    with open(filename) as stream:
-        for line in stream.readlines():
-            line = line.strip()
-
-            if len(line) == 0:
-                folds = [ ]
-                continue
+    for line in aoc.lines(filename, str.strip):
+        if len(line) == 0:
+            folds = [ ]
+            continue
 
-            if folds is None:
-                x, y = map(int, line.split(','))
-                paper.add((x, y))
-            else:
-                along, value = line.split('=')
-                folds.append( (along[-1].upper(), int(value)) )
+        if folds is None:
+            x, y = map(int, line.split(','))
+            paper.add((x, y))
+        else:
+            along, value = line.split('=')
+            folds.append( (along[-1].upper(), int(value)) )
 
     return paper, folds
 
 
+def parse (filename):
+    """Parses and returns the `(paper, folds)` in `filename` (see
+    `load()`).
+    """
+    return load(filename)
+
+
+# Part 1
+#
+# Q: How many dots are visible after completing just the first fold?
+# A: Count = 671
+
+def part1 (manual):
+    """Returns the number of dots visible after the first fold."""
+    paper, folds = manual
+    paper        = set(paper)
+    fold(paper, *folds[0], *size(paper))
+    return len(paper)
+
+
+# Part 2
+#
+# Q: What code do you use to activate ... camera system?
+# A: PCPHARKL
+
+def part2 (manual):
+    """Returns the code (as text, see `render()`) after all folds."""
+    paper, folds = manual
+    paper        = set(paper)
+    nrows, ncols = size(paper)
+
+    for along, line in folds:
+        nrows, ncols = fold(paper, along, line, nrows, ncols)
+
+    return render(paper, nrows, ncols)
+
+
 def pretty (paper, nrows, ncols, num_letters=8):
-    """Pretty prints `paper` sized `nrows`-by-`ncols` with enough space for
-    `num_letters` spaced apart to improve legibility.
+    """Pretty prints `paper` sized `nrows`-by-`ncols` (see `render()`)."""
+    print( render(paper, nrows, ncols, num_letters), end='' )
+
+
+def render (paper, nrows, ncols, num_letters=8):
+    """Returns `paper` sized `nrows`-by-`ncols` as text, with enough space
+    for `num_letters` spaced apart to improve legibility.
     """
     char_width = ncols // num_letters
+    text       = ''
 
     for y in range(nrows):
         for char_start in range(0, ncols, max(1, char_width)):
             for x in range(char_start, char_start + char_width):
-                print('#' if (x, y) in paper else ' ', end='')
-            print('   ', end='')
-        print()
+                text += '#' if (x, y) in paper else ' '
+            text += '   '
+        text += '\n'
+
+    return text
 
 
 def size (paper):
@@ -85,30 +132,10 @@ def size (paper):
     return nrows, ncols
 
 
+if __name__ == '__main__':
+    filename = 'aoc-2021-d13.txt'
+    manual   = parse(filename)
 
-filename     = 'aoc-2021-d13.txt'
-paper, folds = load(filename)
-nrows, ncols = size(paper)
-
-
-# Part 1
-#
-# Q: How many dots are visible after completing just the first fold?
-# A: Count = 671
-
-along, line  = folds[0]
-nrows, ncols = fold(paper, along, line, nrows, ncols)
-
-print(f'Part 1: Count = {len(paper)}')
-
-
-# Part 2
-#
-# Q: What code do you use to activate ... camera system?
-# A: PCPHARKL
-
-for along, line in folds[1:]:
-    nrows, ncols = fold(paper, along, line, nrows, ncols)
-
-print(f'Part 2: ')
-pretty(paper, nrows, ncols)
+    print(f'Part 1: Count = {part1(manual)}')
+    print(f'Part 2: ')
+    print(part2(manual), end='')
@@ -6,6 +6,11 @@
 
 import collections
 import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def counterize (counter, rulemers):
@@ -93,18 +98,53 @@ def load (filename):
     """Loads template polymer and reaction rules from `filename`.  Returns
     `(template, rules)`.
     """
-    rules = { }
-
-    with open(filename) as stream:
-        template, lines = stream.read().split('\n\n')
+    rules           = { }
+    template, lines = aoc.records(filename)
 
-        for rule in lines.strip().split('\n'):
-            pair, elem = rule.split(' -> ')
-            rules[pair] = elem
+    for rule in lines.strip().split('\n'):
+        pair, elem = rule.split(' -> ')
+        rules[pair] = elem
 
     return template, rules
 
 
+def parse (filename):
+    """Parses and returns the `(template, rules)` in `filename` (see
+    `load()`).
+    """
+    return load(filename)
+
+
+# Part 1
+#
+# Q: After 10 steps, difference between most and least common element counts?
+# A: 10 Steps = 2010
+
+def part1 (manual, steps=10):
+    """Returns the difference between the most and least common element
+    counts after (literally) polymerizing `steps` times.
+    """
+    polymer, rules = manual
+
+    for step in range(steps):
+        polymer = polymerize(polymer, rules)
+
+    common = collections.Counter(polymer).most_common()
+    return common[0][1] - common[-1][1]
+
+
+# Part 2
+#
+# Q: After 40 steps, difference between most and least common element counts?
+# A: 40 Steps = 2437698971143
+
+def part2 (manual, steps=40):
+    """Returns the difference between the most and least common element
+    counts after `steps` reactions, counting only dimers (see `react()`).
+    """
+    return react(*manual, steps)
+
+
 def polymerize (polymer, rules):
     """Polymerizes (expands) `polymer` according to `rules` and returns the
     newly formed polymer chain.
@@ -120,44 +160,30 @@ def polymerize (polymer, rules):
     return ''.join(chain)
 
 
-def second (dimer):
-    """Returns the second element in `dimer`."""
-    return dimer[1]
-
-
-filename        = 'aoc-2021-d14.txt'
-template, rules = load(filename)
-
-
-# Part 1
-#
-# Q: After 10 steps, difference between most and least common element counts?
-# A: 10 Steps = 2010
-
-polymer = template[:]
-
-for step in range(10):
-    polymer = polymerize(polymer, rules)
+def react (template, rules, steps):
+    """Reacts `template` according to `rules` for `steps` and returns the
+    difference between the most and least common element counts.  Only
+    dimer counts are tracked (see `counterize()`).
+    """
+    counter  = collections.Counter( dimer for dimer in dimers(template) )
+    rulemers = dimerize(rules)
 
-common = collections.Counter(polymer).most_common()
-print(f'Part 1: 10 Steps = {common[0][1] - common[-1][1]}')
+    for step in range(steps):
+        counter = counterize(counter, rulemers)
 
+    common = counts(counter, template).most_common()
+    return common[0][1] - common[-1][1]
 
-# Part 2
-#
-# Q: After 40 steps, difference between most and least common element counts?
-# A: 40 Steps = 2437698971143
 
-polymer  = template[:]
-counter  = collections.Counter( dimer for dimer in dimers(polymer) )
-rulemers = dimerize(rules)
+def second (dimer):
+    """Returns the second element in `dimer`."""
+    return dimer[1]
 
-for step in range(40):
-    counter = counterize(counter, rulemers)
 
-    if step + 1 == 10:
-        common = counts(counter, polymer).most_common()
-        print(f'Part 1: 10 Steps = {common[0][1] - common[-1][1]} (redux)')
+if __name__ == '__main__':
+    filename = 'aoc-2021-d14.txt'
+    manual   = parse(filename)
 
-common = counts(counter, polymer).most_common()
-print(f'Part 2: 40 Steps = {common[0][1] - common[-1][1]}')
+    print(f'Part 1: 10 Steps = {part1(manual)}')
+    print(f'Part 1: 10 Steps = {react(*manual, 10)} (redux)')
+    print(f'Part 2: 40 Steps = {part2(manual)}')
@@ -5,7 +5,13 @@
 
 
 import collections
+import copy
 import heapq
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 Point         = collections.namedtuple('Point', ['x', 'y'])
@@ -47,9 +53,8 @@ class RiskMap:
         """Creates a new risk-level map from `filename`."""
         rmap = RiskMap()
 
-        with open(filename) as stream:
-            for line in stream.readlines():
-                rmap.append([ int(c) for c in line.strip() ])
+        for row in aoc.grid(filename, aoc.Digits):
+            rmap.append(row)
 
         return rmap
 
@@ -95,6 +100,40 @@ class RiskMap:
 
 
 
+def parse (filename):
+    """Parses and returns the `RiskMap` in `filename`."""
+    return RiskMap.load(filename)
+
+
+# Part 1
+#
+# Q: Lowest total risk of any path from the top left to the bottom right?
+# A: Total Risk = 755
+
+def part1 (rmap):
+    """Returns the lowest total risk of any path through `rmap`."""
+    start = Point(0, 0)
+    end   = Point(rmap.ncols - 1, rmap.nrows - 1)
+
+    return search(rmap, start, end)
+
+
+# Part 2
+#
+# Q: Lowest total risk of any path from the top left to the bottom right?
+# A: Total Risk = 3016
+
+def part2 (rmap):
+    """Returns the lowest total risk of any path through the full `rmap`,
+    i.e. five times larger in both dimensions.
+    """
+    rmap = copy.copy(rmap)
+    rmap.resize(factor=5)
+
+    return part1(rmap)
+
+
+
 def search (rmap, start, end):
     """Searches `RiskMap` `rmap` (breadth-first) to find the least risky
     path from `start` to `end`.  Returns the total risk of that path.
@@ -119,27 +158,9 @@ def search (rmap, start, end):
     return risk
 
 
+if __name__ == '__main__':
+    filename = 'aoc-2021-d15.txt'
+    rmap     = parse(filename)
 
-filename = 'aoc-2021-d15.txt'
-rmap     = RiskMap.load(filename)
-start    = Point(0, 0)
-end      = Point(rmap.ncols - 1, rmap.nrows - 1)
-
-
-# Part 1
-#
-# Q: Lowest total risk of any path from the top left to the bottom right?
-# A: Total Risk = 755
-
-print(f'Part 1: Total Risk = {search(rmap, start, end):4}')
-
-
-# Part 2
-#
-# Q: Lowest total risk of any path from the top left to the bottom right?
-# A: Total Risk = 3016
-
-rmap.resize(factor=5)
-end = Point(rmap.ncols - 1, rmap.nrows - 1)
-
-print(f'Part 2: Total Risk = {search(rmap, start, end)}')
+    print(f'Part 1: Total Risk = {part1(rmap):4}')
+    print(f'Part 2: Total Risk = {part2(rmap)}')
@@ -7,6 +7,11 @@
 import collections
 import functools
 import operator
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 class Biterator:
@@ -61,40 +66,7 @@ class Biterator:
 Packet = collections.namedtuple('Packet', ['version', 'op', 'value'])
 
 
-def evaluate (packet):
-    """Evaluates Buoyancy Interchange Transmission System (BITS) `packet` and
-    returns its value.
-    """
-    value = 0
-
-    if packet.op == 0:
-        value = sum(evaluate(p) for p in packet.value)
-    
-    elif packet.op == 1:
-        value = functools.reduce(operator.mul, (evaluate(p) for p in packet.value), 1)
-    
-    elif packet.op == 2:
-        value = min(evaluate(p) for p in packet.value)
-    
-    elif packet.op == 3:
-        value = max(evaluate(p) for p in packet.value)
-    
-    elif packet.op == 4:
-        value = packet.value
-    
-    elif packet.op == 5:
-        value = int( evaluate(packet.value[0]) > evaluate(packet.value[1]) )
-
-    elif packet.op == 6:
-        value = int( evaluate(packet.value[0]) < evaluate(packet.value[1]) )
-    
-    elif packet.op == 7:
-        value = int( evaluate(packet.value[0]) == evaluate(packet.value[1]) )
-
-    return value
-
-
-def parse (data):
+def decode (data):
     """Parses `data` and returns a corresponding Buoyancy Interchange Transmission
     System (BITS) `Packet`.
     
@@ -123,53 +95,65 @@ def parse (data):
             value = [ ]
 
             while bits.position < stop:
-                value.append( parse(bits) )
+                value.append( decode(bits) )
             
             value = tuple(value)
 
         else:
             npackets = bits.next(11)
-            value    = [ parse(bits) for p in range(npackets) ]
+            value    = [ decode(bits) for p in range(npackets) ]
 
         value = tuple(value)
 
     return Packet(version, op, value)
 
 
-def versions (packet):
-    """Iterable over this packet's version and versions of all sub-packets."""
-    yield packet.version
+def evaluate (packet):
+    """Evaluates Buoyancy Interchange Transmission System (BITS) `packet` and
+    returns its value.
+    """
+    value = 0
+
+    if packet.op == 0:
+        value = sum(evaluate(p) for p in packet.value)
     
-    if type(packet.value) is tuple:
-        for p in packet.value:
-            yield from versions(p)
+    elif packet.op == 1:
+        value = functools.reduce(operator.mul, (evaluate(p) for p in packet.value), 1)
+    
+    elif packet.op == 2:
+        value = min(evaluate(p) for p in packet.value)
+    
+    elif packet.op == 3:
+        value = max(evaluate(p) for p in packet.value)
+    
+    elif packet.op == 4:
+        value = packet.value
+    
+    elif packet.op == 5:
+        value = int( evaluate(packet.value[0]) > evaluate(packet.value[1]) )
 
+    elif packet.op == 6:
+        value = int( evaluate(packet.value[0]) < evaluate(packet.value[1]) )
+    
+    elif packet.op == 7:
+        value = int( evaluate(packet.value[0]) == evaluate(packet.value[1]) )
 
-# Part 1
-#
-# Q: What is the sum of the version numbers in all packets?
-# A: Version Su == 31
+    return value
 
-assert parse('D2FE28')         == Packet(version=6, op=4, value=2021)
-assert parse('38006F45291200') == Packet(version=1, op=6, value=(
-                                      Packet(version=6, op=4, value=10),
-                                      Packet(version=2, op=4, value=20) ))
-assert parse('EE00D40C823060') == Packet(version=7, op=3, value=(
-                                      Packet(version=2, op=4, value=1),
-                                      Packet(version=4, op=4, value=2),
-                                      Packet(version=1, op=4, value=3) ))
 
-assert sum( versions( parse('8A004A801A8002F478')             ) ) == 16
-assert sum( versions( parse('620080001611562C8802118E34')     ) ) == 12
-assert sum( versions( parse('C0015000016115A2E0802F182340')   ) ) == 23
-assert sum( versions( parse('A0016C880162017C3686B18A3D4780') ) ) == 31
+def parse (filename):
+    """Parses and returns the (outermost) BITS `Packet` in `filename`."""
+    return decode( next( aoc.lines(filename, str.strip) ) )
 
-filename = 'aoc-2021-d16.txt'
 
-with open(filename) as stream:
-    packet = stream.read().strip()
+# Part 1
+#
+# Q: What is the sum of the version numbers in all packets?
+# A: Version Su == 31
 
-print(f'Version Sum = {sum( versions( parse(packet) ) )}')
+def part1 (packet):
+    """Returns the sum of the version numbers in all packets."""
+    return sum( versions(packet) )
 
 
 # Part 2
@@ -177,13 +161,46 @@ print(f'Version Sum = {sum( versions( parse(packet) ) )}')
 # Q: Evaluate the expression represented by your hexadecimal-encoded BITS transmission?
 # A: Result = 1392637195518
 
-assert evaluate( parse('C200B40A82')                 ) ==  3
-assert evaluate( parse('04005AC33890')               ) == 54
-assert evaluate( parse('880086C3E88112')             ) ==  7
-assert evaluate( parse('CE00C43D881120')             ) ==  9
-assert evaluate( parse('D8005AC2A8F0')               ) ==  1
-assert evaluate( parse('F600BC2D8F')                 ) ==  0
-assert evaluate( parse('9C005AC2F8F0')               ) ==  0
-assert evaluate( parse('9C0141080250320F1802104A08') ) ==  1
+def part2 (packet):
+    """Returns the value of the expression `packet` represents."""
+    return evaluate(packet)
+
+
+def versions (packet):
+    """Iterable over this packet's version and versions of all sub-packets."""
+    yield packet.version
+    
+    if type(packet.value) is tuple:
+        for p in packet.value:
+            yield from versions(p)
+
 
-print(f'Result      = {evaluate( parse(packet) )}')
+if __name__ == '__main__':
+    assert decode('D2FE28')         == Packet(version=6, op=4, value=2021)
+    assert decode('38006F45291200') == Packet(version=1, op=6, value=(
+                                           Packet(version=6, op=4, value=10),
+                                           Packet(version=2, op=4, value=20) ))
+    assert decode('EE00D40C823060') == Packet(version=7, op=3, value=(
+                                           Packet(version=2, op=4, value=1),
+                                           Packet(version=4, op=4, value=2),
+                                           Packet(version=1, op=4, value=3) ))
+
+    assert sum( versions( decode('8A004A801A8002F478')             ) ) == 16
+    assert sum( versions( decode('620080001611562C8802118E34')     ) ) == 12
+    assert sum( versions( decode('C0015000016115A2E0802F182340')   ) ) == 23
+    assert sum( versions( decode('A0016C880162017C3686B18A3D4780') ) ) == 31
+
+    assert evaluate( decode('C200B40A82')                 ) ==  3
+    assert evaluate( decode('04005AC33890')               ) == 54
+    assert evaluate( decode('880086C3E88112')             ) ==  7
+    assert evaluate( decode('CE00C43D881120')             ) ==  9
+    assert evaluate( decode('D8005AC2A8F0')               ) ==  1
+    assert evaluate( decode('F600BC2D8F')                 ) ==  0
+    assert evaluate( decode('9C005AC2F8F0')               ) ==  0
+    assert evaluate( decode('9C0141080250320F1802104A08') ) ==  1
+
+    filename = 'aoc-2021-d16.txt'
+    packet   = parse(filename)
+
+    print(f'Version Sum = {part1(packet)}')
+    print(f'Result      = {part2(packet)}')
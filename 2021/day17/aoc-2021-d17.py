@@ -9,7 +9,12 @@
 
 import collections
 import itertools
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 Position = collections.namedtuple('Position', ['x', 'y'])
@@ -57,8 +62,7 @@ class Target (collections.namedtuple('Target', ['xrange', 'yrange'])):
     @staticmethod
     def load (filename):
         """Loads and returns a `Target` from `filename`."""
-        with open(filename) as stream:
-            return Target.read( stream.read().strip() )
+        return Target.read( next( aoc.lines(filename, str.strip) ) )
 
 
     @staticmethod
@@ -80,23 +84,24 @@ class Target (collections.namedtuple('Target', ['xrange', 'yrange'])):
         return probe.pos.x > self.xrange.stop or probe.pos.y < self.yrange.start
 
 
-def sign (x):
-    """Returns the sign of `x` as `-1`, `0`, or `+1`.""" 
-    return 0 if x == 0 else +1 if x > 0 else -1
+def hits (target):
+    """Launches a `Probe` at `target` with every (plausible) initial velocity
+    and returns a list of the maximum heights reached by those that hit.
+    """
+    heights = [ ]
 
+    for vx, vy in itertools.product( range(0, target.xrange.stop), range(-100, 100) ):
+        probe = Probe(vx, vy)
 
-filename = 'aoc-2021-d17.txt'
-# target = Target.read('target area: x=20..30, y=-10..-5')
-target   = Target.load(filename)
-height   = 0
-count    = 0
+        if probe.launch(target):
+            heights.append(probe.height)
 
-for vx, vy in itertools.product( range(0, target.xrange.stop), range(-100, 100) ):
-    probe = Probe(vx, vy)
+    return heights
 
-    if probe.launch(target):
-        count += 1
-        height = max(height, probe.height)
+
+def parse (filename):
+    """Parses and returns the `Target` in `filename`."""
+    return Target.load(filename)
 
 
 # Part 1
@@ -104,7 +109,9 @@ for vx, vy in itertools.product( range(0, target.xrange.stop), range(-100, 100)
 # Q: What is the highest y position it reaches on this trajectory?
 # A: Height = 4656
 
-print(f'Part 1: Height     = {height}')
+def part1 (target):
+    """Returns the highest position reached by a probe that hits `target`."""
+    return max( hits(target), default=0 )
 
 
 # Part 2
@@ -112,4 +119,20 @@ print(f'Part 1: Height     = {height}')
 # Q: How many distinct initial velocities cause the probe to hit the target?
 # A: Velocities = 1908
 
-print(f'Part 2: Velocities = {count}')
+def part2 (target):
+    """Returns the number of initial velocities that hit `target`."""
+    return len( hits(target) )
+
+
+def sign (x):
+    """Returns the sign of `x` as `-1`, `0`, or `+1`.""" 
+    return 0 if x == 0 else +1 if x > 0 else -1
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2021-d17.txt'
+    # target = Target.read('target area: x=20..30, y=-10..-5')
+    target   = parse(filename)
+
+    print(f'Part 1: Height     = {part1(target)}')
+    print(f'Part 2: Velocities = {part2(target)}')
@@ -7,6 +7,11 @@
 import collections
 import itertools
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 class SFNumber:
@@ -144,8 +149,34 @@ class SFNumber:
 
 def load (filename):
     """Loads a list of Snailfish numbers (`SFNumber`s) from `filename`."""
-    with open(filename) as stream:
-        return read( stream.read().strip() )
+    return [ SFNumber( eval(line) ) for line in aoc.lines(filename) ]
+
+
+def parse (filename):
+    """Parses and returns the list of Snailfish numbers in `filename`."""
+    return load(filename)
+
+
+# Part 1
+#
+# Q: What is the magnitude of the final sum?
+# A: Magnitude = 4132
+
+def part1 (numbers):
+    """Returns the magnitude of the sum of all Snailfish `numbers`."""
+    return abs( sum(numbers[1:], start=numbers[0]) )
+
+
+# Part 2
+#
+# Q: What is the largest magnitude of any sum of two different snailfish numbers?
+# A: Max Magnitude = 4685
+
+def part2 (numbers):
+    """Returns the largest magnitude of any sum of two different Snailfish
+    `numbers`.
+    """
+    return max( abs(m + n) for m, n in itertools.permutations(numbers, 2) )
 
 
 def read (lines):
@@ -172,41 +203,25 @@ def triples (iterable):
     yield tuple(triplets)
 
 
+if __name__ == '__main__':
+    assert SFNumber( [[[[[9,8],1],2],3],4] ) == [[[[0,9],2],3],4]
+    assert SFNumber( [7,[6,[5,[4,[3,2]]]]] ) == [7,[6,[5,[7,0]]]]
+    assert SFNumber( [[6,[5,[4,[3,2]]]],1] ) == [[6,[5,[7,0]]],3]
 
-assert SFNumber( [[[[[9,8],1],2],3],4] ) == [[[[0,9],2],3],4]
-assert SFNumber( [7,[6,[5,[4,[3,2]]]]] ) == [7,[6,[5,[7,0]]]]
-assert SFNumber( [[6,[5,[4,[3,2]]]],1] ) == [[6,[5,[7,0]]],3]
-
-n = SFNumber( [[3,[2,[1,[7,3]]]],[6,[5,[4,[3,2]]]]] )
-assert n == [[3,[2,[8, 0]]],[9,[5,[7,0]]]]
-
-n = SFNumber( [[3,[2,[8,0]]],[9,[5,[4,[3,2]]]]] )
-assert n == [[3,[2,[8,0]]],[9,[5,[7,0]]]]
-
-n = SFNumber( [[[[4,3],4],4],[7,[[8,4],9]]] ) + SFNumber( [1,1] )
-assert n == [[[[0,7],4],[[7,8],[6,0]]],[8,1]]
-
-numbers = read('[1,1]\n[2,2]\n[3,3]\n[4,4]\n[5,5]\n[6,6]')
-assert sum(numbers[1:], start=numbers[0]) == [[[[5,0],[7,4]],[5,5]],[6,6]]
+    n = SFNumber( [[3,[2,[1,[7,3]]]],[6,[5,[4,[3,2]]]]] )
+    assert n == [[3,[2,[8, 0]]],[9,[5,[7,0]]]]
 
+    n = SFNumber( [[3,[2,[8,0]]],[9,[5,[4,[3,2]]]]] )
+    assert n == [[3,[2,[8,0]]],[9,[5,[7,0]]]]
 
-filename = 'aoc-2021-d18.txt'
-numbers  = load(filename)
+    n = SFNumber( [[[[4,3],4],4],[7,[[8,4],9]]] ) + SFNumber( [1,1] )
+    assert n == [[[[0,7],4],[[7,8],[6,0]]],[8,1]]
 
+    numbers = read('[1,1]\n[2,2]\n[3,3]\n[4,4]\n[5,5]\n[6,6]')
+    assert sum(numbers[1:], start=numbers[0]) == [[[[5,0],[7,4]],[5,5]],[6,6]]
 
-# Part 1
-#
-# Q: What is the magnitude of the final sum?
-# A: Magnitude = 4132
-
-print(f'Magnitude     = {abs( sum(numbers[1:], start=numbers[0]) )}')
-
-
-# Part 2
-#
-# Q: What is the largest magnitude of any sum of two different snailfish numbers?
-# A: Max Magnitude = 4685
-
+    filename = 'aoc-2021-d18.txt'
+    numbers  = parse(filename)
 
-m = max( abs(m + n) for m, n in itertools.permutations(numbers, 2) )
-print(f'Max Magnitude = {m}' )
\ No newline at end of file
+    print(f'Magnitude     = {part1(numbers)}')
+    print(f'Max Magnitude = {part2(numbers)}')
@@ -6,6 +6,11 @@
 
 import collections
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 class Cubes (collections.namedtuple('Cubes', 'red green blue', defaults=3*[0])):
@@ -27,27 +32,9 @@ def game (line):
     return int(game[4:]), [ Cubes.make(sets) for sets in rest.split(';') ]
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
-    """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
-
-
-def possible (cubes, red=12, green=13, blue=14):
-    """Indicates whether a game is possible given a set of `cubes`."""
-    return cubes.red <= red and cubes.green <= green and cubes.blue <= blue
-
-
-def power (sets):
-    """Returns the power of the minimum set of cubes in game `sets`."""
-    return math.prod([ max(color) for color in zip(*sets) ])
-
-
-filename = 'aoc-2023-d02.txt'
-games    = list( lines(filename, game) )
+def parse (filename):
+    """Parses and returns the list of games in `filename` (see `game()`)."""
+    return list( aoc.lines(filename, game) )
 
 
 # Part 1
@@ -55,8 +42,9 @@ games    = list( lines(filename, game) )
 # Q: What is the sum of the IDs of those games?
 # A: Part 1: The sum of all possible game IDs is 2545.
 
-total = sum(g for g, sets in games if all(possible(cubes) for cubes in sets))
-print(f'Part 1: The sum of all possible game IDs is {total}.')
+def part1 (games):
+    """Returns the sum of the IDs of all possible `games`."""
+    return sum(g for g, sets in games if all(possible(cubes) for cubes in sets))
 
 
 # Part 2
@@ -64,5 +52,24 @@ print(f'Part 1: The sum of all possible game IDs is {total}.')
 # Q: What is the sum of the power of these sets?
 # A: Part 2: The sum of the power of these sets is 78111.
 
-total = sum(power(sets) for g, sets in games)
-print(f'Part 2: The sum of the power of these sets is {total}.')
+def part2 (games):
+    """Returns the sum of the power of the minimum sets of cubes in `games`."""
+    return sum(power(sets) for g, sets in games)
+
+
+def possible (cubes, red=12, green=13, blue=14):
+    """Indicates whether a game is possible given a set of `cubes`."""
+    return cubes.red <= red and cubes.green <= green and cubes.blue <= blue
+
+
+def power (sets):
+    """Returns the power of the minimum set of cubes in game `sets`."""
+    return math.prod([ max(color) for color in zip(*sets) ])
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2023-d02.txt'
+    games    = parse(filename)
+
+    print(f'Part 1: The sum of all possible game IDs is {part1(games)}.')
+    print(f'Part 2: The sum of the power of these sets is {part2(games)}.')
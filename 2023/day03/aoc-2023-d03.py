@@ -6,7 +6,12 @@
 
 import collections
 import math
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def adjacent (match, row, schematic):
@@ -32,8 +37,7 @@ def catalog_gears (match, row, schematic, catalog):
 
 def load (filename):
     """Loads engine schematic from `filename`."""
-    with open(filename) as stream:
-        schematic = [ f'\n{line}' for line in stream.readlines() ]
+    schematic = [ f'\n{line}' for line in aoc.lines(filename) ]
 
     pad = '\n' * len(schematic[0])
     schematic.insert(0, pad)
@@ -49,17 +53,21 @@ def neighborhood (match, row):
             yield (row + delta, col)
 
 
-def symbol (c):
-    """Indicates whether `c` is a schematic symbol."""
-    return not c.isdigit() and c != '.' and c != '\n'
+def numbers (schematic):
+    """Returns a list of `(row, match)` part numbers in `schematic`."""
+    matches = [ ]
 
+    for row, line in enumerate(schematic):
+        matches += [ (row, m) for m in re.finditer('\d+', line) if m is not None ]
 
-filename  = 'aoc-2023-d03.txt'
-schematic = load(filename)
-matches   = [ ]
+    return matches
 
-for row, line in enumerate(schematic):
-    matches += [ (row, m) for m in re.finditer('\d+', line) if m is not None ]
+
+def parse (filename):
+    """Parses and returns the engine schematic in `filename` (see
+    `load()`).
+    """
+    return load(filename)
 
 
 # Part 1
@@ -67,8 +75,10 @@ for row, line in enumerate(schematic):
 # Q: What is the sum of all of the part numbers in the engine schematic?
 # A: Part 1: The sum of all part numbers is 527446.
 
-total = sum(int(m[0]) for row, m in matches if adjacent(m, row, schematic))
-print(f'Part 1: The sum of all part numbers is {total:>8}.')
+def part1 (schematic):
+    """Returns the sum of all part numbers adjacent to a symbol."""
+    matches = numbers(schematic)
+    return sum(int(m[0]) for row, m in matches if adjacent(m, row, schematic))
 
 
 # Part 2
@@ -76,10 +86,24 @@ print(f'Part 1: The sum of all part numbers is {total:>8}.')
 # Q: What is the sum of all of the gear ratios in your engine schematic?
 # A: Part 2: The sum of all gear ratios is 73201705.
 
-catalog = collections.defaultdict(list)
+def part2 (schematic):
+    """Returns the sum of all gear ratios in `schematic`."""
+    catalog = collections.defaultdict(list)
+
+    for row, match in numbers(schematic):
+        catalog_gears(match, row, schematic, catalog)
+
+    return sum( math.prod(gears) for gears in catalog.values() if len(gears) > 1 )
+
+
+def symbol (c):
+    """Indicates whether `c` is a schematic symbol."""
+    return not c.isdigit() and c != '.' and c != '\n'
+
 
-for row, match in matches:
-    catalog_gears(match, row, schematic, catalog)
+if __name__ == '__main__':
+    filename  = 'aoc-2023-d03.txt'
+    schematic = parse(filename)
 
-ratios = sum( math.prod(gears) for gears in catalog.values() if len(gears) > 1 )
-print(f'Part 2: The sum of all gear ratios  is {ratios:>8}.')
+    print(f'Part 1: The sum of all part numbers is {part1(schematic):>8}.')
+    print(f'Part 2: The sum of all gear ratios  is {part2(schematic):>8}.')
@@ -4,6 +4,13 @@
 # Author: Ben Bornstein
 
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
+
+
 def card (line):
     """Parse card description on `line` and returns number of matches."""
     winning, have = line.split(':')[1].split('|')
@@ -17,17 +24,9 @@ def count (c, matches):
     return matches[c] + sum(count(c + n + 1, matches) for n in range(matches[c]))
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
-    """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
-
-
-filename = 'aoc-2023-d04.txt'
-matches  = list( lines(filename, card) )
+def parse (filename):
+    """Parses and returns the number of matches on each card in `filename`."""
+    return list( aoc.lines(filename, card) )
 
 
 # Part 1
@@ -35,8 +34,9 @@ matches  = list( lines(filename, card) )
 # Q: How many points are they worth in total?
 # A: Part 1: Total points: 20107
 
-total = sum(2**(m - 1) if m > 0 else 0 for m in matches)
-print(f'Part 1: Total points: {total:>7}.')
+def part1 (matches):
+    """Returns the total points the cards (`matches`) are worth."""
+    return sum(2**(m - 1) if m > 0 else 0 for m in matches)
 
 
 # Part 2
@@ -44,6 +44,15 @@ print(f'Part 1: Total points: {total:>7}.')
 # Q: How many total scratchcards do you end up with?
 # A: Part 2: Total cards: 8172507
 
-copies = sum(count(card, matches) for card in range( len(matches) ))
-total  = copies + len(matches)
-print(f'Part 2: Total cards:  {total:>7}.')
+def part2 (matches):
+    """Returns the total number of scratchcards, originals and copies."""
+    copies = sum(count(card, matches) for card in range( len(matches) ))
+    return copies + len(matches)
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2023-d04.txt'
+    matches  = parse(filename)
+
+    print(f'Part 1: Total points: {part1(matches):>7}.')
+    print(f'Part 2: Total cards:  {part2(matches):>7}.')
@@ -4,15 +4,11 @@
 # Author: Ben Bornstein
 
 import math
+import os
+import sys
 
-
-def lines (filename, func=None):
-    """Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
-    """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 def number (line):
@@ -35,12 +31,9 @@ def numbers (line):
     return [ int(s) for s in line.split(':')[1].split() ]
 
 
-def ways (time, distance):
-    """Return the number of ways to beat `distance` for race `time`."""
-    return sum(1 for hold in range(time) if (hold * (time - hold)) > distance)
-
-
-filename = 'aoc-2023-d06.txt'
+def parse (filename):
+    """Parses and returns the (time and distance) lines in `filename`."""
+    return list( aoc.lines(filename) )
 
 
 # Part 1
@@ -48,9 +41,10 @@ filename = 'aoc-2023-d06.txt'
 # Q: What do you get if you multiply these numbers together?
 # A: Part 1: Product of wins: 1731600.
 
-times, distances = lines(filename, numbers)
-answer           = math.prod( ways(t, d) for t, d in zip(times, distances) )
-print(f'Part 1: Product of wins: {answer:>8}.')
+def part1 (lines):
+    """Returns the product of the number of ways to win each race."""
+    times, distances = map(numbers, lines)
+    return math.prod( ways(t, d) for t, d in zip(times, distances) )
 
 
 # Part 2
@@ -58,5 +52,20 @@ print(f'Part 1: Product of wins: {answer:>8}.')
 # Q: How many ways can you beat the record in this one much longer race?
 # A: Part 2: Number of wins: 40087680.
 
-time, distance = lines(filename, number)
-print(f'Part 2: Number  of wins: {ways(time, distance):>8}.')
+def part2 (lines):
+    """Returns the number of ways to win the one (much longer) race."""
+    time, distance = map(number, lines)
+    return ways(time, distance)
+
+
+def ways (time, distance):
+    """Return the number of ways to beat `distance` for race `time`."""
+    return sum(1 for hold in range(time) if (hold * (time - hold)) > distance)
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2023-d06.txt'
+    lines    = parse(filename)
+
+    print(f'Part 1: Product of wins: {part1(lines):>8}.')
+    print(f'Part 2: Number  of wins: {part2(lines):>8}.')
@@ -6,6 +6,11 @@
 
 import collections
 import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
 
 Point = collections.namedtuple('Point', ['x', 'y'])
@@ -35,13 +40,15 @@ def empty (image):
     return [ r for r, row in enumerate(image) if all(c == '.' for c in row) ]
 
 
-def lines (filename, func=None):
-    """Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
+def lengths (image, expansion):
+    """Returns the sum of the lengths between every pair of galaxies in
+    `image`, once empty rows and columns are `expansion` times larger.
     """
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+    rows     = empty(image)
+    cols     = empty( zip(*image) )
+    galaxies = catalog(image, rows, cols, expansion)
+    pairs    = itertools.combinations(galaxies, 2)
+    return sum(manhattan(p, q) for p, q in pairs if p != q)
 
 
 def manhattan (p, q):
@@ -49,10 +56,9 @@ def manhattan (p, q):
     return abs(p.x - q.x) + abs(p.y - q.y)
 
 
-filename = 'aoc-2023-d11.txt'
-image    = list( lines(filename, lambda line: [ c for c in line.strip() ] ) )
-rows     = empty(image)
-cols     = empty( zip(*image) )
+def parse (filename):
+    """Parses and returns the image in `filename` as rows of characters."""
+    return list( aoc.lines(filename, lambda line: [ c for c in line.strip() ] ) )
 
 
 # Part 1
@@ -60,10 +66,9 @@ cols     = empty( zip(*image) )
 # Q: What is the sum of these lengths?
 # A: Part 1: Sum of lengths (expansion=2): 9795148
 
-galaxies = catalog(image, rows, cols, expansion=2)
-pairs    = itertools.combinations(galaxies, 2)
-total    = sum(manhattan(p, q) for p, q in pairs if p != q)
-print(f'Part 1: Sum of lengths (expansion=2): {total:>14}')
+def part1 (image):
+    """Returns the sum of the lengths between galaxies (expansion=2)."""
+    return lengths(image, expansion=2)
 
 
 # Part 2
@@ -71,7 +76,14 @@ print(f'Part 1: Sum of lengths (expansion=2): {total:>14}')
 # Q: What is the sum of these lengths?
 # A: Part 1: Sum of lengths (expansion=1e6): 650672493820
 
-galaxies = catalog(image, rows, cols, expansion=int(1e6))
-pairs    = itertools.combinations(galaxies, 2)
-total    = sum(manhattan(p, q) for p, q in pairs if p != q)
-print(f'Part 2: Sum of lengths (expansion=1e6): {total}')
+def part2 (image):
+    """Returns the sum of the lengths between galaxies (expansion=1e6)."""
+    return lengths(image, expansion=int(1e6))
+
+
+if __name__ == '__main__':
+    filename = 'aoc-2023-d11.txt'
+    image    = parse(filename)
+
+    print(f'Part 1: Sum of lengths (expansion=2): {part1(image):>14}')
+    print(f'Part 2: Sum of lengths (expansion=1e6): {part2(image)}')
@@ -0,0 +1,5 @@
+# Advent of Code shared library.
+# Author: Ben Bornstein
+
+
+from aoc.readers import Digits, grid, integers, lines, mapped, records
@@ -0,0 +1,192 @@
+# Advent of Code benchmarks: repeated timing of each day's parts.
+# Author: Ben Bornstein
+
+
+import functools
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+
+import aoc.cache
+import aoc.days
+import aoc.generators
+
+
+Generated = os.path.join(tempfile.gettempdir(), 'aoc-generated')
+Heavy     = '2020/day15', '2021/day15', '2021/day18', '2020/day11'
+
+
+def benchmark (day, repeat=5, warmup=1, filename=None, cache=False, engines=False):
+    """Benchmarks `day`'s `parse()`, `part1()` and `part2()` functions and
+    returns a dictionary of timing summaries (see `summarize()`) keyed
+    by function name.  Each part is timed against the same parsed input
+    (`filename`, defaulting to `day.input`) and each summary also
+    records the (string) `answer` returned.
+
+    If `cache` is true, input is parsed through the `aoc.cache`, so
+    `parse()` is timed loading the cached (previously parsed) input.
+
+    If `engines` is true and `day` has alternative implementations,
+    i.e. an `Engines` dictionary of `engine(filename)` functions that
+    return the answers to both parts, each engine is also timed (from
+    `filename` to answers), keyed by, e.g., `engine:bitset`.
+
+    Returns `None` if `day` cannot be `aoc.days.load()`ed.
+    """
+    module   = aoc.days.load(day)
+    filename = filename or day.input
+
+    if module is None:
+        return None
+
+    parse   = functools.partial(aoc.cache.cached, module.parse) if cache else \
+              module.parse
+    results = { }
+    data    = parse(filename)
+
+    for name in aoc.days.Parts:
+        func          = parse if name == 'parse' else getattr(module, name)
+        arg           = filename if name == 'parse' else data
+        value, times  = measure(func, arg, repeat=repeat, warmup=warmup)
+        results[name] = summarize(times)
+
+        if name != 'parse':
+            results[name]['answer'] = str(value)
+
+    for name, engine in (getattr(module, 'Engines', { }) if engines else { }).items():
+        key                    = f'engine:{name}'
+        value, times           = measure(engine, filename, repeat=repeat, warmup=warmup)
+        results[key]           = summarize(times)
+        results[key]['answer'] = str(value)
+
+    return results
+
+
+def compare (current, baseline, threshold=0.10):
+    """Compares `current` benchmark results to a `baseline` (both as
+    returned by `report()`) and returns a list of regressions.  Each
+    regression is a tuple of `(day, name, before, after, reason)`,
+    where `before` and `after` are median times in seconds.
+
+    A regression is a median time more than `threshold` (a fraction)
+    slower than its `baseline` or an answer that differs from it.
+    Days or parts missing from `baseline` are ignored.
+    """
+    regressions = [ ]
+
+    for day, results in current['days'].items():
+        for name, after in results.items():
+            before = baseline['days'].get(day, { }).get(name)
+
+            if before is None:
+                continue
+
+            if before.get('answer') != after.get('answer'):
+                reason = f'answer {before.get("answer")!r} -> {after.get("answer")!r}'
+            elif after['median'] > before['median'] * (1 + threshold):
+                slower = (after['median'] / before['median']) - 1
+                reason = f'{slower:+.1%} slower'
+            else:
+                continue
+
+            regressions.append( (day, name, before['median'], after['median'], reason) )
+
+    return regressions
+
+
+def load (filename):
+    """Loads and returns benchmark results previously `save()`d to
+    `filename`.
+    """
+    with open(filename) as stream:
+        return json.load(stream)
+
+
+def measure (func, *args, repeat=5, warmup=1):
+    """Calls `func(*args)` `warmup` times (untimed) and then `repeat` more
+    times, timing each call.  Returns `(value, times)`, the value of the
+    last call and a list of wall times (in seconds).
+    """
+    times = [ ]
+    value = None
+
+    for n in range(warmup):
+        value = func(*args)
+
+    for n in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        times.append( time.perf_counter() - start )
+
+    return value, times
+
+
+def report (days, repeat=5, warmup=1, progress=None, scale=None, seed=0,
+            cache=False, engines=False):
+    """Benchmarks each of `days` (see `benchmark()`) and returns a single,
+    JSON serializable report with the results for every day and the
+    conditions (Python version, platform, etc.) they were measured
+    under.  If given, `progress(name, results)` is called after each
+    day is benchmarked.  Days that cannot be benchmarked are skipped.
+
+    If `scale` is given, days are benchmarked against synthetic inputs
+    `scale` times the size of the real ones (see `aoc.generators`),
+    which are generated once (with `seed`) and kept in `Generated`.
+    Their results are named, e.g. `2020/day09 x10`.  If `cache` is
+    true, parsed inputs are cached and if `engines` is true, alternative
+    implementations are benchmarked too (see `benchmark()`).
+    """
+    results = {
+        'python'   : platform.python_version(),
+        'platform' : platform.platform(),
+        'repeat'   : repeat,
+        'warmup'   : warmup,
+        'scale'    : scale,
+        'seed'     : seed,
+        'cache'    : cache,
+        'engines'  : engines,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'days'     : { }
+    }
+
+    for day in days:
+        name     = str(day)
+        filename = None
+
+        if scale is not None:
+            os.makedirs(Generated, exist_ok=True)
+            name     = f'{day} x{scale}'
+            filename = aoc.generators.write(day, Generated, scale, seed)
+
+        result = benchmark(day, repeat, warmup, filename, cache, engines)
+
+        if result is not None:
+            results['days'][name] = result
+
+        if progress:
+            progress(name, result)
+
+    return results
+
+
+def save (results, filename):
+    """Saves benchmark `results` to `filename` as JSON."""
+    with open(filename, 'wt') as output:
+        json.dump(results, output, indent=2)
+        output.write('\n')
+
+
+def summarize (times):
+    """Summarizes a list of `times` (in seconds) returning a dictionary
+    with the number of `runs` and the `min`, `median` and (sample)
+    `stddev` of `times`.
+    """
+    return {
+        'runs'  : len(times),
+        'min'   : min(times),
+        'median': statistics.median(times),
+        'stddev': statistics.stdev(times) if len(times) > 1 else 0.0
+    }
@@ -0,0 +1,130 @@
+# Advent of Code parsed puzzle input cache.
+# Author: Ben Bornstein
+#
+# Parsed input is pickled to `Directory` (or `$AOC_CACHE`) under a hash
+# of the input file, the source of the parser's module and the shared
+# `aoc.readers`, so editing any of them simply misses the cache.  The
+# least recently used entries are evicted once the cache exceeds
+# `Limit` bytes.
+#
+# Unpickling runs code, so the cache is per-user (`~/.cache/aoc`) and
+# only a directory and entries that are `private()`, i.e. owned by, and
+# only writable by, the current user, are ever read.
+
+
+import hashlib
+import inspect
+import os
+import pickle
+import stat
+import sys
+
+import aoc.readers
+
+
+Directory = os.environ.get('XDG_CACHE_HOME', os.path.expanduser( os.path.join('~', '.cache') ))
+Directory = os.path.join(Directory, 'aoc')
+Directory = os.environ.get('AOC_CACHE', Directory)
+Limit     = 256 << 20
+Sources   = [ aoc.readers.__file__ ]
+
+
+def cached (parse, filename, directory=Directory, limit=Limit):
+    """Returns `parse(filename)`, unpickled from the cache in `directory`
+    if it was stored there by a previous call.  Otherwise, `filename` is
+    parsed and the result is stored, unless it cannot be pickled or is
+    larger than `limit` bytes.  Each call to `parse()` must return an
+    equal result for the same input file and source, i.e. it must not
+    depend on anything else.
+
+    If `directory` is not `private()`, e.g. another user created it, the
+    cache is neither read nor written.  Entries that are not `private()`
+    are ignored (and replaced).
+    """
+    path = os.path.join(directory, digest(parse, filename) + '.pickle')
+
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    if not private(directory, stat.S_ISDIR):
+        return parse(filename)
+
+    try:
+        if private(path, stat.S_ISREG):
+            with open(path, 'rb') as stream:
+                data = pickle.load(stream)
+            os.utime(path)
+            return data
+    except FileNotFoundError:
+        pass
+    except (EOFError, pickle.UnpicklingError):
+        os.remove(path)
+
+    data = parse(filename)
+
+    try:
+        blob = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    except (AttributeError, pickle.PicklingError, RecursionError, TypeError):
+        return data
+
+    if len(blob) <= limit:
+        partial = f'{path}.{os.getpid()}.partial'
+        flags   = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+        with os.fdopen(os.open(partial, flags, 0o600), 'wb') as output:
+            output.write(blob)
+
+        os.replace(partial, path)
+        evict(directory, limit)
+
+    return data
+
+
+def digest (parse, filename):
+    """Returns a hex digest of the input `filename` and the source of the
+    `parse` function's module (and `Sources`) that parses it.
+    """
+    name = f'{sys.version_info[:2]} {parse.__module__}.{parse.__qualname__}'
+    sha  = hashlib.sha256( name.encode() )
+
+    for source in [ inspect.getsourcefile(parse) ] + Sources + [ filename ]:
+        with open(source, 'rb') as stream:
+            sha.update( hashlib.sha256( stream.read() ).digest() )
+
+    return sha.hexdigest()
+
+
+def evict (directory=Directory, limit=Limit):
+    """Removes the least recently used entries from the cache in
+    `directory` until it holds at most `limit` bytes.
+    """
+    entries = [ ]
+
+    with os.scandir(directory) as scan:
+        for entry in scan:
+            if entry.name.endswith('.pickle'):
+                stat = entry.stat()
+                entries.append( (stat.st_mtime, stat.st_size, entry.path) )
+
+    total = sum(size for _, size, _ in entries)
+
+    for mtime, size, path in sorted(entries):
+        if total <= limit:
+            break
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+        total -= size
+
+
+def private (path, kind):
+    """Indicates whether `path` (not a symbolic link) is of the given
+    `kind` (e.g. `stat.S_ISDIR`), owned by the current user and neither
+    group- nor world-writable.  Raises `FileNotFoundError` if `path` does
+    not exist.
+    """
+    info = os.lstat(path)
+    mode = info.st_mode
+    return kind(mode) and info.st_uid == os.getuid() and not mode & (stat.S_IWGRP | stat.S_IWOTH)
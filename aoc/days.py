@@ -0,0 +1,199 @@
+# Advent of Code puzzle (day) discovery and execution.
+# Author: Ben Bornstein
+
+
+import collections
+import contextlib
+import glob
+import importlib.util
+import io
+import os
+import re
+import runpy
+import subprocess
+import sys
+import time
+
+import aoc.cache
+import aoc.profiling
+
+
+Guard  = re.compile(r"^if __name__ == '__main__':", re.MULTILINE)
+Parts  = 'parse', 'part1', 'part2'
+Root   = os.path.dirname( os.path.dirname( os.path.abspath(__file__) ) )
+Result = collections.namedtuple('Result', 'day part1 part2 wall cpu error profiles',
+                                defaults=[ () ])
+
+
+class Day (collections.namedtuple('Day', 'year day script')):
+    """A single Advent of Code puzzle `day` for the given `year`, solved by
+    `script` (a full path to a Python or shell script).
+    """
+    __slots__ = ()
+
+    def __str__ (self):
+        return f'{self.year}/day{self.day:02}'
+
+    @property
+    def directory (self):
+        """The directory containing this `Day`'s script and input."""
+        return os.path.dirname(self.script)
+
+    @property
+    def input (self):
+        """The full path to this `Day`'s puzzle input."""
+        return os.path.join(self.directory, f'aoc-{self.year}-d{self.day:02}.txt')
+
+    @property
+    def module (self):
+        """The name of this `Day`'s script when imported as a module."""
+        return f'aoc_{self.year}_d{self.day:02}'
+
+
+def answers (output):
+    """Returns the `(part1, part2)` answers printed to `output` by a day's
+    script.  Lines that begin with `Part N:` (and any lines that follow
+    them) are assigned to part `N`.  If no line is labeled, the first
+    line is the Part 1 answer and all remaining lines are Part 2.
+    """
+    parts = collections.defaultdict(list)
+    lines = [ line for line in output.splitlines() if line.strip() ]
+    part  = None
+
+    for line in lines:
+        if match := re.match(r'Part (\d+)\s*:\s*(.*)', line):
+            part = int( match[1] )
+            line = match[2]
+
+        if part is not None:
+            parts[part].append(line)
+
+    if len(parts) == 0 and len(lines) > 0:
+        parts[1], parts[2] = lines[:1], lines[1:]
+
+    return tuple( '\n'.join( parts[n] ).strip() or None for n in (1, 2) )
+
+
+def cputime ():
+    """Returns the total CPU time (user and system) consumed by this
+    process and its (terminated) child processes.
+    """
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def find (years=None, days=None, root=Root):
+    """Returns a sorted list of all `Day`s found under `root`, optionally
+    restricted to the given `years` and `days` (iterables of integers).
+
+    A day's script is `YYYY/dayNN/aoc-YYYY-dNN.py`, or, if no Python
+    solution exists, `YYYY/dayNN/aoc-YYYY-dNN.sh`.
+    """
+    found = [ ]
+
+    for directory in sorted( glob.glob( os.path.join(root, '2*', 'day*') ) ):
+        year = os.path.basename( os.path.dirname(directory) )
+        day  = os.path.basename(directory)[3:]
+
+        if not (year.isdigit() and day.isdigit()):
+            continue
+
+        year, day = int(year), int(day)
+
+        if (years and year not in years) or (days and day not in days):
+            continue
+
+        for ext in '.py', '.sh':
+            script = os.path.join(directory, f'aoc-{year}-d{day:02}{ext}')
+            if os.path.exists(script):
+                found.append( Day(year, day, script) )
+                break
+
+    return found
+
+
+def load (day):
+    """Imports and returns `day`'s script as a Python module that exposes
+    `parse(filename)`, `part1(data)` and `part2(data)`.  Returns `None`
+    if the script cannot be imported without running it, i.e. it is a
+    shell script or has no `if __name__ == '__main__':` guard.
+
+    Modules are registered in `sys.modules` under `Day.module` (e.g.
+    `aoc_2020_d15`), so they are imported at most once per process.
+    """
+    module = sys.modules.get(day.module)
+
+    if module is None:
+        if not day.script.endswith('.py'):
+            return None
+
+        with open(day.script) as stream:
+            if Guard.search( stream.read() ) is None:
+                return None
+
+        spec   = importlib.util.spec_from_file_location(day.module, day.script)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[day.module] = module
+
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[day.module]
+            raise
+
+    return module if all(hasattr(module, name) for name in Parts) else None
+
+
+def run (day, profile=False, memory=False, cache=False):
+    """Runs `day`'s script from within its directory and returns a `Result`
+    with its answers and the wall and CPU time (in seconds) it took.
+    Errors are caught and reported in `Result.error`, so that one
+    failing day does not stop the others.
+
+    Days that can be `load()`ed are parsed once and both parts are
+    called directly.  Otherwise, the script is run and its answers are
+    taken from its output (see `answers()`).
+
+    If `profile` or `memory` is true, Python scripts are profiled (see
+    `aoc.profiling`), after being imported, and the profiles written are
+    listed in `Result.profiles`.  If `cache` is true, parsed input is
+    read from (and written to) the `aoc.cache`.
+    """
+    cwd    = os.getcwd()
+    error  = None
+    output = io.StringIO()
+    parts  = None
+    files  = [ ]
+    wall   = time.perf_counter()
+    cpu    = cputime()
+
+    if not day.script.endswith('.py'):
+        profile = memory = False
+
+    try:
+        os.chdir(day.directory)
+        module = load(day)
+
+        with contextlib.redirect_stdout(output), \
+             aoc.profiling.profiling(day, profile, memory) as files:
+            if module:
+                parse = module.parse
+                data  = aoc.cache.cached(parse, day.input) if cache else \
+                        parse(day.input)
+                parts = module.part1(data), module.part2(data)
+            elif day.script.endswith('.py'):
+                runpy.run_path(day.script, run_name='__main__')
+            else:
+                proc = subprocess.run(['bash', day.script], capture_output=True,
+                                      check=True, text=True)
+                output.write(proc.stdout)
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+    finally:
+        os.chdir(cwd)
+
+    wall         = time.perf_counter() - wall
+    cpu          = cputime() - cpu
+    part1, part2 = parts or answers( output.getvalue() )
+
+    return Result(day, part1, part2, wall, cpu, error, tuple(files))
@@ -0,0 +1,60 @@
+# Advent of Code synthetic puzzle input generators.
+# Author: Ben Bornstein
+#
+# Each module here, named for the day it generates input for (see
+# `aoc.days.Day.module`, e.g. `aoc_2020_d09`), exposes a single
+# `generate(scale=1, seed=0)` function that returns puzzle input text in
+# the same format as the real input, about `scale` times its size.
+# The same `scale` and `seed` always generate the same input.
+
+
+import importlib
+import os
+
+
+def filename (day, scale=1, seed=0):
+    """Returns the (base) filename for `day`'s generated input."""
+    suffix = f'-s{seed}' if seed else ''
+    return f'aoc-{day.year}-d{day.day:02}-x{scale}{suffix}.txt'
+
+
+def generate (day, scale=1, seed=0):
+    """Returns synthetic input text for `day` about `scale` times the size
+    of the real input.  Raises `LookupError` if `day` has no generator.
+    """
+    if scale < 1:
+        raise ValueError(f'scale must be at least one, not {scale}.')
+
+    return module(day).generate(scale, seed)
+
+
+def module (day):
+    """Returns the generator module for `day` or raises `LookupError`."""
+    try:
+        return importlib.import_module(f'aoc.generators.{day.module}')
+    except ModuleNotFoundError:
+        raise LookupError(f'No input generator for {day}.') from None
+
+
+def text (lines):
+    """Joins `lines` into newline terminated text."""
+    return ''.join(line + '\n' for line in lines)
+
+
+def write (day, directory, scale=1, seed=0):
+    """Generates input for `day` (see `generate()`) and writes it to
+    `directory`, unless it already exists there.  Returns the full path
+    to the generated input.
+    """
+    path = os.path.join(directory, filename(day, scale, seed))
+
+    if not os.path.exists(path):
+        content = generate(day, scale, seed)
+        partial = path + '.partial'
+
+        with open(partial, 'wt') as output:
+            output.write(content)
+
+        os.replace(partial, path)
+
+    return path
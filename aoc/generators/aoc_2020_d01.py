@@ -0,0 +1,28 @@
+# Advent of Code 2020, Day 1 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns an expense report of `200 * scale` entries with exactly one
+    pair and one triple of entries that sum to 2020.  All other entries
+    are greater than 2020, so they can never be part of a match.
+    """
+    rng     = random.Random(seed)
+    count   = 200 * scale
+    a       = rng.randint(21, 1009)
+    planted = set()
+
+    while len(planted) != 5:
+        c, d    = rng.sample(range(1, 1010), 2)
+        planted = { a, 2020 - a, c, d, 2020 - c - d }
+
+    entries = rng.sample(range(2021, 2021 + (count * 10)), count - len(planted))
+    entries.extend(planted)
+    rng.shuffle(entries)
+
+    return text( str(n) for n in entries )
@@ -0,0 +1,31 @@
+# Advent of Code 2020, Day 2 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+import string
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `1000 * scale` password policy lines, e.g. `1-3 a: abcde`.
+    Passwords are always at least as long as the policy's second number.
+    """
+    rng   = random.Random(seed)
+    lines = [ ]
+
+    for n in range(1000 * scale):
+        lo     = rng.randint(1, 15)
+        hi     = rng.randint(lo + 1, 20)
+        letter = rng.choice(string.ascii_lowercase)
+        length = rng.randint(hi, 20)
+        chars  = rng.choices(string.ascii_lowercase, k=length)
+
+        for i in rng.sample(range(length), rng.randint(0, length)):
+            if rng.random() < 0.5:
+                chars[i] = letter
+
+        lines.append(f'{lo}-{hi} {letter}: {"".join(chars)}')
+
+    return text(lines)
@@ -0,0 +1,16 @@
+# Advent of Code 2020, Day 3 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns a hill (map) `31` squares wide and `323 * scale` tall, with
+    trees (`#`) on about a quarter of its open (`.`) squares.
+    """
+    rng = random.Random(seed)
+    return text(''.join(rng.choices('.#', weights=(3, 1), k=31))
+                for n in range(323 * scale))
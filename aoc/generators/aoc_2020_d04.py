@@ -0,0 +1,67 @@
+# Advent of Code 2020, Day 4 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+Colors = 'amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth'
+Fields = 'byr', 'iyr', 'eyr', 'hgt', 'hcl', 'ecl', 'pid', 'cid'
+
+
+def field (rng, name, valid):
+    """Returns a random value for the passport field `name`, either `valid`
+    or, most likely, invalid.
+    """
+    if name == 'byr':
+        return str( rng.randint(1920, 2002) if valid else rng.randint(1900, 2030) )
+    if name == 'iyr':
+        return str( rng.randint(2010, 2020) if valid else rng.randint(2000, 2030) )
+    if name == 'eyr':
+        return str( rng.randint(2020, 2030) if valid else rng.randint(2010, 2040) )
+    if name == 'hgt':
+        if valid:
+            return rng.choice( (f'{rng.randint(150, 193)}cm', f'{rng.randint(59, 76)}in') )
+        return rng.choice( (f'{rng.randint(50, 200)}cm', f'{rng.randint(50, 200)}in',
+                            f'{rng.randint(50, 200)}') )
+    if name == 'hcl':
+        digits = '0123456789abcdef' if valid else '0123456789abcdefz'
+        value  = '#' + ''.join( rng.choices(digits, k=6) )
+        return value if valid or rng.random() < 0.5 else value[1:]
+    if name == 'ecl':
+        return rng.choice(Colors) if valid else rng.choice(Colors + ('xry', 'zzz', 'grt'))
+    if name == 'pid':
+        return ''.join( rng.choices('0123456789', k=9 if valid else rng.randint(7, 11)) )
+    if name == 'cid':
+        return str( rng.randint(50, 350) )
+
+
+def generate (scale=1, seed=0):
+    """Returns `290 * scale` passports, separated by blank lines, whose
+    fields (in random order, across one or more lines) are sometimes
+    missing and sometimes invalid.
+    """
+    rng   = random.Random(seed)
+    lines = [ ]
+
+    for n in range(290 * scale):
+        fields = list(Fields)
+        valid  = rng.random() < 0.6
+
+        if rng.random() < 0.3:
+            fields.remove( rng.choice(fields) )
+
+        rng.shuffle(fields)
+        fields = [ f'{name}:{field(rng, name, valid or rng.random() < 0.8)}'
+                   for name in fields ]
+
+        while fields:
+            k = rng.randint(1, 4)
+            lines.append( ' '.join(fields[:k]) )
+            del fields[:k]
+
+        lines.append('')
+
+    return text(lines[:-1])
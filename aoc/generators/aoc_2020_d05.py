@@ -0,0 +1,29 @@
+# Advent of Code 2020, Day 5 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns the boarding passes for `scale` flights of the same plane.
+    Each flight is full, except for the seats at the very front and
+    back and the same one (missing) seat in the middle.
+
+    A boarding pass encodes a seat in ten characters, so there are at
+    most 1024 seats on a plane; larger inputs must repeat seats.
+    """
+    rng     = random.Random(seed)
+    first   = rng.randint(8, 100)
+    last    = rng.randint(900, 1015)
+    missing = rng.randint(first + 1, last - 1)
+    seats   = [ s for s in range(first, last + 1) if s != missing ] * scale
+    rows    = str.maketrans('01', 'FB')
+    cols    = str.maketrans('01', 'LR')
+
+    rng.shuffle(seats)
+
+    return text(f'{s >> 3:07b}'.translate(rows) + f'{s & 7:03b}'.translate(cols)
+                for s in seats)
@@ -0,0 +1,30 @@
+# Advent of Code 2020, Day 6 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+import string
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `480 * scale` groups of customs declaration answers,
+    separated by blank lines.  Each group has one to five people (lines)
+    whose answers (letters) overlap with one another.
+    """
+    rng   = random.Random(seed)
+    lines = [ ]
+
+    for n in range(480 * scale):
+        common = rng.sample(string.ascii_lowercase, rng.randint(0, 12))
+
+        for p in range( rng.randint(1, 5) ):
+            extra = rng.sample(string.ascii_lowercase, rng.randint(0, 10))
+            yes   = list( dict.fromkeys(common + extra) ) or [ rng.choice('abc') ]
+            rng.shuffle(yes)
+            lines.append( ''.join(yes) )
+
+        lines.append('')
+
+    return text(lines[:-1])
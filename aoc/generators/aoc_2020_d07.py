@@ -0,0 +1,71 @@
+# Advent of Code 2020, Day 7 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+Adjectives = ('bright', 'clear', 'dark', 'dim', 'dotted', 'drab', 'dull', 'faded',
+              'light', 'mirrored', 'muted', 'pale', 'plaid', 'posh', 'shiny',
+              'striped', 'vibrant', 'wavy')
+Colors     = ('aqua', 'beige', 'black', 'blue', 'bronze', 'brown', 'chartreuse',
+              'coral', 'crimson', 'cyan', 'fuchsia', 'gold', 'gray', 'green',
+              'indigo', 'lavender', 'lime', 'magenta', 'maroon', 'olive',
+              'orange', 'plum', 'purple', 'red', 'salmon', 'silver', 'tan',
+              'teal', 'tomato', 'turquoise', 'violet', 'white', 'yellow')
+Levels     = 8
+
+
+def generate (scale=1, seed=0):
+    """Returns `594 * scale` bag rules, e.g.:
+
+        light red bags contain 1 bright white bag, 2 muted yellow bags.
+
+    Bags are arranged in `Levels` levels and only contain bags from the
+    level below them, so rules never loop and the number of bags inside
+    any one bag stays bounded.  The shiny gold bag is in the middle
+    level.
+
+    Real colors are two words (an adjective and a color), but there are
+    too few of them for large inputs, so invented adjectives are used
+    once the real ones run out.
+    """
+    rng    = random.Random(seed)
+    count  = 594 * scale
+    colors = [ f'{a} {c}' for a in Adjectives for c in Colors ]
+
+    while len(colors) < count:
+        word = ''.join( rng.choices('bcdfghjklmnprstvwz', k=3) )
+        word = word[0] + rng.choice('aeiou') + word[1:] + rng.choice('aeiouy')
+        colors.extend( f'{word} {c}' for c in Colors )
+
+    colors = list( dict.fromkeys(colors) )
+    colors.remove('shiny gold')
+    colors = rng.sample(colors, count - 1)
+    levels = [ colors[n::Levels] for n in range(Levels) ]
+    levels[Levels // 2].append('shiny gold')
+    lines  = [ ]
+
+    for n, level in enumerate(levels):
+        for color in level:
+            if n == Levels - 1 or (color != 'shiny gold' and rng.random() < 0.1):
+                lines.append(f'{color} bags contain no other bags.')
+                continue
+
+            inside   = rng.sample(levels[n + 1], rng.randint(1, 4))
+
+            if n == (Levels // 2) - 1 and 'shiny gold' not in inside:
+                if rng.random() < 0.05:
+                    inside.append('shiny gold')
+            contents = [ ]
+
+            for c in inside:
+                qty = rng.randint(1, 5)
+                contents.append(f'{qty} {c} bag{"s" if qty > 1 else ""}')
+
+            lines.append(f'{color} bags contain {", ".join(contents)}.')
+
+    rng.shuffle(lines)
+    return text(lines)
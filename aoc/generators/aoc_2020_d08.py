@@ -0,0 +1,47 @@
+# Advent of Code 2020, Day 8 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns a boot code program of `650 * scale` instructions that loops
+    forever, but terminates if (exactly) one `jmp` is changed to a `nop`.
+
+    Every instruction before a (loop) `jmp`, well past the middle of
+    the program, jumps forward, but never past it.  So, every path
+    reaches the loop `jmp`, which jumps back to an earlier instruction
+    on the path, and no other `jmp` or `nop` change can avoid it.
+    """
+    rng     = random.Random(seed)
+    count   = 650 * scale
+    loop    = rng.randrange(count // 2, count - (count // 10))
+    program = [ ]
+
+    for pc in range(count):
+        end = loop if pc < loop else count
+        op  = rng.choices( ('acc', 'jmp', 'nop'), weights=(5, 3, 2) )[0]
+
+        if op == 'acc':
+            arg = rng.randint(-50, 50)
+        elif op == 'jmp':
+            arg = rng.randint(1, max(1, min(20, end - pc)))
+        else:
+            arg = rng.randint(-pc, end - pc)
+
+        program.append( [op, arg] )
+
+    path = [ ]
+    pc   = 0
+
+    while pc < loop:
+        path.append(pc)
+        op, arg = program[pc]
+        pc     += arg if op == 'jmp' else 1
+
+    program[loop] = ['jmp', rng.choice(path) - loop]
+
+    return text(f'{op} {arg:+d}' for op, arg in program)
@@ -0,0 +1,84 @@
+# Advent of Code 2020, Day 9 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import itertools
+import random
+
+from aoc.generators import text
+
+
+Limit    = 1000
+Preamble = 25
+
+
+def generate (scale=1, seed=0):
+    """Returns `1000 * scale` XMAS numbers where each number after the
+    `Preamble` is the sum of two (different) numbers among the `Preamble`
+    before it, up to the first invalid number.
+
+    Every valid number is larger than the smallest in its window, so
+    valid numbers grow exponentially with their position (by more than
+    a digit every hundred numbers) and would soon overflow 64 bits.  So
+    the invalid number is always among the first `Limit` numbers, and
+    the numbers after it are random (but larger than it).
+
+    The invalid number is the sum of a single contiguous range of (at
+    least four) earlier numbers.  The first and last numbers of the range
+    and the numbers just outside it are neither the smallest nor the
+    largest in the range.
+    """
+    rng     = random.Random(seed)
+    invalid = rng.randrange(Limit // 2, (3 * Limit) // 4)
+
+    while True:
+        numbers = rng.sample(range(1, 2 * Preamble), Preamble)
+
+        while len(numbers) < invalid:
+            numbers.append( xmas(rng, numbers[-Preamble:]) )
+
+        for attempt in range(100):
+            j = rng.randrange(invalid // 2, invalid - Preamble)
+            i = j - rng.randint(4, 17)
+            r = numbers[i:j]
+            n = sum(r)
+
+            if valid(numbers[-Preamble:], n) or min(r) in (r[0], r[-1]) or \
+               max(r) in (r[0], r[-1]) or not (min(r) < numbers[i - 1] < max(r)) or \
+               not (min(r) < numbers[j] < max(r)):
+                continue
+
+            if ranges(numbers, n) == 1:
+                numbers.append(n)
+                numbers.extend( rng.randrange(n + 1, 2**62) for k in
+                                range((1000 * scale) - len(numbers)) )
+                return text( str(n) for n in numbers )
+
+        invalid += 1
+
+
+def ranges (numbers, n):
+    """Returns the number of contiguous ranges of at least two `numbers`
+    that sum to `n`.
+    """
+    found  = 0
+    starts = { 0: 0 }
+
+    for j, total in enumerate( itertools.accumulate(numbers), start=1 ):
+        if (k := starts.get(total - n)) is not None and k < j - 1:
+            found += 1
+        starts[total] = j
+
+    return found
+
+
+def valid (window, n):
+    """Indicates whether `n` is the sum of two different numbers in `window`."""
+    return any((n - m) in window and (n - m) != m for m in window)
+
+
+def xmas (rng, window):
+    """Returns a valid next number for `window`, near the smallest possible."""
+    values = sorted( set(window) )
+    a, b   = rng.sample(values[:6], 2)
+    return a + b
@@ -0,0 +1,30 @@
+# Advent of Code 2020, Day 10 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `93 * scale` distinct adapter joltages (in random order)
+    that differ from one another, once sorted, by either one or three
+    jolts, with runs of no more than four one-jolt differences.
+    """
+    rng      = random.Random(seed)
+    adapters = [ ]
+    jolts    = 0
+    ones     = 0
+
+    while len(adapters) < 93 * scale:
+        if ones < 4 and rng.random() < 0.65:
+            jolts += 1
+            ones  += 1
+        else:
+            jolts += 3
+            ones   = 0
+        adapters.append(jolts)
+
+    rng.shuffle(adapters)
+    return text( str(n) for n in adapters )
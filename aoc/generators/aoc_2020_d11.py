@@ -0,0 +1,101 @@
+# Advent of Code 2020, Day 11 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import itertools
+import math
+import random
+
+from aoc.generators import text
+
+
+Directions = [ d for d in itertools.product((-1, 0, 1), repeat=2) if d != (0, 0) ]
+
+
+def aisles (rng, size):
+    """Returns a set of (row or column) aisle positions within `size`."""
+    result = set()
+    pos    = rng.randint(3, 8)
+
+    while pos < size:
+        result.add(pos)
+        pos += rng.randint(5, 9)
+
+    return result
+
+
+def generate (scale=1, seed=0):
+    """Returns a seating area with `scale` times as many positions as the
+    real one (98 rows of 91).  As in the real input, about a tenth of the
+    positions are floor (`.`), except for aisles (rows and columns every
+    five to nine positions) which are mostly floor.  All other positions
+    are empty seats (`L`).
+
+    Random seating areas do not always settle; some seats may flip
+    between empty and occupied forever.  Such seats are found (see
+    `unsettled()`) and replaced by floor until the area settles under
+    the rules of both parts.
+    """
+    rng   = random.Random(seed)
+    nrows = round( 98 * math.sqrt(scale) )
+    ncols = round( 91 * math.sqrt(scale) )
+    rows  = aisles(rng, nrows)
+    cols  = aisles(rng, ncols)
+    area  = [ ]
+
+    for r in range(nrows):
+        floor = [ 0.72 if (r in rows or c in cols) else 0.1 for c in range(ncols) ]
+        area.append([ '.' if rng.random() < f else 'L' for f in floor ])
+
+    while seats := unsettled(area, 4, sight=False) | unsettled(area, 5, sight=True):
+        for r, c in seats:
+            area[r][c] = '.'
+
+    return text( ''.join(row) for row in area )
+
+
+def unsettled (area, threshold, sight, limit=1000):
+    """Simulates the seating `area` (a list of lists of `L` and `.`) for at
+    most `limit` rounds and returns the set of `(row, col)` seats still
+    changing state after that, i.e. an empty set if the area settles.
+
+    Occupied seats empty when `threshold` or more of their neighbors are
+    occupied.  If `sight` is true, neighbors are the first seats seen
+    in each direction, otherwise only the adjacent seats.
+    """
+    nrows = len(area)
+    ncols = len(area[0])
+    seats = [ (r, c) for r in range(nrows) for c in range(ncols) if area[r][c] == 'L' ]
+    index = { seat: n for n, seat in enumerate(seats) }
+    nbors = [ [ ] for seat in seats ]
+
+    for n, (r, c) in enumerate(seats):
+        for dr, dc in Directions:
+            nr, nc = r + dr, c + dc
+
+            while 0 <= nr < nrows and 0 <= nc < ncols:
+                if area[nr][nc] == 'L':
+                    nbors[n].append( index[(nr, nc)] )
+                    break
+                if not sight:
+                    break
+                nr, nc = nr + dr, nc + dc
+
+    occupied = bytearray( len(seats) )
+    count    = [ 0 ] * len(seats)
+
+    for step in range(limit):
+        flips = [ n for n, (o, k) in enumerate( zip(occupied, count) )
+                  if (k >= threshold if o else k == 0) ]
+
+        if len(flips) == 0:
+            return set()
+
+        for n in flips:
+            occupied[n] ^= 1
+            delta        = 1 if occupied[n] else -1
+
+            for m in nbors[n]:
+                count[m] += delta
+
+    return { seats[n] for n in flips }
@@ -0,0 +1,27 @@
+# Advent of Code 2020, Day 12 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `780 * scale` navigation instructions, e.g. `F10` or `R90`.
+    Turns (`L` and `R`) are always by 90, 180 or 270 degrees.
+    """
+    rng   = random.Random(seed)
+    steps = [ ]
+
+    for n in range(780 * scale):
+        action = rng.choices('NSEWLRF', weights=(2, 2, 2, 2, 2, 2, 4))[0]
+
+        if action in 'LR':
+            value = rng.choices( (90, 180, 270), weights=(6, 2, 1) )[0]
+        else:
+            value = rng.randint(1, 100)
+
+        steps.append(f'{action}{value}')
+
+    return text(steps)
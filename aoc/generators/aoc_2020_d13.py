@@ -0,0 +1,46 @@
+# Advent of Code 2020, Day 13 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns an earliest departure time and a schedule of `9 * scale` bus
+    IDs among about eight times as many out of service (`x`) buses.  Bus
+    IDs are distinct primes, so the offsets in the schedule always have
+    a solution, and exactly one bus departs first after the earliest
+    departure time.  The schedule starts and ends with a bus.
+    """
+    rng      = random.Random(seed)
+    count    = 9 * scale
+    primes   = sieve( max(1000, 30 * count) )[3:]
+    buses    = rng.sample(primes, count)
+    schedule = [ str(b) for b in buses[1:-1] ] + [ 'x' ] * (8 * count)
+
+    rng.shuffle(schedule)
+    schedule = [ str(buses[0]) ] + schedule + [ str(buses[-1]) ]
+
+    while True:
+        depart = rng.randint(100000, 10000000)
+        waits  = sorted(-depart % b for b in buses)
+
+        if waits[0] != waits[1]:
+            break
+
+    return text([ str(depart), ','.join(schedule) ])
+
+
+def sieve (n):
+    """Returns a list of all primes less than `n`."""
+    composite = bytearray(n)
+    primes    = [ ]
+
+    for p in range(2, n):
+        if not composite[p]:
+            primes.append(p)
+            composite[p * p::p] = b'\x01' * len( range(p * p, n, p) )
+
+    return primes
@@ -0,0 +1,35 @@
+# Advent of Code 2020, Day 14 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns an initialization program of `100 * scale` bitmasks, each
+    followed by one to eight memory writes, e.g.:
+
+        mask = 100110001110110011001X101110X1XX10X1
+        mem[62998] = 9708340
+
+    Masks have no more than nine floating (`X`) bits, as each write in
+    version 2 of the decoder writes to two to the power of that many
+    addresses.
+    """
+    rng   = random.Random(seed)
+    lines = [ ]
+
+    for n in range(100 * scale):
+        mask = rng.choices('01', k=36)
+
+        for i in rng.sample(range(36), rng.randint(0, 9)):
+            mask[i] = 'X'
+
+        lines.append(f'mask = {"".join(mask)}')
+
+        for w in range( rng.randint(1, 8) ):
+            lines.append(f'mem[{rng.randrange(65536)}] = {rng.randrange(2**30)}')
+
+    return text(lines)
@@ -0,0 +1,22 @@
+# Advent of Code 2020, Day 15 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+Limit = 1000
+
+
+def generate (scale=1, seed=0):
+    """Returns `7 * scale` (at most `Limit`) distinct starting numbers,
+    e.g. `0,13,16,17,1,10,6`.
+
+    The cost of this puzzle is set by the number of turns played, not
+    the input, so larger inputs only lengthen the game's opening.
+    """
+    rng   = random.Random(seed)
+    count = min(7 * scale, Limit)
+    return text([ ','.join( str(n) for n in rng.sample(range(3 * count), count) ) ])
@@ -0,0 +1,76 @@
+# Advent of Code 2020, Day 16 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+Fields = ('departure location', 'departure station', 'departure platform',
+          'departure track', 'departure date', 'departure time',
+          'arrival location', 'arrival station', 'arrival platform',
+          'arrival track', 'class', 'duration', 'price', 'route', 'row',
+          'seat', 'train', 'type', 'wagon', 'zone')
+
+
+def generate (scale=1, seed=0):
+    """Returns ticket field rules, your ticket and `240 * scale` nearby
+    tickets, about a quarter of which have an invalid value.
+
+    Every rule `a-b or c-d` excludes a different (gap) range `b+1` to
+    `c-1`.  Rules are ranked and the values of the field (column) for
+    the rule ranked `k` fall in the gaps of every lower ranked rule, but
+    no other.  So the lowest ranked rule matches only its own field, the
+    next lowest only its own field and that one, and so on, and the
+    fields can be deduced one at a time.
+    """
+    rng     = random.Random(seed)
+    nfields = len(Fields)
+    names   = rng.sample(Fields, nfields)
+    columns = rng.sample(range(nfields), nfields)
+    gaps    = [ ]
+    lines   = [ ]
+
+    for k in range(nfields):
+        start = 60 + (43 * k) + rng.randint(0, 10)
+        gaps.append( (start, start + rng.randint(5, 30)) )
+
+    for name in Fields:
+        k      = names.index(name)
+        lo, hi = rng.randint(25, 50), rng.randint(945, 975)
+        lines.append(f'{name}: {lo}-{gaps[k][0] - 1} or {gaps[k][1] + 1}-{hi}')
+
+    tickets = [ ]
+    invalid = [ n for n in range(1, 1 + (240 * scale)) if rng.random() < 0.25 ]
+    valid   = sorted( set(range(1 + (240 * scale))) - set(invalid) )
+
+    for n in range(1 + (240 * scale)):
+        ticket = [ 0 ] * nfields
+        for k in range(nfields):
+            ticket[ columns[k] ] = value(rng, gaps, k)
+        tickets.append(ticket)
+
+    for k in range(nfields):
+        for g, n in enumerate( rng.sample(valid, k) ):
+            tickets[n][ columns[k] ] = rng.randint(*gaps[g])
+
+    for n in invalid:
+        tickets[n][ rng.randrange(nfields) ] = rng.choice( (rng.randint(0, 24),
+                                                            rng.randint(976, 999)) )
+
+    lines.extend([ '', 'your ticket:', ','.join( str(v) for v in tickets[0] ) ])
+    lines.extend([ '', 'nearby tickets:' ])
+    lines.extend( ','.join( str(v) for v in ticket ) for ticket in tickets[1:] )
+
+    return text(lines)
+
+
+def value (rng, gaps, k):
+    """Returns a random value for the field of the rule ranked `k`, i.e. one
+    outside the `gaps` of rule `k` and every rule ranked above it.
+    """
+    while True:
+        v = rng.randint(50, 945)
+        if not any(lo <= v <= hi for lo, hi in gaps[k:]):
+            return v
@@ -0,0 +1,17 @@
+# Advent of Code 2020, Day 17 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import math
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns an initial (square) slice of Conway Cubes with `scale` times
+    as many cubes as the real `8x8` one, about half of them active (`#`).
+    """
+    rng  = random.Random(seed)
+    side = round( 8 * math.sqrt(scale) )
+    return text(''.join( rng.choices('.#', k=side) ) for r in range(side))
@@ -0,0 +1,36 @@
+# Advent of Code 2020, Day 18 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def expression (rng, depth=0):
+    """Returns a random expression of single digits, additions (`+`),
+    multiplications (`*`) and parentheses, nested at most three deep.
+    """
+    terms = [ ]
+
+    for n in range( rng.randint(2, 6) ):
+        if depth < 3 and rng.random() < 0.25:
+            terms.append( '(' + expression(rng, depth + 1) + ')' )
+        else:
+            terms.append( str( rng.randint(2, 9) ) )
+
+    result = terms[0]
+
+    for term in terms[1:]:
+        result += rng.choice( (' + ', ' * ') ) + term
+
+    return result
+
+
+def generate (scale=1, seed=0):
+    """Returns `374 * scale` homework expressions, e.g.:
+
+        2 * 3 + (4 * 5)
+    """
+    rng = random.Random(seed)
+    return text( expression(rng) for n in range(374 * scale) )
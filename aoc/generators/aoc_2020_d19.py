@@ -0,0 +1,70 @@
+# Advent of Code 2020, Day 19 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+Length = 8
+
+
+def generate (scale=1, seed=0):
+    """Returns message rules and `470 * scale` messages.
+
+    As in the real input, rule `0: 8 11` (with `8: 42` and `11: 42 31`)
+    and rules `42` and `31` each match `Length` characters.  Here, rule
+    `42` matches words with an even number of `b`s and rule `31` words
+    with an odd number.  Rules for shorter words are numbered at random.
+
+    About a quarter of the messages match rule 0, another quarter match
+    the looping version (`42` M times then `31` N times, where `M > N`)
+    and the rest are random.
+    """
+    rng      = random.Random(seed)
+    reserved = 0, 8, 11, 31, 42
+    ids      = [ n for n in range(2 * Length + 8) if n not in reserved ]
+    ids      = rng.sample(ids, 2 * (Length - 1))
+    rules    = { (Length, 0): 42, (Length, 1): 31 }
+    lines    = [ '0: 8 11', '8: 42', '11: 42 31' ]
+
+    for length in range(1, Length):
+        for parity in 0, 1:
+            rules[ (length, parity) ] = ids.pop()
+
+    lines.append(f'{rules[(1, 0)]}: "a"')
+    lines.append(f'{rules[(1, 1)]}: "b"')
+
+    for length in range(2, Length + 1):
+        for parity in 0, 1:
+            a = rules[ (1, 0) ], rules[ (length - 1, parity) ]
+            b = rules[ (1, 1) ], rules[ (length - 1, 1 - parity) ]
+            lines.append(f'{rules[(length, parity)]}: {a[0]} {a[1]} | {b[0]} {b[1]}')
+
+    rng.shuffle(lines)
+    lines.append('')
+
+    for n in range(470 * scale):
+        kind = rng.random()
+
+        if kind < 0.25:
+            words = [ 0, 0, 1 ]
+        elif kind < 0.5:
+            m     = rng.randint(2, 8)
+            words = ([ 0 ] * m) + ([ 1 ] * rng.randint(1, m - 1))
+        else:
+            words = [ rng.randint(0, 1) for w in range( rng.randint(3, 9) ) ]
+
+        lines.append( ''.join( word(rng, parity) for parity in words ) )
+
+    return text(lines)
+
+
+def word (rng, parity):
+    """Returns a random word of `Length` characters with an even (`parity`
+    0) or odd (`parity` 1) number of `b`s.
+    """
+    chars = rng.choices('ab', k=Length - 1)
+    last  = 'b' if (chars.count('b') % 2) != parity else 'a'
+    return ''.join(chars) + last
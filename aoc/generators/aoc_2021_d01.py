@@ -0,0 +1,22 @@
+# Advent of Code 2021, Day 1 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `2000 * scale` sonar sweep depths, a random walk that mostly
+    (but not always) increases.
+    """
+    rng    = random.Random(seed)
+    depth  = rng.randint(100, 200)
+    depths = [ ]
+
+    for n in range(2000 * scale):
+        depth = max(1, depth + rng.randint(-8, 12))
+        depths.append(depth)
+
+    return text( str(d) for d in depths )
@@ -0,0 +1,28 @@
+# Advent of Code 2021, Day 2 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `1000 * scale` submarine commands, e.g. `forward 5`, that
+    never take the submarine above the surface.
+    """
+    rng      = random.Random(seed)
+    commands = [ ]
+    depth    = 0
+
+    for n in range(1000 * scale):
+        command = rng.choice( ('forward', 'down', 'up') )
+        units   = rng.randint(1, 9)
+
+        if command == 'up' and depth - units < 0:
+            command = 'down'
+
+        depth += units if command == 'down' else -units if command == 'up' else 0
+        commands.append(f'{command} {units}')
+
+    return text(commands)
@@ -0,0 +1,43 @@
+# Advent of Code 2021, Day 3 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `1000 * scale` distinct binary numbers (diagnostic report
+    lines) at least 12 bits wide and two bits wider than needed to
+    number them all.
+
+    The oxygen generator and CO2 scrubber ratings must each narrow down
+    to a single number before the last bit position, so numbers are
+    redrawn until they do (see `narrows()`).
+    """
+    rng   = random.Random(seed)
+    count = 1000 * scale
+    width = max(12, count.bit_length() + 2)
+
+    while True:
+        numbers = [ f'{n:0{width}b}' for n in rng.sample(range(2**width), count) ]
+
+        if narrows(numbers, '1', '0') and narrows(numbers, '0', '1'):
+            return text(numbers)
+
+
+def narrows (numbers, common, uncommon):
+    """Indicates whether keeping only the `numbers` with the `common` bit
+    value (`uncommon` if fewer numbers have it) at each successive bit
+    position leaves a single number before the last position.
+    """
+    for pos in range( len(numbers[0]) - 1 ):
+        ones    = sum(1 for n in numbers if n[pos] == '1')
+        keep    = common if ones >= len(numbers) - ones else uncommon
+        numbers = [ n for n in numbers if n[pos] == keep ]
+
+        if len(numbers) == 1:
+            return True
+
+    return False
@@ -0,0 +1,23 @@
+# Advent of Code 2021, Day 4 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns the order in which the numbers `0` to `99` are drawn and
+    `100 * scale` 5x5 bingo boards of distinct numbers in that range.
+    """
+    rng   = random.Random(seed)
+    draws = rng.sample(range(100), 100)
+    lines = [ ','.join( str(n) for n in draws ) ]
+
+    for b in range(100 * scale):
+        board = rng.sample(range(100), 25)
+        lines.append('')
+        lines.extend( ' '.join(f'{n:2}' for n in board[r:r + 5]) for r in range(0, 25, 5) )
+
+    return text(lines)
@@ -0,0 +1,37 @@
+# Advent of Code 2021, Day 5 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `500 * scale` lines of hydrothermal vents, e.g.:
+
+        0,9 -> 5,9
+
+    Lines are horizontal, vertical or diagonal (at exactly 45 degrees)
+    and lie within a `1000x1000` area.
+    """
+    rng   = random.Random(seed)
+    lines = [ ]
+
+    for n in range(500 * scale):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        kind   = rng.choice('HVD')
+
+        if kind == 'H':
+            x2, y2 = rng.randrange(1000), y1
+        elif kind == 'V':
+            x2, y2 = x1, rng.randrange(1000)
+        else:
+            dx, dy = rng.choice( (-1, 1) ), rng.choice( (-1, 1) )
+            limit  = min(x1 if dx < 0 else 999 - x1, y1 if dy < 0 else 999 - y1)
+            length = rng.randint(0, limit)
+            x2, y2 = x1 + (dx * length), y1 + (dy * length)
+
+        lines.append(f'{x1},{y1} -> {x2},{y2}')
+
+    return text(lines)
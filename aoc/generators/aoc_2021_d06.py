@@ -0,0 +1,15 @@
+# Advent of Code 2021, Day 6 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns the internal timers (`1` to `5`) of `300 * scale` lanternfish
+    on a single line, e.g. `3,4,3,1,2`.
+    """
+    rng = random.Random(seed)
+    return text([ ','.join( str( rng.randint(1, 5) ) for n in range(300 * scale) ) ])
@@ -0,0 +1,17 @@
+# Advent of Code 2021, Day 7 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns the horizontal positions of `1000 * scale` crabs on a single
+    line, e.g. `16,1,2,0,4,2,7,1,2,14`.  Most crabs are near the low end
+    of the range `0` to `2000`.
+    """
+    rng = random.Random(seed)
+    return text([ ','.join( str( min(2000, int( rng.expovariate(1 / 400) )) )
+                            for n in range(1000 * scale) ) ])
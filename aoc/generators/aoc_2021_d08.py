@@ -0,0 +1,38 @@
+# Advent of Code 2021, Day 8 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+Digits = ('abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf',
+          'abcdefg', 'abcdfg')
+
+
+def generate (scale=1, seed=0):
+    """Returns `200 * scale` notes of ten unique signal patterns (the digits
+    `0` to `9`) and a four digit output value, e.g.:
+
+        be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
+
+    Each note has its own random wiring of segments and the letters of
+    each pattern are shuffled.
+    """
+    rng   = random.Random(seed)
+    lines = [ ]
+
+    for n in range(200 * scale):
+        wiring  = dict( zip('abcdefg', rng.sample('abcdefg', 7)) )
+        signals = [ wire(rng, wiring, d) for d in rng.sample(range(10), 10) ]
+        output  = [ wire(rng, wiring, rng.randrange(10)) for d in range(4) ]
+        lines.append(f'{" ".join(signals)} | {" ".join(output)}')
+
+    return text(lines)
+
+
+def wire (rng, wiring, digit):
+    """Returns the (shuffled) signal pattern for `digit` given `wiring`."""
+    segments = [ wiring[s] for s in Digits[digit] ]
+    return ''.join( rng.sample(segments, len(segments)) )
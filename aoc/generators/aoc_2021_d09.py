@@ -0,0 +1,49 @@
+# Advent of Code 2021, Day 9 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import math
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns a heightmap with `scale` times as many locations as the real
+    `100x100` one.
+
+    Walls of height `9` (rows and columns every three to ten locations)
+    divide the map into rectangular basins.  Each basin has a single
+    low point and its heights never decrease with (Manhattan) distance
+    from it.
+    """
+    rng     = random.Random(seed)
+    side    = round( 100 * math.sqrt(scale) )
+    heights = [ [ 9 ] * side for r in range(side) ]
+    rows    = walls(rng, side)
+    cols    = walls(rng, side)
+
+    for r0, r1 in zip(rows, rows[1:]):
+        for c0, c1 in zip(cols, cols[1:]):
+            lr, lc = rng.randrange(r0 + 1, r1), rng.randrange(c0 + 1, c1)
+            base   = rng.randint(0, 3)
+            slope  = rng.uniform(1, 2.5)
+
+            for r in range(r0 + 1, r1):
+                for c in range(c0 + 1, c1):
+                    distance      = abs(r - lr) + abs(c - lc)
+                    heights[r][c] = min(8, base + int(distance * slope))
+
+    return text( ''.join( str(h) for h in row ) for row in heights )
+
+
+def walls (rng, side):
+    """Returns the (sorted) positions of walls within `side` locations,
+    including walls just outside either end.
+    """
+    result = [ -1 ]
+
+    while side - result[-1] > 11:
+        result.append( result[-1] + rng.randint(3, 10) )
+
+    return result + [ side ]
@@ -0,0 +1,50 @@
+# Advent of Code 2021, Day 10 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+Closes = { '(': ')', '[': ']', '{': '}', '<': '>' }
+
+
+def generate (scale=1, seed=0):
+    """Returns `94 * scale` lines of navigation subsystem chunks, e.g.
+    `[({(<(())[]>[[{[]{<()<>>`.  About half of the lines are corrupted
+    (a chunk closes with the wrong character) and the rest, an odd
+    number of lines, are incomplete.  No line closes a chunk before
+    opening one.
+    """
+    rng     = random.Random(seed)
+    count   = 94 * scale
+    corrupt = count // 2
+    lines   = [ ]
+
+    if (count - corrupt) % 2 == 0:
+        corrupt += 1
+
+    for n in range(count):
+        stack  = [ ]
+        chars  = [ ]
+        length = rng.randint(90, 110)
+        broken = n < corrupt
+        where  = rng.randrange(length // 4, length) if broken else None
+
+        while len(chars) < length or len(stack) == 0:
+            if broken and len(chars) >= where and len(stack) > 0:
+                wrong = [ c for c in Closes.values() if c != Closes[ stack[-1] ] ]
+                chars.append( rng.choice(wrong) )
+                chars.extend( rng.choices('([{<)]}>', k=length - len(chars)) )
+                break
+            elif len(stack) > 0 and rng.random() < 0.45:
+                chars.append( Closes[ stack.pop() ] )
+            else:
+                stack.append( rng.choice('([{<') )
+                chars.append( stack[-1] )
+
+        lines.append( ''.join(chars) )
+
+    rng.shuffle(lines)
+    return text(lines)
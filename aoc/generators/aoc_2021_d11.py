@@ -0,0 +1,81 @@
+# Advent of Code 2021, Day 11 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import math
+import random
+
+from aoc.generators import text
+
+
+Limit = 1000
+
+
+def generate (scale=1, seed=0):
+    """Returns a square grid of octopus energy levels (`0` to `9`) with
+    `scale` times as many octopuses as the real `10x10` one.
+
+    Random grids (larger than the real one) seldom synchronize, i.e.
+    all octopuses never flash during the same step.  So, most of the
+    grid starts at the same energy level (with a little noise), save for
+    a random patch about the size of the real grid, which is eventually
+    absorbed.  Grids are redrawn until all octopuses flash at the same
+    time after step 100, but no later than step `Limit`.
+    """
+    rng  = random.Random(seed)
+    side = round( 10 * math.sqrt(scale) )
+
+    while True:
+        level  = rng.randint(0, 9)
+        grid   = [ rng.randint(0, 9) if rng.random() < 0.05 else level
+                   for n in range(side * side) ]
+        size   = min( side, rng.randint(10, 16) )
+        r0, c0 = rng.randint(0, side - size), rng.randint(0, side - size)
+
+        for r in range(r0, r0 + size):
+            for c in range(c0, c0 + size):
+                grid[(r * side) + c] = rng.randint(0, 9)
+
+        if 100 < (synchronized(grid, side) or 0):
+            break
+
+    return text( ''.join( str(n) for n in grid[r:r + side] )
+                 for r in range(0, side * side, side) )
+
+
+def synchronized (grid, side):
+    """Returns the first step (up to `Limit`) during which all octopuses in
+    `grid`, a flat list of energy levels `side` octopuses square, flash,
+    or `None` if they never do.
+    """
+    ncells = side * side
+    nbors  = [ ]
+
+    for r in range(side):
+        for c in range(side):
+            nbors.append([ (nr * side) + nc
+                           for nr in range( max(0, r - 1), min(side, r + 2) )
+                           for nc in range( max(0, c - 1), min(side, c + 2) )
+                           if (nr, nc) != (r, c) ])
+
+    grid = list(grid)
+
+    for step in range(1, Limit + 1):
+        grid    = [ n + 1 for n in grid ]
+        flashes = [ n for n in range(ncells) if grid[n] > 9 ]
+        flashed = set(flashes)
+
+        while flashes:
+            for m in nbors[ flashes.pop() ]:
+                grid[m] += 1
+                if grid[m] > 9 and m not in flashed:
+                    flashed.add(m)
+                    flashes.append(m)
+
+        for n in flashed:
+            grid[n] = 0
+
+        if len(flashed) == ncells:
+            return step
+
+    return None
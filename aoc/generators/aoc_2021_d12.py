@@ -0,0 +1,73 @@
+# Advent of Code 2021, Day 12 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import math
+import random
+import string
+
+from aoc.generators import text
+
+
+def connected (edges):
+    """Indicates whether `edges` connect `start` to `end`."""
+    seen  = { 'start' }
+    queue = [ 'start' ]
+
+    while queue:
+        cave = queue.pop()
+        for a, b in edges:
+            for src, dst in (a, b), (b, a):
+                if src == cave and dst not in seen:
+                    seen.add(dst)
+                    queue.append(dst)
+
+    return 'end' in seen
+
+
+def generate (scale=1, seed=0):
+    """Returns a cave system as a list of connections, e.g. `start-A`.
+
+    The number of paths through a cave system grows exponentially with
+    its size, so unlike other generators, the real number of small (six)
+    and big (four) caves grows only by one and one half, respectively,
+    each time `scale` doubles.  Big caves are never connected to one
+    another (or there would be infinitely many paths).
+    """
+    rng    = random.Random(seed)
+    extra  = int( math.log2(scale) )
+    small  = names(rng, string.ascii_lowercase, 6 + extra)
+    big    = names(rng, string.ascii_uppercase, 4 + (extra // 2))
+    caves  = small + big
+    nedges = round(2.4 * len(caves))
+
+    while True:
+        edges = set()
+
+        for cave in rng.sample(caves, 3):
+            edges.add( ('start', cave) )
+
+        for cave in rng.sample(caves, 3):
+            edges.add( (cave, 'end') )
+
+        while len(edges) < nedges:
+            a, b = rng.sample(caves, 2)
+            if (a in small or b in small) and (b, a) not in edges:
+                edges.add( (a, b) )
+
+        if connected(edges):
+            break
+
+    edges = sorted(edges)
+    rng.shuffle(edges)
+    return text(f'{a}-{b}' for a, b in edges)
+
+
+def names (rng, letters, count):
+    """Returns `count` distinct two letter cave names made of `letters`."""
+    names = set()
+
+    while len(names) < count:
+        names.add( ''.join( rng.choices(letters, k=2) ) )
+
+    return sorted(names)
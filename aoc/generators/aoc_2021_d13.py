@@ -0,0 +1,71 @@
+# Advent of Code 2021, Day 13 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+Height = 6
+Width  = 40
+
+
+def generate (scale=1, seed=0):
+    """Returns `800 * scale` dots on transparent paper followed by the fold
+    instructions that (eventually) fold them into a `Width`x`Height`
+    code, e.g.:
+
+        6,10
+        fold along y=7
+
+    As in the real input, there are five folds along `x` and seven
+    along `y`, which are interleaved, and every fold halves the paper
+    exactly.  Larger inputs fold (and so unfold) more times to make room
+    for more dots.  No dot is ever on a fold line.
+    """
+    rng    = random.Random(seed)
+    count  = 800 * scale
+    nx, ny = 5, 7
+
+    while count > ((Width << nx) * (Height << ny)) // 4:
+        nx, ny = nx + 1, ny + 1
+
+    xlines = [ Width  ]
+    ylines = [ Height ]
+
+    for n in range(nx - 1):
+        xlines.append( (2 * xlines[-1]) + 1 )
+
+    for n in range(ny - 1):
+        ylines.append( (2 * ylines[-1]) + 1 )
+
+    folds = [ ]
+
+    while xlines or ylines:
+        if xlines and (rng.random() < 0.5 or not ylines):
+            folds.append( ('x', xlines.pop()) )
+        else:
+            folds.append( ('y', ylines.pop()) )
+
+    code = [ (x, y) for x in range(Width) for y in range(Height) if rng.random() < 0.4 ]
+    dots = set()
+
+    while len(dots) < count:
+        x, y = rng.choice(code)
+
+        for along, line in reversed(folds):
+            if rng.random() < 0.5:
+                if along == 'x':
+                    x = (2 * line) - x
+                else:
+                    y = (2 * line) - y
+
+        dots.add( (x, y) )
+
+    lines = [ f'{x},{y}' for x, y in dots ]
+    rng.shuffle(lines)
+    lines.append('')
+    lines.extend( f'fold along {along}={line}' for along, line in folds )
+
+    return text(lines)
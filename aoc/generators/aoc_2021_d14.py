@@ -0,0 +1,24 @@
+# Advent of Code 2021, Day 14 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+Elements = 'BCFHKNOPSV'
+
+
+def generate (scale=1, seed=0):
+    """Returns a polymer template of `20 * scale` elements followed by an
+    insertion rule for every pair of `Elements`, e.g. `CH -> B`.
+    """
+    rng   = random.Random(seed)
+    lines = [ ''.join( rng.choices(Elements, k=20 * scale) ), '' ]
+    pairs = [ a + b for a in Elements for b in Elements ]
+
+    rng.shuffle(pairs)
+    lines.extend( f'{pair} -> {rng.choice(Elements)}' for pair in pairs )
+
+    return text(lines)
@@ -0,0 +1,17 @@
+# Advent of Code 2021, Day 15 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import math
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns a square map of risk levels (`1` to `9`) with `scale` times
+    as many positions as the real `100x100` one.
+    """
+    rng  = random.Random(seed)
+    side = round( 100 * math.sqrt(scale) )
+    return text(''.join( rng.choices('123456789', k=side) ) for r in range(side))
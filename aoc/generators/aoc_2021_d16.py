@@ -0,0 +1,57 @@
+# Advent of Code 2021, Day 16 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns a single hexadecimal BITS transmission of an outermost
+    packet containing `300 * scale` packets in all.
+    """
+    rng  = random.Random(seed)
+    bits = packet(rng, 300 * scale)
+    bits = bits + ('0' * (-len(bits) % 8))
+    return text([ f'{int(bits, 2):0{len(bits) // 4}X}' ])
+
+
+def literal (rng, version):
+    """Returns the bits of a literal value packet with a random value."""
+    value  = f'{rng.randrange(1 << (4 * rng.randint(1, 4))):b}'
+    value  = ('0' * (-len(value) % 4)) + value
+    groups = [ value[n:n + 4] for n in range(0, len(value), 4) ]
+    bits   = ''.join( ('1' if n < len(groups) - 1 else '0') + g
+                      for n, g in enumerate(groups) )
+    return f'{version:03b}100' + bits
+
+
+def packet (rng, count):
+    """Returns the bits of a random packet containing `count` packets in all
+    (including itself).  Operator packets have at least one subpacket,
+    and comparison operators (`5`, `6` and `7`) exactly two.
+    """
+    version = rng.randrange(8)
+
+    if count == 1:
+        return literal(rng, version)
+
+    if count >= 3 and rng.random() < 0.2:
+        op, nsub = rng.randint(5, 7), 2
+    else:
+        op, nsub = rng.choice( (0, 1, 2, 3) ), rng.randint(1, min(count - 1, 8))
+
+    sizes = split(rng, count - 1, nsub)
+    subs  = ''.join( packet(rng, n) for n in sizes )
+
+    if len(subs) < (1 << 15) and rng.random() < 0.5:
+        return f'{version:03b}{op:03b}0{len(subs):015b}' + subs
+    else:
+        return f'{version:03b}{op:03b}1{nsub:011b}' + subs
+
+
+def split (rng, total, parts):
+    """Splits `total` into `parts` (random) positive integers."""
+    cuts = sorted( rng.sample(range(1, total), parts - 1) )
+    return [ b - a for a, b in zip([ 0 ] + cuts, cuts + [ total ]) ]
@@ -0,0 +1,24 @@
+# Advent of Code 2021, Day 17 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns a (single line) target area description, e.g.:
+
+        target area: x=20..30, y=-10..-5
+
+    The target area is always below the launcher, at most 100 units.
+    The number of initial velocities to consider grows with its (far)
+    `x` edge, which is about `250 * scale` units away.
+    """
+    rng  = random.Random(seed)
+    xmin = rng.randint(200, 300) * scale
+    xmax = xmin + rng.randint(20, 40) * scale
+    ymin = rng.randint(-100, -60)
+    ymax = ymin + rng.randint(20, 40)
+    return text([ f'target area: x={xmin}..{xmax}, y={ymin}..{ymax}' ])
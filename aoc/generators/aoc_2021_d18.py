@@ -0,0 +1,31 @@
+# Advent of Code 2021, Day 18 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `100 * scale` (reduced) snailfish numbers, one per line, e.g.
+    `[[1,9],[8,5]]`.
+    """
+    rng = random.Random(seed)
+    return text( number(rng) for n in range(100 * scale) )
+
+
+def number (rng, depth=1):
+    """Returns a random snailfish number (pair) nested at `depth`.  Pairs
+    are never nested more than four deep and regular numbers are `0` to
+    `9`, i.e. the number is already reduced.
+    """
+    elements = [ ]
+
+    for n in range(2):
+        if depth < 4 and rng.random() < 0.7:
+            elements.append( number(rng, depth + 1) )
+        else:
+            elements.append( str( rng.randint(0, 9) ) )
+
+    return f'[{elements[0]},{elements[1]}]'
@@ -0,0 +1,40 @@
+# Advent of Code 2023, Day 1 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+import string
+
+from aoc.generators import text
+
+
+Words = 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine'
+
+
+def generate (scale=1, seed=0):
+    """Returns `1000 * scale` lines of calibration document, e.g.
+    `dqfournine5four2jmlqcgv`, of letters, digits and spelled out
+    digits (which sometimes overlap, e.g. `twone`).  Every line has at
+    least one digit.
+    """
+    rng   = random.Random(seed)
+    lines = [ ]
+
+    for n in range(1000 * scale):
+        pieces = [ str( rng.randint(1, 9) ) ]
+
+        for p in range( rng.randint(1, 8) ):
+            kind = rng.random()
+
+            if kind < 0.2:
+                pieces.append( str( rng.randint(1, 9) ) )
+            elif kind < 0.5:
+                pieces.append( rng.choice(Words) )
+            else:
+                k = rng.randint(1, 6)
+                pieces.append( ''.join( rng.choices(string.ascii_lowercase, k=k) ) )
+
+        rng.shuffle(pieces)
+        lines.append( ''.join(pieces) )
+
+    return text(lines)
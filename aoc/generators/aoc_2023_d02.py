@@ -0,0 +1,27 @@
+# Advent of Code 2023, Day 2 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `100 * scale` games of cubes drawn from a bag, e.g.:
+
+        Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+    """
+    rng   = random.Random(seed)
+    lines = [ ]
+
+    for game in range(1, (100 * scale) + 1):
+        draws = [ ]
+
+        for d in range( rng.randint(1, 6) ):
+            colors = rng.sample( ('red', 'green', 'blue'), rng.randint(1, 3) )
+            draws.append( ', '.join(f'{rng.randint(1, 20)} {c}' for c in colors) )
+
+        lines.append(f'Game {game}: {"; ".join(draws)}')
+
+    return text(lines)
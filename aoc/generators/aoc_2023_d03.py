@@ -0,0 +1,45 @@
+# Advent of Code 2023, Day 3 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import math
+import random
+
+from aoc.generators import text
+
+
+Symbols = '#$%&*+-/=@'
+
+
+def generate (scale=1, seed=0):
+    """Returns a square engine schematic with `scale` times as many
+    positions as the real `140x140` one, e.g.:
+
+        467..114..
+        ...*......
+
+    Part numbers (of one to three digits) and symbols are scattered at
+    random among periods (`.`), with about as many of each as the real
+    schematic.  Gears (`*`) are the most common symbol.
+    """
+    rng   = random.Random(seed)
+    side  = round( 140 * math.sqrt(scale) )
+    lines = [ ]
+
+    for r in range(side):
+        row = [ ]
+
+        while len(row) < side:
+            kind = rng.random()
+
+            if kind < 0.09 and (len(row) == 0 or not row[-1].isdigit()):
+                digits = rng.randint(1, 3)
+                row.extend( str( rng.randint(10**(digits - 1), 10**digits - 1) ) )
+            elif kind < 0.13:
+                row.append( rng.choice(Symbols + '*' * 8) )
+            else:
+                row.append('.')
+
+        lines.append( ''.join(row[:side]) )
+
+    return text(lines)
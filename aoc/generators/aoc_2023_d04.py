@@ -0,0 +1,45 @@
+# Advent of Code 2023, Day 4 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns `203 * scale` scratchcards of ten winning numbers and
+    twenty-five numbers you have, e.g.:
+
+        Card   1: 41 48 83 86 17 ... | 83 86  6 31 17 ...
+
+    As in the real input, cards come in runs (of fifteen to thirty)
+    where the number of matches tends to fall from ten to zero, and no
+    card wins copies of cards beyond the end of its run.  So the total
+    number of cards (Part 2) grows only linearly with `scale`.
+    """
+    rng     = random.Random(seed)
+    count   = 203 * scale
+    matches = [ ]
+
+    while len(matches) < count:
+        size = min( rng.randint(15, 30), count - len(matches) )
+
+        for n in range(size):
+            left = size - n - 1
+            high = max(0, 10 - ((10 * n) // size))
+            matches.append( min(left, rng.randint(0, high)) )
+
+    lines = [ ]
+
+    for card, m in enumerate(matches, start=1):
+        numbers = rng.sample(range(1, 100), 35 - m)
+        winning = numbers[:10]
+        have    = winning[:m] + numbers[10:]
+
+        rng.shuffle(have)
+        winning = ' '.join(f'{n:2}' for n in winning)
+        have    = ' '.join(f'{n:2}' for n in have)
+        lines.append(f'Card {card:3}: {winning} | {have}')
+
+    return text(lines)
@@ -0,0 +1,37 @@
+# Advent of Code 2023, Day 6 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns the times and record distances of four boat races, e.g.:
+
+        Time:      7  15   30
+        Distance:  9  40  200
+
+    Part 2 reads each line as a single (long) race, whose time grows
+    with the number of digits in the first, so its time is `scale`
+    times as large as usual.  Every race, long or short, can be won.
+    """
+    rng = random.Random(seed)
+
+    while True:
+        times = [ rng.randint(40, 90) * scale ] + [ rng.randint(40, 90) for n in range(3) ]
+        dists = [ rng.randint(best(t) // 3, (9 * best(t)) // 10) for t in times ]
+        time  = int( ''.join( str(t) for t in times ) )
+        dist  = int( ''.join( str(d) for d in dists ) )
+
+        if dist < best(time):
+            break
+
+    return text([ 'Time:    ' + ''.join(f'{t:>7}' for t in times),
+                  'Distance:' + ''.join(f'{d:>7}' for d in dists) ])
+
+
+def best (time):
+    """Returns the best distance possible in a race of `time` ms."""
+    return (time // 2) * (time - (time // 2))
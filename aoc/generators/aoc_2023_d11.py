@@ -0,0 +1,27 @@
+# Advent of Code 2023, Day 11 synthetic input generator.
+# Author: Ben Bornstein
+
+
+import math
+import random
+
+from aoc.generators import text
+
+
+def generate (scale=1, seed=0):
+    """Returns a square image of galaxies (`#`) and empty space (`.`) with
+    `scale` times as many positions as the real `140x140` one.  About
+    one in fifty positions is a galaxy, except for a few rows and
+    columns which are entirely empty.
+    """
+    rng   = random.Random(seed)
+    side  = round( 140 * math.sqrt(scale) )
+    rows  = set( rng.sample(range(side), side // 20) )
+    cols  = set( rng.sample(range(side), side // 20) )
+    lines = [ ]
+
+    for r in range(side):
+        lines.append(''.join('#' if r not in rows and c not in cols and rng.random() < 0.023
+                             else '.' for c in range(side)))
+
+    return text(lines)
@@ -0,0 +1,102 @@
+# Advent of Code k-sum search, i.e. finding k entries (of many) that sum
+# to a target.
+# Author: Ben Bornstein
+#
+# Pairs are found with a hash (set) lookup in O(n) and larger tuples by
+# sorting once and fixing all but two entries, which are found with two
+# pointers that close in from either end, i.e. O(n^(k-1)).  Matches are
+# yielded lazily, so finding only the `first()` stops early:
+#
+#     aoc.ksum.first(entries, 3, 2020)       # (289, 620, 1111) or None
+#     list( aoc.ksum.sums(entries, 3, 2020) )
+
+
+import collections
+import itertools
+
+
+def first (entries, k, target):
+    """Returns the first `k`-tuple of `entries` that sums to `target` (see
+    `sums()`) or `None`.
+    """
+    return next(sums(entries, k, target), None)
+
+
+def pairs (entries, target):
+    """Python iterator over the distinct pairs of `entries` that sum to
+    `target`, yielding each as an ascending `(a, b)` tuple, in the order
+    that `a` first appears in `entries`.
+    """
+    counts = collections.Counter(entries)
+
+    for a in counts:
+        b = target - a
+
+        if (a < b and b in counts) or (a == b and counts[a] > 1):
+            yield (a, b)
+
+
+def sums (entries, k, target):
+    """Python iterator over the distinct `k`-tuples of `entries` that sum
+    to `target`, yielding each as an ascending tuple of values.  An entry
+    may appear in a tuple at most as many times as it appears in
+    `entries`.
+    """
+    if k < 1:
+        raise ValueError(f'k must be at least one (k={k}).')
+
+    if k == 1:
+        return ( (value,) for value in set(entries) if value == target )
+
+    if k == 2:
+        return pairs(entries, target)
+
+    values = sorted(entries)
+    prefix = list( itertools.accumulate(values, initial=0) )
+    return tuples(values, prefix, k, target, 0)
+
+
+def tuples (values, prefix, k, target, lo):
+    """Python iterator over the distinct `k`-tuples (`k >= 2`) of sorted
+    `values[lo:]` that sum to `target` (see `sums()`).  `prefix[n]` is the
+    sum of `values[:n]`, which bounds the smallest and largest sums that
+    each fixed value may be part of, so that hopeless values are skipped.
+    """
+    n = len(values)
+
+    if k == 2:
+        hi = n - 1
+
+        while lo < hi:
+            total = values[lo] + values[hi]
+
+            if total < target:
+                lo += 1
+            elif total > target:
+                hi -= 1
+            else:
+                yield (values[lo], values[hi])
+                lo += 1
+                hi -= 1
+
+                while lo < hi and values[lo] == values[lo - 1]:
+                    lo += 1
+        return
+
+    if n - lo < k:
+        return
+
+    largest = prefix[n] - prefix[n - k + 1]
+
+    for i in range(lo, n - k + 1):
+        value = values[i]
+
+        if i > lo and value == values[i - 1]:
+            continue
+        if prefix[i + k] - prefix[i] > target:
+            break
+        if value + largest < target:
+            continue
+
+        for rest in tuples(values, prefix, k - 1, target - value, i + 1):
+            yield (value,) + rest
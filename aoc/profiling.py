@@ -0,0 +1,161 @@
+# Advent of Code puzzle (day) CPU and memory profiling.
+# Author: Ben Bornstein
+#
+# Profiles are written to a day's directory, named for the day and the
+# current git revision (e.g. `2020/day11/aoc-2020-d11.1a2b3c4.prof`), so
+# that hot paths may be compared across revisions:
+#
+#     python -m pstats 2020/day11/aoc-2020-d11.1a2b3c4.prof
+
+
+import contextlib
+import cProfile
+import os
+import resource
+import subprocess
+import sys
+import threading
+import tracemalloc
+
+import aoc.days
+
+
+Frames   = 1
+Growth   = 2
+Interval = 0.05
+Limit    = 1 << 28
+Top      = 25
+
+
+def filename (day, revision, ext):
+    """Returns the full path to `day`'s profile with extension `ext` for
+    the given git `revision`.
+    """
+    return os.path.join(day.directory, f'aoc-{day.year}-d{day.day:02}.{revision}.{ext}')
+
+
+def mebibytes (size):
+    """Returns `size` (in bytes) formatted in MiB."""
+    return f'{size / (1 << 20):9.3f} MiB'
+
+
+def allocations (day, revision, largest, peak, top=Top):
+    """Returns a text report of `day`'s `top` allocation sites (by size)
+    in the `largest` `(size, snapshot)` tracemalloc sample, its `peak` traced
+    memory, and the peak resident set size (RSS) of this process.
+    """
+    size, snapshot = largest
+    filters = [ tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, '<frozen *>') ]
+    stats   = snapshot.filter_traces(filters).statistics('lineno')
+    lines   = [ f'{day} @ {revision}',
+                f'Peak RSS:    {mebibytes( rss() )}',
+                f'Peak traced: {mebibytes(peak)}',
+                '',
+                f'Top {min(top, len(stats))} allocation sites (by size) at '
+                f'{mebibytes(size).strip()}:' ]
+
+    for n, stat in enumerate(stats[:top], start=1):
+        frame = stat.traceback[0]
+        site  = frame.filename
+        size  = mebibytes(stat.size)
+
+        if site.startswith(aoc.days.Root + os.sep):
+            site = os.path.relpath(site, aoc.days.Root)
+
+        lines.append(f'{n:4}. {size} {stat.count:9} blocks  {site}:{frame.lineno}')
+
+    return '\n'.join(lines) + '\n'
+
+
+@contextlib.contextmanager
+def profiling (day, cpu=True, memory=False, top=Top):
+    """Profiles the body of this context manager as `day`: its CPU time
+    with `cProfile` if `cpu` is true, and its memory use with
+    `tracemalloc` if `memory` is true.  Yields a list, that on exit,
+    holds the full path to each profile written (see `filename()`).
+
+    Peak RSS is only meaningful if `day` is the only thing this process
+    has run, e.g. in a pool with `max_tasks_per_child=1`.
+    """
+    files    = [ ]
+    profiler = cProfile.Profile() if cpu else None
+    samples  = [ ]
+    stop     = threading.Event()
+    sampler  = threading.Thread(target=sample, args=(samples, stop), daemon=True)
+
+    if memory:
+        tracemalloc.start(Frames)
+        sampler.start()
+
+    if profiler:
+        profiler.enable()
+
+    try:
+        yield files
+    finally:
+        if profiler:
+            profiler.disable()
+
+        if memory:
+            stop.set()
+            sampler.join()
+            current, peak = tracemalloc.get_traced_memory()
+            samples.append( (current, tracemalloc.take_snapshot()) )
+            tracemalloc.stop()
+
+        tag = revision() if (profiler or memory) else None
+
+        if profiler:
+            files.append( filename(day, tag, 'prof') )
+            profiler.dump_stats( files[-1] )
+
+        if memory:
+            files.append( filename(day, tag, 'mem') )
+
+            with open(files[-1], 'wt') as output:
+                output.write( allocations(day, tag, max(samples, key=lambda s: s[0]), peak, top) )
+
+
+def sample (samples, stop, interval=Interval, growth=Growth, limit=Limit):
+    """Samples traced memory every `interval` seconds until `stop` is set.
+    Each time it grows by a factor of `growth`, a `(size, snapshot)`
+    replaces the (single) sample in `samples`, so that allocation sites
+    may be reported near the peak, even if that memory is later freed.
+
+    Snapshots copy every trace, so none are taken beyond `limit` bytes;
+    by then, the sites responsible for growth are usually clear.
+    """
+    size = 0
+
+    while not stop.wait(interval):
+        current = tracemalloc.get_traced_memory()[0]
+
+        if size * growth < current <= limit:
+            samples.clear()
+            samples.append( (current, tracemalloc.take_snapshot()) )
+            size = current
+
+
+def revision ():
+    """Returns the current (short) git revision of this repository, with
+    a `+` suffix if it has uncommitted changes, or `unknown`.
+    """
+    try:
+        git  = [ 'git', '-C', aoc.days.Root ]
+        head = subprocess.run(git + [ 'rev-parse', '--short', 'HEAD' ],
+                              capture_output=True, check=True, text=True)
+        diff = subprocess.run(git + [ 'diff', '--quiet', 'HEAD', '--' ],
+                              capture_output=True)
+        return head.stdout.strip() + ('+' if diff.returncode else '')
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def rss ():
+    """Returns the peak resident set size (RSS) of this process in bytes."""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == 'darwin' else usage * 1024
+
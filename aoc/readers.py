@@ -0,0 +1,121 @@
+# Advent of Code puzzle input readers.
+# Author: Ben Bornstein
+
+
+import array
+import contextlib
+import mmap
+import re
+
+
+Digits  = bytes.maketrans(b'0123456789', bytes( range(10) ))
+Integer = re.compile(rb'-?\d+')
+
+
+@contextlib.contextmanager
+def mapped (filename):
+    """Context manager that memory-maps `filename` (read-only) and yields
+    a bytes-like object over its contents.  Files that cannot be mapped
+    (empty files, pipes, etc.) are read into memory instead.
+    """
+    with open(filename, 'rb') as stream:
+        try:
+            data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            yield stream.read()
+        else:
+            with data:
+                yield data
+
+
+def spans (data):
+    """Python iterator over the lines in bytes-like `data`, yielding the
+    `(start, stop)` offsets of each line.  Lines include their trailing
+    newline, if any.
+    """
+    pos = 0
+    end = len(data)
+
+    while pos < end:
+        stop = data.find(b'\n', pos)
+        stop = end if stop == -1 else stop + 1
+        yield pos, stop
+        pos  = stop
+
+
+def blocks (data, pos=0, end=None):
+    """Python iterator over the records in bytes-like `data` (or in
+    `data[pos:end]`), where records are separated by one or more blank
+    lines, yielding the `(start, stop)` offsets of each record, with
+    leading and trailing newlines removed.  Empty records are skipped.
+    """
+    end = len(data) if end is None else end
+
+    while pos < end:
+        stop  = data.find(b'\n\n', pos, end)
+        stop  = end if stop == -1 else stop
+        start = pos
+        pos   = stop + 2
+
+        while start < stop and data[start] == 10:
+            start += 1
+        while stop > start and data[stop - 1] == 10:
+            stop -= 1
+
+        if start < stop:
+            yield start, stop
+
+
+def grid (filename, table=None):
+    """Loads and returns the two dimensional grid of characters in
+    `filename` as a list of rows, one `bytearray` per line (newlines
+    removed).  Rows are compact and mutable and `grid[row][col]` is an
+    `int`.  If `table` is given (see `bytes.maketrans()`), each row is
+    translated by it, e.g.  `grid(filename, Digits)` maps `'0'`-`'9'`
+    to the integers `0`-`9`.
+    """
+    with mapped(filename) as data:
+        rows = [ bytearray( data[start:stop].rstrip(b'\r\n') )
+                 for start, stop in spans(data) ]
+
+    if table is not None:
+        rows = [ row.translate(table) for row in rows ]
+
+    return rows
+
+
+def integers (filename, typecode='q'):
+    """Returns all (optionally negative) integers in `filename` as a
+    compact `array.array` of the given `typecode` (default: signed 64-bit
+    integers).  Integers may be separated by anything that is not a
+    digit, e.g. newlines or commas.  Integers are converted as they are
+    matched, without a list of every match.
+    """
+    with mapped(filename) as data:
+        return array.array(typecode, ( int( match[0] ) for match in Integer.finditer(data) ))
+
+
+def lines (filename, func=None):
+    """Python iterator over lines in `filename`.  If `func` is given, it is
+    applied to each line before yielding (returning) it.
+
+    Lines are read one at a time from a memory-map of `filename` and
+    include their trailing newline, as with `stream.readlines()`.
+    """
+    with mapped(filename) as data:
+        for start, stop in spans(data):
+            line = data[start:stop].decode()
+            yield func(line) if func else line
+
+
+def records (filename, func=None):
+    """Python iterator over records in `filename`, where records are
+    separated by one or more blank lines.  Each record is yielded as a
+    single string, with newlines between its lines preserved, but with
+    leading and trailing newlines removed.  If `func` is given, it is
+    applied to each record before yielding (returning) it.
+    """
+    with mapped(filename) as data:
+        for start, stop in blocks(data):
+            record = data[start:stop].decode()
+            yield func(record) if func else record
@@ -0,0 +1,41 @@
+# Advent of Code process pool workers.
+# Author: Ben Bornstein
+#
+# Puzzle scripts are often imported under made-up module names (e.g.
+# `aoc_2020_d04`, see `aoc.days.load()`), which a worker process started
+# with `spawn` or `forkserver` (rather than `fork`) cannot import to
+# unpickle their functions.  `task()` wraps such a function, so that each
+# worker imports its script by path instead:
+#
+#     executor.submit(aoc.workers.task(count), filename, start, stop)
+
+
+import functools
+import importlib.util
+import inspect
+import sys
+
+
+def call (script, module, name, *args):
+    """Returns `module.name(*args)`, first importing `script` as `module`,
+    unless this process has already imported it.
+    """
+    if module not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module, script)
+        sys.modules[module] = importlib.util.module_from_spec(spec)
+
+        try:
+            spec.loader.exec_module( sys.modules[module] )
+        except BaseException:
+            del sys.modules[module]
+            raise
+
+    return getattr(sys.modules[module], name)(*args)
+
+
+def task (func):
+    """Returns a picklable callable that calls top-level function `func`
+    (see `call()`) in any process pool worker.
+    """
+    script = inspect.getsourcefile(func)
+    return functools.partial(call, script, func.__module__, func.__qualname__)
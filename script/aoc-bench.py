@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# Benchmarks Advent of Code puzzles and compares them to a baseline.
+# Author: Ben Bornstein
+
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import aoc.bench
+import aoc.days
+
+
+def progress (day, results):
+    """Prints benchmark `results` for `day` (a name) as they become
+    available.
+    """
+    if results is None:
+        print(f'{day}  skipped (no parse(), part1() and part2())')
+        return
+
+    for name, r in results.items():
+        print(f'{day}  {name:14}  min {r["min"]:9.4f}s  median {r["median"]:9.4f}s'
+              f'  stddev {r["stddev"]:8.4f}s  ({r["runs"]} runs)')
+
+
+def main ():
+    """Benchmarks Advent of Code puzzles and compares them to a baseline."""
+    p = argparse.ArgumentParser(description=main.__doc__)
+    p.add_argument('days'  , type=int, nargs='*', metavar='day')
+    p.add_argument('--year', type=int, action='append', dest='years')
+    p.add_argument('--heavy', action='store_true',
+                   help=f'benchmark only: {", ".join(aoc.bench.Heavy)}')
+    p.add_argument('-n', '--repeat', type=int, default=5)
+    p.add_argument('-w', '--warmup', type=int, default=1)
+    p.add_argument('-o', '--output', type=str, metavar='filename',
+                   help='write results as JSON to filename')
+    p.add_argument('-c', '--compare', type=str, metavar='filename',
+                   help='compare results to a JSON baseline in filename')
+    p.add_argument('-t', '--threshold', type=float, default=0.10,
+                   help='slowdown (fraction) flagged as a regression')
+    p.add_argument('-s', '--scale', type=int,
+                   help='benchmark synthetic inputs scale times larger')
+    p.add_argument('--seed', type=int, default=0,
+                   help='random seed for synthetic inputs')
+    p.add_argument('--cache', action='store_true',
+                   help='parse inputs once and cache them (see aoc.cache)')
+    p.add_argument('--engines', action='store_true',
+                   help='also benchmark alternative implementations (Engines)')
+
+    args = p.parse_args()
+    days = aoc.days.find(args.years, args.days)
+
+    if args.heavy:
+        days = [ day for day in days if str(day) in aoc.bench.Heavy ]
+
+    if args.repeat < 1:
+        print('error: --repeat must be at least one.')
+        return 2
+
+    if args.scale is not None and args.scale < 1:
+        print('error: --scale must be at least one.')
+        return 2
+
+    if len(days) == 0:
+        print('error: No puzzles found.')
+        return 2
+
+    results = aoc.bench.report(days, args.repeat, args.warmup, progress,
+                               args.scale, args.seed, args.cache, args.engines)
+
+    if args.output:
+        aoc.bench.save(results, args.output)
+        print(f'Wrote {args.output}.')
+
+    if args.compare:
+        baseline    = aoc.bench.load(args.compare)
+        regressions = aoc.bench.compare(results, baseline, args.threshold)
+
+        for day, name, before, after, reason in regressions:
+            print(f'REGRESSION {day} {name}: {before:.4f}s -> {after:.4f}s ({reason})')
+
+        print(f'{len(regressions)} regression(s) against {args.compare}.')
+
+        return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit( main() )
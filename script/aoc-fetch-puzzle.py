@@ -5,14 +5,28 @@
 
 
 import argparse
+import concurrent.futures
+import hashlib
+import html.parser
+import http.client
+import json
 import os
+import queue
 import re
+import stat
 import sys
 import textwrap
-import urllib.request
+import urllib.parse
 
 
+Agent   = 'github.com/bbornstein/aoc (script/aoc-fetch-puzzle.py)'
+BaseURL = 'https://adventofcode.com'
+Cache   = os.environ.get('XDG_CACHE_HOME', os.path.expanduser( os.path.join('~', '.cache') ))
+Cache   = os.path.join(Cache, 'aoc-http')
+Cache   = os.environ.get('AOC_HTTP_CACHE', Cache)
+Jobs    = 4
 Session = os.environ.get('AOC_SESSION', None)
+Timeout = 30
 NotSet  = """
 error: An Advent of Code Session ID is required.
 Please export AOC_SESSION="...";
@@ -25,195 +39,510 @@ and letters ([a-f]) and are nearly 100 characters long, e.g.
 '536...be3'.
 """
 
-HTML_a       = re.compile('<a href="(.*?)"[^>]*>(.*?)</a>', re.DOTALL)
-HTML_article = re.compile('<article[^>]*>(.*?)</article>' , re.DOTALL)
-HTML_code    = re.compile('<code>(.*?)</code>'            , re.DOTALL)
-HTML_em      = re.compile('<em>(.*?)</em>'                , re.DOTALL)
-HTML_h2      = re.compile('<h2[^>]*>(.*?)</h2>'           , re.DOTALL)
-HTML_li      = re.compile('<li>(.*?)</li>'                , re.DOTALL)
-HTML_p       = re.compile('(?:<p>|<p\s+[^>]*>)(.*?)</p>'  , re.DOTALL)
-HTML_pre     = re.compile('<pre><code>(.*?)</code></pre>' , re.DOTALL)
-HTML_span    = re.compile('<span[^>]*>(.*?)</span>'       , re.DOTALL)
-HTML_ul      = re.compile('<ul>(.*?)</ul>'                , re.DOTALL)
+HTML_href = re.compile('<a href="(.*?)"[^>]*>', re.DOTALL)
 
 
-def fetch (url):
-    """Fetches and returns the contents of the given `url` as a UTF-8
-    string."""
-    headers = { 'Cookie': f'session={Session}' }
-    request = urllib.request.Request(url, None, headers)
+class Markdown (html.parser.HTMLParser):
+    """Converts an Advent of Code puzzle page from HTML to Markdown in a
+    single pass over the page (see `toMarkdown()`).
 
-    with urllib.request.urlopen(request) as stream:
-        return stream.read()
+    The first `<article>` (Part 1) is converted, followed by the next
+    `<p>` (its answer), the next `<article>` (Part 2) and the next two
+    `<p>`.  Within an `<article>`, only `<h2>`, `<p>`, `<pre><code>` and
+    `<ul>` (of `<li>`) elements are converted.  Within `<p>` and `<li>`,
+    `<a href>`, `<code>` and `<em>` elements are converted to their
+    Markdown equivalent, `<span>` tags are removed and all other markup
+    is kept as is.
+    """
+
+    def __init__ (self):
+        super().__init__(convert_charrefs=False)
+        self.article = None
+        self.blocks  = [ ]
+        self.capture = None
+        self.items   = False
+        self.pre     = False
+        self.stack   = [ ]
+        self.text    = [ ]
+
+
+    def begin (self, end, mode, format):
+        """Begins capturing (converting) text until the end tag `end`, in
+        the given `mode` (see `convert()`).  On `finish()`, the captured
+        text is formatted as Markdown with `format(text)`.
+        """
+        self.capture = (end, mode, format)
+        self.stack   = [ ]
+        self.text    = [ ]
 
 
-def replaceAll (text, pattern, transform):
-    """Replace all occurences in `text` of the regular expression `pattern`
-    with `transform(match)`.  Returns a copy of `text` with all
-    replacements made.
+    def convert (self, tag, raw=None):
+        """Converts the captured start tag `raw` (or end tag if `raw` is
+        `None`) to Markdown, depending on the current capture mode:
+
+          - `inline`: `<a href>`, `<code>`, `<em>` and `<span>` converted
+          - `pre`: `<em>` tags removed
+          - `raw`: Kept as is
+
+        Each start tag pushes its Markdown replacement end tag onto a stack
+        that its end tag pops.
+        """
+        if raw is None:
+            for n in range(len(self.stack) - 1, -1, -1):
+                if self.stack[n][0] == tag:
+                    self.text.append( self.stack[n][1] )
+                    del self.stack[n:]
+                    return
+            self.text.append(f'</{tag}>')
+            return
+
+        mode   = self.capture[1]
+        start  = raw
+        end    = f'</{tag}>'
+
+        if mode == 'inline':
+            if tag == 'span':
+                start, end = '', ''
+            elif raw == '<code>':
+                start, end = '`', '`'
+            elif raw == '<em>':
+                start, end = '**', '**'
+            elif match := HTML_href.fullmatch(raw):
+                start, end = '[', f']({match[1]})'
+        elif mode == 'pre' and raw == '<em>':
+            start, end = '', ''
+
+        self.stack.append( (tag, end) )
+        self.text.append(start)
+
+
+    def finish (self):
+        """Finishes capturing text and formats it as Markdown, either as
+        part of the current `<article>` or as a (top-level) `<p>` block.
+        """
+        end, mode, format = self.capture
+        markdown          = format( ''.join(self.text) )
+        self.capture      = None
+
+        if self.article is not None:
+            self.article.append(markdown)
+        else:
+            self.blocks.append( ('p', markdown) )
+
+
+    def handle_charref (self, name):
+        self.handle_data(f'&#{name};')
+
+
+    def handle_comment (self, data):
+        self.handle_data(f'<!--{data}-->')
+
+
+    def handle_data (self, data):
+        self.pre = False
+
+        if self.capture:
+            self.text.append(data)
+
+
+    def handle_endtag (self, tag):
+        self.pre = False
+
+        if self.capture:
+            if tag == self.capture[0] and all(t != tag for t, _ in self.stack):
+                self.finish()
+            else:
+                self.convert(tag)
+        elif tag == 'article' and self.article is not None:
+            self.blocks.append( ('article', ''.join(self.article)) )
+            self.article = None
+            self.items   = False
+        elif tag == 'ul':
+            self.items = False
+
+
+    def handle_entityref (self, name):
+        self.handle_data(f'&{name};')
+
+
+    def handle_startendtag (self, tag, attrs):
+        self.handle_data( self.get_starttag_text() )
+
+
+    def handle_starttag (self, tag, attrs):
+        raw      = self.get_starttag_text()
+        pre      = self.pre
+        self.pre = raw == '<pre>'
+
+        if self.capture:
+            self.convert(tag, raw)
+        elif tag == 'article' and self.article is None:
+            self.article = [ ]
+        elif tag == 'p' and (self.article is None or raw == '<p>'):
+            self.begin('p', 'inline', markdown_p)
+        elif self.article is None:
+            pass
+        elif tag == 'h2':
+            self.begin('h2', 'raw', markdown_h2)
+        elif raw == '<ul>':
+            self.items = True
+        elif raw == '<li>' and self.items:
+            self.begin('li', 'inline', markdown_li)
+        elif raw == '<code>' and pre:
+            self.begin('code', 'pre', markdown_pre)
+
+
+    def markdown (self):
+        """Returns the Markdown text of the puzzle (see `Markdown`)."""
+        text = [ ]
+        pos  = 0
+
+        for kind in 'article', 'p', 'article', 'p', 'p':
+            for n in range(pos, len(self.blocks)):
+                if self.blocks[n][0] == kind:
+                    text.append( self.blocks[n][1] )
+                    pos = n + 1
+                    break
+
+        return ''.join(text)
+
+
+class Pool:
+    """A pool of persistent (HTTP/1.1 keep-alive) connections to the
+    Advent of Code server at `base` (URL), shared by any number of
+    threads.  Each thread takes an idle connection (or opens a new one)
+    for the duration of a request, so the pool grows to at most the
+    number of concurrent requests.
+
+    If `cache` is a directory, each response is kept there with its
+    `ETag` and `Last-Modified` validators (as JSON, beside the raw
+    response), so that fetching it again sends a conditional request
+    and a `304 Not Modified` response is served from the cache.  Since
+    responses are personal (inputs differ by user), the cache is only
+    used if it is `private()`.
     """
-    while match := pattern.search(text):
-        text = replaceMatch(text, match, transform(match))
 
-    return text
+    def __init__ (self, base=BaseURL, session=Session, cache=None):
+        url          = urllib.parse.urlsplit(base)
+        self.cache   = cache
+        self.host    = url.netloc
+        self.idle    = queue.LifoQueue()
+        self.prefix  = url.path.rstrip('/')
+        self.headers = { 'Cookie': f'session={session}', 'User-Agent': Agent }
+
+        if url.scheme == 'https':
+            self.connect = http.client.HTTPSConnection
+        else:
+            self.connect = http.client.HTTPConnection
+
+
+    def __enter__ (self):
+        return self
+
 
+    def __exit__ (self, *exc):
+        self.close()
 
-def replaceMatch (text, match, s):
-    """Returns `text` with the regular expression `match` replaced by `s`."""
-    return text[:match.start(0)] + s + text[match.end(0):]
 
+    def close (self):
+        """Closes all idle connections."""
+        while not self.idle.empty():
+            self.idle.get().close()
+
+
+    def connection (self):
+        """Returns `(connection, reused)`, an idle connection (`reused`) or a
+        new one.
+        """
+        try:
+            return self.idle.get_nowait(), True
+        except queue.Empty:
+            return self.connect(self.host, timeout=Timeout), False
 
-def replace_a (html):
-    """Replaces all HTML anchor elements (`<a href="...">`) in `html` with
-    their Markdown equivalent.
-    """
-    return replaceAll(html, HTML_a, lambda match: f'[{match[2]}]({match[1]})')
 
+    def entry (self, path):
+        """Returns the full path to the cache entry for `path`, named for a
+        hash of its URL and session, as responses differ by user.
+        """
+        key = f'{self.headers["Cookie"]} {self.host}{self.prefix}{path}'
+        return os.path.join(self.cache, hashlib.sha256( key.encode() ).hexdigest())
 
-def replace_code (html):
-    """Replaces all `<code>` elements in `html` with their Markdown
-    equivalent.
-    """
-    return replaceAll(html, HTML_code, lambda match: f'`{match[1]}`')
 
+    def fetch (self, path):
+        """Fetches the contents (bytes) of `path`, relative to the base URL,
+        e.g. `/2020/day/1/input`, and returns `(content, changed)`, where
+        `changed` is false if `content` is the same as when last fetched
+        (and cached).  If an idle connection was closed by the server,
+        the request is retried on another.
+        """
+        cached  = self.load(path) if self.cache else None
+        headers = dict(self.headers)
 
-def replace_em (html):
-    """Replaces all `<em>` elements in `html` with their Markdown
-    equivalent.
-    """
-    return replaceAll(html, HTML_em, lambda match: f'**{match[1]}**')
+        if cached and cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached['modified']:
+            headers['If-Modified-Since'] = cached['modified']
 
+        while True:
+            connection, reused = self.connection()
 
-def replace_inline (html):
-    """Replaces all HTML inline elements (`<a>`, `<code>`, `<em>`, `<span>`)
-    in `html` with their Markdown equivalent.
-    """
-    return replace_a( replace_code( replace_em( replace_span(html) ) ) )
+            try:
+                connection.request('GET', self.prefix + path, headers=headers)
+                response = connection.getresponse()
+                content  = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if not reused:
+                    raise
 
+        if response.will_close:
+            connection.close()
+        else:
+            self.idle.put(connection)
 
-def replace_span (html):
-    """Replaces all `<span>` elements in `html` with their Markdown
-    equivalent.
-    """
-    return stripAll(html, HTML_span)
+        if response.status == 304 and cached:
+            return cached['content'], False
 
+        if response.status != 200:
+            reason = f'{response.status} {response.reason}'
+            raise http.client.HTTPException(f'{self.host}{self.prefix}{path}: {reason}')
 
-def savePuzzle (url, filename):
-    """Fetches and saves the Advent of Code puzzle description at `url` to
-    `filename`, after converting it from HTML to Markdown.
-    """
-    with open(filename, 'wt') as output:
-        html = fetch(url).decode('utf-8')
-        pos  = 0
+        if self.cache:
+            self.store(path, response, content)
 
-        for pattern in HTML_article, HTML_p, HTML_article, HTML_p, HTML_p:
-            if match := pattern.search(html, pos):
-                if match[0].startswith('<article'):
-                    writeMarkdown_article(match[1], output)
-                elif match[0].startswith('<p'):
-                    writeMarkdown_p(match[1], output)
-                pos = match.end()
+        return content, not cached or cached['content'] != content
 
-    print(f'Wrote {filename}.')
 
+    def load (self, path):
+        """Returns the cache entry (`dict`) for `path` or `None`, e.g. if
+        the cache, the entry or its validators are not `private()`, or
+        the validators are not for the cached content.
+        """
+        entry = self.entry(path)
 
-def savePuzzleData (url, filename):
-    """Fetches and saves the Advent of Code puzzle data (input) at `url` to
-    `filename`.
-    """
-    with open(filename, 'wb') as output:
-        output.write( fetch(url) )
+        try:
+            if not (private(self.cache, stat.S_ISDIR) and private(entry, stat.S_ISREG) and
+                    private(entry + '.json', stat.S_ISREG)):
+                return None
+
+            with open(entry + '.json', 'rt') as stream:
+                cached = json.load(stream)
+            with open(entry, 'rb') as stream:
+                cached['content'] = stream.read()
+
+            if cached['sha256'] != hashlib.sha256( cached['content'] ).hexdigest():
+                return None
+        except FileNotFoundError:
+            return None
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        return cached
+
+
+    def store (self, path, response, content):
+        """Stores `content` and its validators from `response` in the cache
+        entry for `path`.
+        """
+        entry      = self.entry(path)
+        validators = { 'etag'    : response.getheader('ETag'),
+                       'modified': response.getheader('Last-Modified'),
+                       'sha256'  : hashlib.sha256(content).hexdigest() }
+
+        os.makedirs(self.cache, mode=0o700, exist_ok=True)
+
+        if private(self.cache, stat.S_ISDIR):
+            write(entry, content, mode=0o600)
+            write(entry + '.json', json.dumps(validators).encode(), mode=0o600)
+
+
+def dayList (text):
+    """Returns the list of days in `text`, e.g. `1-25` or `1,3,5-7`."""
+    days = [ ]
+
+    for item in text.split(','):
+        first, _, last = item.partition('-')
+        days.extend( range(int(first), int(last or first) + 1) )
 
-    print(f'Wrote {filename}.')
+    if not all(1 <= day <= 25 for day in days):
+        raise ValueError(text)
 
+    return days
 
-def stripAll (html, pattern):
-    """Replaces all occurences in `text` of the regular expression `pattern`
-    with `match[1]`.  For the `HTML_*` patterns defined in this file,
-    this has the effect of strippig the HTML tag, but leaving the inner
-    text.
+
+def markdown_h2 (html):
+    """Returns the `html` `<h2>` (contents) as Markdown text."""
+    return f'### {html.replace("---", "").strip() }\n\n'
+
+
+def markdown_li (html):
+    """Returns the `html` `<li>` (contents) as Markdown text."""
+    return '  - ' + '\n    '.join( textwrap.wrap(html) ) + '\n\n'
+
+
+def markdown_p (html):
+    """Returns the `html` `<p>` (contents) as Markdown text."""
+    return f'{textwrap.fill(html)}\n\n'
+
+
+def markdown_pre (html):
+    """Returns the `html` `<pre><code>` (contents) as Markdown text."""
+    text = '\n    '.join( html.strip().split('\n') )
+    return f'    {text}' + '\n\n'
+
+
+def private (path, kind):
+    """Indicates whether `path` (not a symbolic link) is of the given
+    `kind` (e.g. `stat.S_ISDIR`), owned by the current user and neither
+    group- nor world-writable.  Raises `FileNotFoundError` if `path` does
+    not exist.
     """
-    return replaceAll(html, pattern, lambda match: match[1])
+    info = os.lstat(path)
+    mode = info.st_mode
+    return kind(mode) and info.st_uid == os.getuid() and not mode & (stat.S_IWGRP | stat.S_IWOTH)
 
 
-def writeMarkdown_article (html, output):
-    """Writes the `html` `<article>` to `output` stream as Markdown text."""
-    matches = [ ]
+def savePuzzle (pool, path, filename):
+    """Fetches and saves the Advent of Code puzzle description at `path`
+    (see `Pool.fetch()`) to `filename`, after converting it from HTML to
+    Markdown.  If `filename` exists, it is only rewritten if the page
+    and its Markdown changed.  Returns true if `filename` was written.
+    """
+    content, changed = pool.fetch(path)
+    exists           = os.path.exists(filename)
+
+    if exists and not changed:
+        return False
 
-    for pattern in HTML_h2, HTML_pre, HTML_p, HTML_ul:
-        matches.extend( list( pattern.finditer(html) ) )
+    markdown = toMarkdown( content.decode('utf-8') ).encode('utf-8')
 
-    matches.sort(key=lambda match: match.start())
+    if exists:
+        with open(filename, 'rb') as stream:
+            if stream.read() == markdown:
+                return False
 
-    for match in matches:
-        if match[0].startswith('<h2'):
-            writeMarkdown_h2(match[1], output)
-        elif match[0].startswith('<ul>'):
-            writeMarkdown_ul(match[1], output)
-        elif match[0].startswith('<p>'):
-            writeMarkdown_p(match[1], output)
-        elif match[0].startswith('<pre>'):
-            writeMarkdown_pre(match[1], output)
+    write(filename, markdown)
+    return True
 
 
-def writeMarkdown_h2 (html, output):
-    """Writes the `html` `<h2>` to `output` stream as Markdown text."""
-    output.write(f'### {html.replace("---", "").strip() }\n\n')
+def savePuzzleData (pool, path, filename):
+    """Fetches and saves the Advent of Code puzzle data (input) at `path`
+    (see `Pool.fetch()`) to `filename`.  Returns true.
+    """
+    write(filename, pool.fetch(path)[0])
+    return True
 
 
-def writeMarkdown_li (html, output):
-    """Writes the `html` `<li>` to `output` stream as Markdown text."""
-    lines = textwrap.wrap( replace_inline(html) )
-    output.write('  - ' + '\n    '.join(lines) + '\n\n')
+def toMarkdown (html):
+    """Returns the Advent of Code puzzle page `html` converted to Markdown
+    text (see `Markdown`).
+    """
+    parser = Markdown()
+    parser.feed(html)
+    parser.close()
+    return parser.markdown()
 
 
-def writeMarkdown_p (html, output):
-    """Writes the `html` `<p>` to `output` stream as Markdown text."""
-    output.write(f'{textwrap.fill( replace_inline(html) )}\n\n')
+def write (filename, content, mode=0o666):
+    """Writes `content` (bytes) to `filename` atomically, i.e. `filename`
+    is either written in full or not at all (nor truncated).  A new
+    `filename` is created with permissions `mode` (less the umask).
+    """
+    directory = os.path.dirname(filename)
+    partial   = f'{filename}.{os.getpid()}.partial'
 
+    if directory:
+        os.makedirs(directory, exist_ok=True)
 
-def writeMarkdown_pre (html, output):
-    """Writes the `html` `<pre>` to `output` stream as Markdown text."""
-    lines = stripAll(html.strip(), HTML_em).split('\n')
-    text  = '\n    '.join(lines)
-    output.write(f'    {text}' + '\n\n')
+    try:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
 
+        with os.fdopen(os.open(partial, flags, mode), 'wb') as output:
+            output.write(content)
+        os.replace(partial, filename)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
 
-def writeMarkdown_ul (html, output):
-    """Writes the `html` `<ul>` to `output` stream as Markdown text."""
-    for match in HTML_li.finditer(html):
-        writeMarkdown_li(match[1], output)
 
 
 def main ():
     """Downloads Advent of Code Puzzle for the given year and day."""
     p = argparse.ArgumentParser(description=main.__doc__)
-    p.add_argument('day'   , type=int)
+    p.add_argument('day'   , type=int, nargs='?')
     p.add_argument('--year', type=int, default='2024')
+    p.add_argument('--days', type=dayList, metavar='list',
+                   help='fetch several days (e.g. 1-25 or 1,3,5-7) to YEAR/dayNN/')
+    p.add_argument('--all', action='store_true', help='same as --days 1-25')
+    p.add_argument('-j', '--jobs', type=int, default=Jobs,
+                   help='maximum number of concurrent requests')
+    p.add_argument('--base-url', type=str, metavar='url', default=BaseURL)
+    p.add_argument('--cache', type=str, metavar='directory', default=Cache,
+                   help='keep responses in directory (default: %(default)s)')
+    p.add_argument('--no-cache', action='store_const', dest='cache', const=None)
+    p.add_argument('--refresh', action='store_true',
+                   help='fetch puzzle descriptions that already exist (e.g. to '
+                        'add Part 2) and rewrite those that changed')
     p.add_argument('-p', '--puzzle', type=str, metavar='filename', default='README.md')
     p.add_argument('-d', '--puzzle-data', type=str, metavar='filename')
 
     args = p.parse_args()
-    url  = f'https://adventofcode.com/{args.year}/day/{args.day}'
+    days = list( range(1, 26) ) if args.all else args.days
 
-    if Session is None:
-        print(NotSet)
+    if (args.day is None) == (days is None):
+        print('error: Either a day or --days (or --all) is required, but not both.')
         return 2
 
-    if os.path.exists(args.puzzle):
-        print(f'Skipping puzzle fetch ("{args.puzzle}" already exists).')
-    else:
-        savePuzzle(url, args.puzzle)
+    if days and args.puzzle_data:
+        print('error: --puzzle-data applies to a single day only.')
+        return 2
 
-    if args.puzzle_data:
-        filename = args.puzzle_data
-    else:
-        filename = f'aoc-{args.year}-d{args.day:02d}.txt'
+    if args.jobs < 1:
+        print('error: --jobs must be at least one.')
+        return 2
+
+    if Session is None:
+        print(NotSet)
+        return 2
 
-    if os.path.exists(filename):
-        print(f'Skipping puzzle data fetch ("{filename}" already exists).')
-    else:
-        savePuzzleData(f'{url}/input', filename)
+    tasks = [ ]
+
+    for day in days or [ args.day ]:
+        path      = f'/{args.year}/day/{day}'
+        directory = os.path.join(str(args.year), f'day{day:02d}') if days else ''
+        puzzle    = os.path.join(directory, args.puzzle)
+        data      = os.path.join(directory, args.puzzle_data or
+                                 f'aoc-{args.year}-d{day:02d}.txt')
+
+        if os.path.exists(puzzle) and not args.refresh:
+            print(f'Skipping puzzle fetch ("{puzzle}" already exists).')
+        else:
+            tasks.append( (savePuzzle, path, puzzle) )
+
+        if os.path.exists(data):
+            print(f'Skipping puzzle data fetch ("{data}" already exists).')
+        else:
+            tasks.append( (savePuzzleData, f'{path}/input', data) )
+
+    with Pool(args.base_url, cache=args.cache) as pool, \
+         concurrent.futures.ThreadPoolExecutor(args.jobs) as executor:
+        futures = { executor.submit(save, pool, path, filename): filename
+                    for save, path, filename in tasks }
+        failed  = 0
+
+        for future in concurrent.futures.as_completed(futures):
+            if error := future.exception():
+                print(f'error: {futures[future]}: {error}')
+                failed += 1
+            elif future.result():
+                print(f'Wrote {futures[future]}.')
+            else:
+                print(f'Skipping puzzle write ("{futures[future]}" is unchanged).')
+
+    if failed:
+        return 1
 
     print('done.')
 
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# Generates synthetic (scaled) Advent of Code puzzle input.
+# Author: Ben Bornstein
+
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import aoc.days
+import aoc.generators
+
+
+def main ():
+    """Generates synthetic (scaled) Advent of Code puzzle input."""
+    p = argparse.ArgumentParser(description=main.__doc__)
+    p.add_argument('day'   , type=int)
+    p.add_argument('--year', type=int, default=2020)
+    p.add_argument('-s', '--scale', type=int, default=10,
+                   help='size relative to the real puzzle input')
+    p.add_argument('--seed', type=int, default=0)
+    p.add_argument('-o', '--output', type=str, metavar='filename',
+                   help='write to filename (- for stdout) instead of, e.g. '
+                        'aoc-2020-d09-x10.txt')
+
+    args = p.parse_args()
+    days = aoc.days.find([ args.year ], [ args.day ])
+
+    if len(days) == 0:
+        print(f'error: No puzzle found for {args.year}, Day {args.day}.')
+        return 2
+
+    if args.scale < 1:
+        print('error: --scale must be at least one.')
+        return 2
+
+    day      = days[0]
+    filename = args.output or aoc.generators.filename(day, args.scale, args.seed)
+
+    try:
+        content = aoc.generators.generate(day, args.scale, args.seed)
+    except LookupError as e:
+        print(f'error: {e}')
+        return 2
+
+    if filename == '-':
+        sys.stdout.write(content)
+    else:
+        with open(filename, 'wt') as output:
+            output.write(content)
+        print(f'Wrote {filename}.')
+
+
+if __name__ == '__main__':
+    sys.exit( main() )
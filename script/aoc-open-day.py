@@ -14,25 +14,24 @@ def system (cmd):
     os.system(cmd)
 
 
-def write (filename, day):
+def write (filename, year, day):
     with open(filename, 'wt') as output:
         output.write(f"""#!/usr/bin/env python3
 
-# Advent of Code 2024, Day {day} (https://adventofcode.com/2024/day/{day})
+# Advent of Code {year}, Day {day} (https://adventofcode.com/{year}/day/{day})
 # Author: Ben Bornstein
 
 
-def lines (filename, func=None):
-    \"\"\"Python iterator over lines in `filename`.  If `func` is given, it is
-    applied to each line before yielding (returning) it.
-    \"\"\"
-    with open(filename) as stream:
-        for line in stream.readlines():
-            yield func(line) if func else line
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import aoc
 
-filename = 'aoc-2024-d{day:02}.txt'
-data     = list( lines(filename) )
+
+def parse (filename):
+    \"\"\"Parses and returns the puzzle input in `filename`.\"\"\"
+    return list( aoc.lines(filename) )
 
 
 # Part 1
@@ -40,7 +39,9 @@ data     = list( lines(filename) )
 # Q:
 # A:
 
-print(f'Part 1: ')
+def part1 (data):
+    \"\"\"Returns the answer to Part 1, given the (parsed) puzzle `data`.\"\"\"
+    pass
 
 
 # Part 2
@@ -48,7 +49,17 @@ print(f'Part 1: ')
 # Q:
 # A:
 
-print(f'Part 2: ')
+def part2 (data):
+    \"\"\"Returns the answer to Part 2, given the (parsed) puzzle `data`.\"\"\"
+    pass
+
+
+if __name__ == '__main__':
+    filename = 'aoc-{year}-d{day:02}.txt'
+    data     = parse(filename)
+
+    print(f'Part 1: {{part1(data)}}.')
+    print(f'Part 2: {{part2(data)}}.')
 """)
 
 
@@ -69,7 +80,7 @@ def main ():
         print(f'Skipped creating {directory}.')
 
     if not os.path.exists(pathname):
-        write(pathname, args.day)
+        write(pathname, args.year, args.day)
         print(f'Wrote {pathname}.')
         system(f'chmod a+x {pathname}')
     else:
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# Runs all (or selected) Advent of Code puzzles in parallel.
+# Author: Ben Bornstein
+
+
+import argparse
+import concurrent.futures
+import functools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import aoc.days
+
+
+def report (result):
+    """Prints the answers and timing for a single day's `result`."""
+    print(f'{result.day}  wall {result.wall:8.3f}s  cpu {result.cpu:8.3f}s')
+
+    for part, answer in enumerate( (result.part1, result.part2), start=1 ):
+        if answer is not None:
+            answer = str(answer).replace('\n', '\n            ')
+            print(f'    Part {part}: {answer}')
+
+    for filename in result.profiles:
+        print(f'    Profile: {os.path.relpath(filename)}')
+
+    if result.error:
+        print(f'    error: {result.error}')
+
+
+def main ():
+    """Runs all (or selected) Advent of Code puzzles in parallel."""
+    p = argparse.ArgumentParser(description=main.__doc__)
+    p.add_argument('days'  , type=int, nargs='*', metavar='day')
+    p.add_argument('--year', type=int, action='append', dest='years')
+    p.add_argument('-j', '--jobs', type=int, default=os.cpu_count())
+    p.add_argument('--cache', action='store_true',
+                   help='parse inputs once and cache them (see aoc.cache)')
+    p.add_argument('--profile', action='store_true',
+                   help='write a cProfile stats file for each day')
+    p.add_argument('--trace-memory', action='store_true',
+                   help='write top allocation sites and peak RSS for each day')
+
+    args = p.parse_args()
+    days = aoc.days.find(args.years, args.days)
+
+    if args.jobs < 1:
+        print('error: --jobs must be at least one.')
+        return 2
+
+    if len(days) == 0:
+        print('error: No puzzles found.')
+        return 2
+
+    run     = functools.partial(aoc.days.run, profile=args.profile,
+                                memory=args.trace_memory, cache=args.cache)
+    tasks   = 1 if (args.profile or args.trace_memory) else None
+    wall    = time.perf_counter()
+    results = [ ]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs,
+                                                max_tasks_per_child=tasks) as pool:
+        for result in pool.map(run, days):
+            report(result)
+            results.append(result)
+
+    wall   = time.perf_counter() - wall
+    cpu    = sum(result.cpu for result in results)
+    failed = sum(1 for result in results if result.error)
+
+    print(f'\nRan {len(results)} days ({failed} failed) with {args.jobs} jobs: ', end='')
+    print(f'wall {wall:.3f}s, cpu {cpu:.3f}s.')
+
+    return 1 if failed > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit( main() )